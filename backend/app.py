@@ -107,6 +107,7 @@ def start_scraping():
         data = request.get_json() or {}
         selected_options = data.get('selected_options', [])
         selected_months = data.get('selected_months', [])  # Keep backward compatibility
+        incremental = bool(data.get('incremental', False))
         
         print("🏭 Starting scraping process...")
         print(f"📋 Received selected_options: {len(selected_options)} items")
@@ -143,6 +144,9 @@ def start_scraping():
         elif selected_months:
             task = scrape_selected_policies_task.delay(selected_months)
             message = f'Scraping task started for {len(selected_months)} selected months'
+        elif incremental:
+            task = scrape_all_policies_task.delay(incremental=True)
+            message = 'Incremental scraping task started for new or changed months'
         else:
             task = scrape_all_policies_task.delay()
             message = 'Scraping task started for all available options'
@@ -152,7 +156,8 @@ def start_scraping():
             'message': message,
             'task_id': task.id,
             'selected_options': selected_options,
-            'selected_months': selected_months
+            'selected_months': selected_months,
+            'incremental': incremental
         }), 200
         
     except Exception as e:
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Citation Parsing Benchmark
+Times the linear-time citation parser against the journal regexes it replaced, on a normal reference section and on adversarial inputs
+
+Usage:
+    python benchmark_citations.py                  # every input at the default size
+    python benchmark_citations.py --size 2000      # words/citations per input (legacy time grows much faster than the size)
+    python benchmark_citations.py policy_text.txt  # text saved from a real policy
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+
+from citation_parser import AUTHOR_YEAR_PATTERN, ET_AL_PATTERN, parse_citations
+
+# The "A and B (Year)" pattern never produced a record, but it ran on every policy
+AND_AUTHORS_PATTERN = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+and\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+\((\d{4})\)\s*[:\-]?\s*([^.\n]+)'
+
+
+def legacy_citations(text):
+    """The regex passes the parser replaced, as (author, year, title, start, end) tuples"""
+    citations = []
+    for pattern in (ET_AL_PATTERN, AUTHOR_YEAR_PATTERN):
+        for match in re.finditer(pattern, text, re.IGNORECASE):
+            citations.append((match.group(1), match.group(2), match.group(3), match.start(), match.end()))
+    for _ in re.finditer(AND_AUTHORS_PATTERN, text, re.IGNORECASE):
+        pass
+    return citations
+
+
+def reference_section(size: int, seed: int = 42) -> str:
+    """A policy-style reference list with "et al." and single-author citations"""
+    rng = random.Random(seed)
+    names = ('Smith', 'Johnson', 'Lee', 'Garcia', 'Brown', 'Nguyen', 'Patel', 'Miller', 'Davis', 'Wilson')
+    words = ('outcomes', 'of', 'surgical', 'treatment', 'in', 'adults', 'with', 'chronic', 'disease', 'randomized', 'trial')
+    lines = ['References']
+    for _ in range(size):
+        author = rng.choice(names)
+        title = ' '.join(rng.choices(words, k=8)).capitalize()
+        if rng.random() < 0.6:
+            lines.append(f"{author} et al. ({rng.randint(1990, 2024)}): {title}. J Clin Med. {rng.randint(1, 40)}:{rng.randint(100, 999)}.")
+        else:
+            lines.append(f"{author} ({rng.randint(1990, 2024)}) {title}. Ann Intern Med.")
+    return '\n'.join(lines)
+
+
+def adversarial_inputs(size: int):
+    """Inputs that make the IGNORECASE author groups backtrack"""
+    return {
+        # Every word is an author candidate and nothing ever completes a citation
+        'one long sentence': ' '.join(['Coverage'] * size) + '.',
+        # "et al" everywhere, but no year to finish the match
+        'et al without year': ' '.join(['Smith et al'] * (size // 3)) + '.',
+        # Authors followed by whitespace that never reaches "("
+        'whitespace runs': ''.join(f"Author{' ' * 40}x " for _ in range(size // 20)),
+        # Years with long author chains that fail on the title
+        'years without titles': ''.join(f"{'Word ' * 50}(2019).\n" for _ in range(size // 50)),
+    }
+
+
+def best_time(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def compare(name: str, text: str, repeat: int) -> bool:
+    legacy = legacy_citations(text)
+    parsed = [tuple(citation) for citation in parse_citations(text)]
+    if legacy != parsed:
+        print(f"❌ {name}: results differ ({len(legacy)} legacy vs {len(parsed)} parsed citations)")
+        return False
+
+    legacy_seconds = best_time(lambda: legacy_citations(text), repeat)
+    parser_seconds = best_time(lambda: parse_citations(text), repeat)
+    print(f"📄 {name}: {len(text):,} characters, {len(parsed)} citations (identical results)")
+    print(f"   journal regexes: {legacy_seconds * 1000:9.1f} ms")
+    print(f"   citation parser: {parser_seconds * 1000:9.1f} ms")
+    print(f"   speedup:         {legacy_seconds / max(parser_seconds, 1e-9):9.1f}x")
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark journal citation parsing')
+    parser.add_argument('text_file', nargs='?', help='Policy text to use instead of the generated inputs')
+    parser.add_argument('--size', type=int, default=600, help='Words or citations per generated input')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.text_file:
+        with open(args.text_file, 'r', encoding='utf-8') as f:
+            inputs = {args.text_file: f.read()}
+    else:
+        inputs = {'reference section': reference_section(args.size)}
+        inputs.update(adversarial_inputs(args.size))
+
+    ok = True
+    for name, text in inputs.items():
+        ok = compare(name, text, args.repeat) and ok
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
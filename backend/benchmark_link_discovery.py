@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Link Discovery Check
+Compares SCRAPER_LINK_MODE=fast against full on monthly PDFs: both must find the same policies
+
+Usage:
+    python benchmark_link_discovery.py                     # synthetic no-annotation page + recorded fixtures
+    python benchmark_link_discovery.py monthly/*.pdf       # specific files or directories
+    python benchmark_link_discovery.py --synthetic-only
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+import pdfplumber
+
+from benchmark_text_backends import find_pdfs
+from page_analysis import PageAnalysis, release_page
+from policy_identity import policy_link_key
+from scraper import CignaPolicyScraper
+
+# Text-only listing page: one policy URL and two "Title - (NNNN)" patterns, no link annotations
+SYNTHETIC_LINES = [
+    'Coverage Policy Updates',
+    'https://static.cigna.com/assets/chcp/pdf/coveragePolicies/medical/mm_0001_coveragepositioncriteria_x.pdf',
+    'Foo Therapy - (0002)',
+    'Bar Imaging - (0003)',
+]
+
+
+def synthetic_pdf(lines):
+    """Build a one-page PDF with the given text lines and no annotations"""
+    content = 'BT /F1 9 Tf 40 740 Td 14 TL\n' + ''.join(
+        '(' + line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)') + ') Tj T*\n' for line in lines
+    ) + 'ET'
+    objects = [
+        '<< /Type /Catalog /Pages 2 0 R >>',
+        '<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        '<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>',
+        '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+        f'<< /Length {len(content)} >>\nstream\n{content}\nendstream',
+    ]
+
+    pdf = b'%PDF-1.4\n'
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1')
+    xref = len(pdf)
+    pdf += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode('latin-1')
+    pdf += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode('latin-1')
+    pdf += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode('latin-1')
+    return pdf
+
+
+def discover(scraper, pdf_bytes, mode):
+    """Policy keys found on every page in the given link mode, with the time it took"""
+    scraper.link_mode = mode
+    keys = set()
+    start = time.perf_counter()
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            analysis = PageAnalysis(page, page_num + 1)
+            for link in scraper.extract_policy_links_from_page(analysis, 'Synthetic'):
+                keys.add(policy_link_key(link))
+            release_page(page)
+    return keys, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check fast link discovery against the full extractor set')
+    parser.add_argument('paths', nargs='*', help='Monthly PDF files or directories (default: recorded fixtures)')
+    parser.add_argument('--synthetic-only', action='store_true', help='Only check the synthetic no-annotation page')
+    args = parser.parse_args(argv)
+
+    documents = [('synthetic (no annotations)', synthetic_pdf(SYNTHETIC_LINES))]
+    if not args.synthetic_only:
+        try:
+            pdf_paths = find_pdfs(args.paths)
+        except OSError as e:
+            print(f"⚠️ Skipping fixture PDFs: {e}")
+            pdf_paths = []
+        for pdf_path in pdf_paths:
+            with open(pdf_path, 'rb') as f:
+                documents.append((os.path.basename(pdf_path), f.read()))
+
+    scraper = CignaPolicyScraper(parse_only=True)
+    print(f"📄 Comparing fast and full link discovery on {len(documents)} PDFs")
+
+    mismatches = 0
+    for name, pdf_bytes in documents:
+        try:
+            full_keys, full_seconds = discover(scraper, pdf_bytes, 'full')
+            fast_keys, fast_seconds = discover(scraper, pdf_bytes, 'fast')
+        except Exception as e:
+            print(f"  ⚠️ {name}: could not be parsed: {e}")
+            continue
+
+        if fast_keys == full_keys:
+            print(f"  ✅ {name}: {len(full_keys)} policies (full {full_seconds:.2f}s, fast {fast_seconds:.2f}s)")
+            continue
+
+        mismatches += 1
+        print(f"  ❌ {name}: fast found {len(fast_keys)}, full found {len(full_keys)}")
+        for key in sorted(full_keys - fast_keys):
+            print(f"      missing in fast: {key}")
+        for key in sorted(fast_keys - full_keys):
+            print(f"      only in fast: {key}")
+
+    if mismatches:
+        print(f"\n❌ {mismatches} PDFs differ - keep SCRAPER_LINK_MODE=full until they match")
+        return 1
+    print("\n✅ Fast and full link discovery found the same policies")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Medical Code Extraction Benchmark
+Times the single-pass code scanner against the previous nine-pass extraction and checks both give the same codes
+
+Usage:
+    python benchmark_medical_codes.py                    # synthetic 100-page policy
+    python benchmark_medical_codes.py --pages 250
+    python benchmark_medical_codes.py policy_text.txt    # text saved from a real policy
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# The nine-pass extraction never checked codes against the code sets, so compare without validation
+os.environ['SCRAPER_CODE_VALIDATION'] = 'off'
+
+from code_scanner import code_patterns
+from scraper import CignaPolicyScraper
+from text_index import TextIndex
+
+PAGE_CHARS = 3000
+
+
+def legacy_extract_medical_codes(scraper, text):
+    """The nine-pass extraction the scanner replaced: every match gets a description, then duplicates are dropped"""
+    text_index = TextIndex(text)
+    codes = []
+    for code_type, patterns in code_patterns().items():
+        for pattern in patterns:
+            for match in pattern.finditer(text):
+                code = match.group(1)
+                start = max(0, match.start() - 100)
+                end = min(len(text), match.end() + 100)
+                codes.append({
+                    'code': code,
+                    'code_type': code_type,
+                    'description': scraper.extract_code_description(text_index, code, start, end)
+                })
+
+    seen_codes = set()
+    unique_codes = []
+    for code_data in codes:
+        code_key = f"{code_data['code_type']}_{code_data['code']}"
+        if code_key not in seen_codes:
+            seen_codes.add(code_key)
+            unique_codes.append(code_data)
+    return unique_codes
+
+
+def synthetic_policy_text(pages: int, seed: int = 42) -> str:
+    """Policy-like prose with code tables, repeated codes, dates, zip codes and citations"""
+    rng = random.Random(seed)
+    words = ('coverage', 'medically', 'necessary', 'criteria', 'documentation', 'patient', 'treatment',
+             'authorization', 'individual', 'procedure', 'clinical', 'evidence', 'therapy', 'indicated')
+    cpt = [f"{rng.randint(10000, 99999)}" for _ in range(300)]
+    hcpcs = [f"{rng.choice('ABCEGJKLQ')}{rng.randint(1000, 9999)}" for _ in range(150)]
+    icd = [f"{rng.choice('CDEFGIJKMNZ')}{rng.randint(10, 99)}.{rng.randint(0, 9999)}" for _ in range(200)]
+
+    lines = []
+    while sum(len(line) + 1 for line in lines) < pages * PAGE_CHARS:
+        kind = rng.random()
+        if kind < 0.15:
+            lines.append(f"CPT: {rng.choice(cpt)} {' '.join(rng.choices(words, k=8))}")
+        elif kind < 0.25:
+            lines.append(f"{rng.choice(hcpcs)} {' '.join(rng.choices(words, k=6))}")
+        elif kind < 0.35:
+            lines.append(f"ICD-10: {rng.choice(icd)} {' '.join(rng.choices(words, k=6))}")
+        elif kind < 0.40:
+            lines.append(f"Smith J, et al. Clinical outcomes. J Med. {rng.randint(1990, 2024)};{rng.randint(1, 99)}:{rng.randint(100, 999)}.")
+        else:
+            lines.append(' '.join(rng.choices(words, k=14)).capitalize() + '.')
+    return '\n'.join(lines)
+
+
+def best_time(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark medical code extraction')
+    parser.add_argument('text_file', nargs='?', help='Policy text to use instead of synthetic text')
+    parser.add_argument('--pages', type=int, default=100, help='Synthetic policy length in pages')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.text_file:
+        with open(args.text_file, 'r', encoding='utf-8') as f:
+            text = f.read()
+    else:
+        text = synthetic_policy_text(args.pages)
+
+    scraper = CignaPolicyScraper(parse_only=True)
+    legacy = legacy_extract_medical_codes(scraper, text)
+    scanned = scraper.extract_medical_codes(text)
+    if legacy != scanned:
+        print(f"❌ Results differ: {len(legacy)} legacy codes vs {len(scanned)} scanned codes")
+        return 1
+
+    legacy_seconds = best_time(lambda: legacy_extract_medical_codes(scraper, text), args.repeat)
+    scanner_seconds = best_time(lambda: scraper.extract_medical_codes(text), args.repeat)
+
+    print(f"📄 {len(text):,} characters, {len(scanned)} unique codes (identical results)")
+    print(f"   nine-pass extraction: {legacy_seconds * 1000:8.1f} ms")
+    print(f"   single-pass scanner:  {scanner_seconds * 1000:8.1f} ms")
+    print(f"   speedup:              {legacy_seconds / scanner_seconds:8.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Text Backend Benchmark
+Compares extraction speed (chars/sec) and output parity against pdfplumber on fixture PDFs
+
+Usage:
+    python benchmark_text_backends.py                      # PDFs recorded in SCRAPER_HTTP_FIXTURES
+    python benchmark_text_backends.py policies/*.pdf       # specific files or directories
+    python benchmark_text_backends.py --backends pdfminer pdfium --repeat 3
+"""
+
+import argparse
+import difflib
+import os
+import sys
+import time
+
+from http_fixtures import FixtureArchive
+from text_backends import BACKENDS, available_backends
+
+
+def find_pdfs(paths):
+    """Collect PDF files from paths, or from the recorded fixture bodies if none are given"""
+    if not paths:
+        paths = [FixtureArchive().bodies_dir]
+
+    pdf_paths = []
+    for path in paths:
+        candidates = [os.path.join(path, name) for name in sorted(os.listdir(path))] if os.path.isdir(path) else [path]
+        for candidate in candidates:
+            # Fixture bodies have no extension, so sniff the header instead
+            with open(candidate, 'rb') as f:
+                if f.read(5) == b'%PDF-':
+                    pdf_paths.append(candidate)
+    return pdf_paths
+
+
+def parity(reference: str, text: str) -> float:
+    """Word-level similarity of two extractions, ignoring whitespace and line breaks"""
+    return difflib.SequenceMatcher(None, reference.split(), text.split(), autojunk=False).ratio()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark policy PDF text backends')
+    parser.add_argument('paths', nargs='*', help='PDF files or directories (default: recorded fixtures)')
+    parser.add_argument('--backends', nargs='+', default=None, help='Backends to compare (default: all installed)')
+    parser.add_argument('--repeat', type=int, default=1, help='Timed runs per backend and file')
+    args = parser.parse_args(argv)
+
+    names = args.backends or available_backends()
+    for name in names:
+        if name not in BACKENDS or not BACKENDS[name].is_available():
+            print(f"❌ Backend not available: {name}")
+            return 1
+
+    pdf_paths = find_pdfs(args.paths)
+    if not pdf_paths:
+        print("❌ No PDFs found - record fixtures with SCRAPER_HTTP_MODE=record or pass some files")
+        return 1
+    print(f"📄 Benchmarking {', '.join(names)} on {len(pdf_paths)} PDFs")
+
+    totals = {name: {'chars': 0, 'seconds': 0.0, 'parity': [], 'table_pages': 0, 'pages': 0} for name in names}
+    for pdf_path in pdf_paths:
+        with open(pdf_path, 'rb') as f:
+            pdf_bytes = f.read()
+
+        # pdfplumber always runs first: its output is the parity reference
+        reference = None
+        for name in ['pdfplumber'] + [n for n in names if n != 'pdfplumber']:
+            backend = BACKENDS[name]
+            try:
+                best = None
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    texts, table_pages = backend.extract(pdf_bytes)
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+            except Exception as e:
+                print(f"  ⚠️ {name} failed on {os.path.basename(pdf_path)}: {e}")
+                continue
+
+            text = '\n'.join(texts)
+            if name == 'pdfplumber':
+                reference = text
+            if name not in totals:
+                continue
+
+            stats = totals[name]
+            stats['chars'] += len(text)
+            stats['seconds'] += best
+            stats['pages'] += len(texts)
+            stats['table_pages'] += len(texts) if table_pages is None else len(table_pages)
+            if reference is not None:
+                stats['parity'].append(parity(reference, text))
+
+    print(f"\n{'backend':<12}{'pages':>8}{'chars/sec':>14}{'parity':>10}{'table pages':>14}")
+    for name, stats in totals.items():
+        chars_per_sec = stats['chars'] / stats['seconds'] if stats['seconds'] else 0.0
+        mean_parity = sum(stats['parity']) / len(stats['parity']) if stats['parity'] else 0.0
+        print(f"{name:<12}{stats['pages']:>8}{chars_per_sec:>14,.0f}{mean_parity:>10.3f}{stats['table_pages']:>14}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Change Tracker for Incremental Scraping
+Fingerprints the listing page and monthly PDFs so only new or changed months are re-processed
+"""
+
+import hashlib
+import os
+import time
+from typing import Dict, List, Optional
+import logging
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+
+def fingerprint_bytes(content: bytes) -> str:
+    """Fingerprint a response body"""
+    return f"sha256:{hashlib.sha256(content).hexdigest()}"
+
+
+def fingerprint_headers(headers) -> Optional[str]:
+    """Fingerprint a response from its validators, or None if the server sent none"""
+    etag = headers.get('ETag')
+    last_modified = headers.get('Last-Modified')
+    if not etag and not last_modified:
+        return None
+    return f"etag:{etag or ''}|modified:{last_modified or ''}|length:{headers.get('Content-Length', '')}"
+
+
+class ScrapeStateStore:
+    """Listing and per-month fingerprints kept in Redis between runs"""
+
+    def __init__(self, redis_client=None):
+        self.redis_client = redis_client or redis.Redis.from_url(
+            os.getenv('SCRAPER_STATE_REDIS_URL', 'redis://localhost:6379/1'),
+            decode_responses=True
+        )
+        self.key_prefix = 'scrape_state:'
+        self.recheck_seconds = float(os.getenv('SCRAPER_INCREMENTAL_RECHECK_HOURS', '24')) * 3600
+
+    def _key(self, name: str) -> str:
+        return f"{self.key_prefix}{name}"
+
+    def get_listing_fingerprint(self) -> Optional[str]:
+        return self.redis_client.get(self._key('listing'))
+
+    def set_listing_fingerprint(self, fingerprint: str):
+        self.redis_client.set(self._key('listing'), fingerprint)
+
+    def months_checked_recently(self) -> bool:
+        """True if every month was re-fingerprinted within the recheck window"""
+        last_check = self.redis_client.get(self._key('months_checked_at'))
+        return bool(last_check) and time.time() - float(last_check) < self.recheck_seconds
+
+    def mark_months_checked(self):
+        self.redis_client.set(self._key('months_checked_at'), str(time.time()))
+
+    def get_month_fingerprints(self, urls: List[str]) -> Dict[str, Optional[str]]:
+        if not urls:
+            return {}
+        values = self.redis_client.hmget(self._key('months'), urls)
+        return dict(zip(urls, values))
+
+    def set_pending_listing(self, fingerprint: str, urls: List[str]):
+        """Hold a listing fingerprint until every month dispatched for it has been processed"""
+        if not urls:
+            self.set_listing_fingerprint(fingerprint)
+            return
+        pipeline = self.redis_client.pipeline()
+        pipeline.delete(self._key('pending_months'))
+        pipeline.sadd(self._key('pending_months'), *urls)
+        pipeline.set(self._key('pending_listing'), fingerprint)
+        pipeline.execute()
+
+    def mark_month_processed(self, url: str, fingerprint: str):
+        """Record a month only after it was processed, so failed months are retried
+
+        The last pending month to be recorded also records the listing
+        fingerprint; while any month is missing, runs re-check every month.
+        """
+        pipeline = self.redis_client.pipeline()
+        pipeline.hset(self._key('months'), url, fingerprint)
+        pipeline.srem(self._key('pending_months'), url)
+        pipeline.scard(self._key('pending_months'))
+        pipeline.get(self._key('pending_listing'))
+        _, _, pending, listing = pipeline.execute()
+        logger.info(f"🗂️ Recorded fingerprint for {url}")
+
+        if not pending and listing:
+            self.set_listing_fingerprint(listing)
+            self.redis_client.delete(self._key('pending_listing'))
+            logger.info("🗂️ Every changed month processed, recorded listing fingerprint")
+
+    def forget_month(self, url: str):
+        self.redis_client.hdel(self._key('months'), url)
+
+
+_state_store: Optional[ScrapeStateStore] = None
+
+
+def get_scrape_state() -> ScrapeStateStore:
+    """Return the shared scrape state store"""
+    global _state_store
+    if _state_store is None:
+        _state_store = ScrapeStateStore()
+    return _state_store
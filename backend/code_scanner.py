@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Single-pass Medical Code Scanner
+Finds CPT, HCPCS and ICD-10 candidates in policy text with one compiled scan instead of nine regex passes
+"""
+
+import re
+import time
+from collections import Counter
+from typing import Dict, Iterator, List, NamedTuple
+
+from extraction_rules import get_extraction_rules
+
+CODE_TYPES = ('CPT', 'HCPCS', 'ICD-10')
+
+# The candidate patterns are the 'medical_codes' rule set in extraction_rules.json.
+# Every code contains a run of digits, and the code starts at the beginning
+# of that run (code_start 'digits') or one letter before it ('letter'). The
+# scanner visits each digit run once and only tries the rules that fit its
+# length; keyword rules are matched at the keyword that has to end right
+# before the code, once separators ([:\s]*) are skipped.
+CODE_STARTS = ('digits', 'letter')
+
+
+class _ScanPlan(NamedTuple):
+    scanner: re.Pattern
+    # (type rank, rule rank within its type, code type, rule, minimum digit run, keyword or None)
+    digit_start: list
+    letter_start: list
+
+
+_plan = None
+_plan_rules = None
+
+
+def scan_plan() -> _ScanPlan:
+    """Anchor tables for this process's medical_codes rules, built and checked once
+
+    Raises ValueError if a rule's scanner fields are malformed, or if on one
+    of its examples the anchored scan doesn't find exactly what the rule's
+    own finditer() finds (a wrong code_start, min_digits or keyword).
+    """
+    global _plan, _plan_rules
+    rules = get_extraction_rules()
+    if _plan_rules is not rules:
+        digit_start, letter_start = [], []
+        ranks: Dict[str, int] = {}
+        for rule in rules.rule_set('medical_codes'):
+            _check_fields(rule)
+            code_type = rule['code_type']
+            ranks[code_type] = ranks.get(code_type, -1) + 1
+            entry = (CODE_TYPES.index(code_type), ranks[code_type], code_type, rule, rule['min_digits'], rule['keyword'])
+            (digit_start if rule['code_start'] == 'digits' else letter_start).append(entry)
+        min_digits = min(entry[4] for entry in digit_start + letter_start)
+        plan = _ScanPlan(re.compile(r'\d{%d,}' % min_digits), digit_start, letter_start)
+        for entry in digit_start + letter_start:
+            _check_examples(plan, entry)
+        _plan, _plan_rules = plan, rules
+    return _plan
+
+
+def _check_fields(rule):
+    name = f"medical_codes rule {rule.name}"
+    if rule.params.get('code_type') not in CODE_TYPES:
+        raise ValueError(f"{name}: code_type must be one of {CODE_TYPES}")
+    if rule.params.get('code_start') not in CODE_STARTS:
+        raise ValueError(f"{name}: code_start must be one of {CODE_STARTS}")
+    min_digits = rule.params.get('min_digits')
+    if not isinstance(min_digits, int) or min_digits < 1:
+        raise ValueError(f"{name}: min_digits must be a positive integer")
+    keyword = rule.params.get('keyword', ...)
+    if keyword is ... or not (keyword is None or (isinstance(keyword, str) and keyword)):
+        raise ValueError(f"{name}: keyword must be a non-empty string or null")
+    if rule.pattern.groups < 1:
+        raise ValueError(f"{name}: the pattern needs a group for the code")
+    if not rule.params.get('examples'):
+        raise ValueError(f"{name}: needs examples the scanner is checked against")
+
+
+def _check_examples(plan: _ScanPlan, entry):
+    rule = entry[3]
+    single = _ScanPlan(plan.scanner, [entry] if entry in plan.digit_start else [], [entry] if entry in plan.letter_start else [])
+    for example in rule['examples']:
+        expected = {(match.start(1), match.group(1)) for match in rule.pattern.finditer(example)}
+        if not expected:
+            raise ValueError(f"medical_codes rule {rule.name} doesn't match its example {example!r}")
+        scanned = {(match.start(1), match.group(1)) for *_, match in _anchored_matches(example, single)}
+        if scanned != expected:
+            raise ValueError(f"medical_codes rule {rule.name}: scanning {example!r} found {sorted(scanned)} "
+                             f"but the pattern finds {sorted(expected)}; check code_start, min_digits and keyword")
+
+
+def code_patterns() -> Dict[str, List[re.Pattern]]:
+    """Compiled medical_codes rules by code type, in rule order"""
+    patterns: Dict[str, List[re.Pattern]] = {}
+    for rule in get_extraction_rules().rule_set('medical_codes'):
+        patterns.setdefault(rule['code_type'], []).append(rule.pattern)
+    return patterns
+
+
+def _separator_start(text: str, position: int) -> int:
+    """Start of the run of ':' and whitespace that ends at position"""
+    while position > 0 and (text[position - 1] == ':' or text[position - 1].isspace()):
+        position -= 1
+    return position
+
+
+class CodeMatch(NamedTuple):
+    code: str
+    code_type: str
+    start: int  # span of the whole pattern match, keyword included
+    end: int
+
+
+def _anchored_matches(text: str, plan: _ScanPlan) -> Iterator[tuple]:
+    """(type rank, rule rank, code type, rule, position, match) for every rule match anchored at a code start"""
+    for run in plan.scanner.finditer(text):
+        digits_start = run.start()
+        run_length = run.end() - digits_start
+
+        candidates = [(digits_start, plan.digit_start)]
+        if digits_start > 0 and text[digits_start - 1].isalpha():
+            candidates.append((digits_start - 1, plan.letter_start))
+
+        for code_start, entries in candidates:
+            keyword_end = None
+            for type_rank, rule_rank, code_type, rule, min_run, keyword in entries:
+                if run_length < min_run:
+                    continue
+                if keyword is None:
+                    position = code_start
+                else:
+                    if keyword_end is None:
+                        keyword_end = _separator_start(text, code_start)
+                    position = keyword_end - len(keyword)
+                    if position < 0:
+                        continue
+
+                match = rule.pattern.match(text, position)
+                if match is None or match.start(1) != code_start:
+                    continue
+                yield type_rank, rule_rank, code_type, rule, position, match
+
+
+def scan_medical_codes(text: str) -> List[CodeMatch]:
+    """Unique (code type, code) candidates in the order the per-pattern passes reported them
+
+    A code found by several patterns keeps the occurrence from the earliest
+    pattern of its type (and, within a pattern, the first in the text), so
+    results and descriptions are the same as running each pattern in turn
+    and de-duplicating afterwards.
+    """
+    started = time.perf_counter()
+    plan = scan_plan()
+    hits = Counter()
+    best = {}
+    for type_rank, rule_rank, code_type, rule, position, match in _anchored_matches(text, plan):
+        hits[rule.name] += 1
+        key = (code_type, match.group(1))
+        rank = (type_rank, rule_rank, position)
+        if key not in best or rank < best[key][0]:
+            best[key] = (rank, CodeMatch(match.group(1), code_type, match.start(), match.end()))
+
+    # The rules share one scan, so its time is recorded for the rule set and only hits per rule
+    for entry in plan.digit_start + plan.letter_start:
+        entry[3].record(hits[entry[3].name], 0.0)
+    get_extraction_rules().record_rule_set('medical_codes', sum(hits.values()), time.perf_counter() - started)
+
+    return [found for _, found in sorted(best.values(), key=lambda item: item[0])]
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Local Medical Code-Set Index
+Validates CPT, HCPCS and ICD-10-CM candidates against code lists loaded from disk, so zip codes, years and page numbers aren't saved as codes
+
+Code-set files live in SCRAPER_CODE_SET_DIR, one code per line (anything after
+the first whitespace is ignored, '#' starts a comment, ICD-10 dots optional):
+    cpt.txt        5-digit CPT codes (AMA-licensed, not shipped)
+    hcpcs.txt      HCPCS Level II codes, e.g. J1234
+    icd10cm.txt    ICD-10-CM codes, e.g. E11.9 or E119 (the CMS code file format)
+A missing file means that code type isn't validated.
+"""
+
+import hashlib
+import os
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+VALIDATION_MODES = ('drop', 'flag', 'off')
+
+DEFAULT_CODE_SET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'code_sets')
+
+CODE_SET_FILES = {
+    'CPT': 'cpt.txt',
+    'HCPCS': 'hcpcs.txt',
+    'ICD-10': 'icd10cm.txt',
+}
+
+# ICD-10-CM codes are 3-7 characters once the dot is removed. Each character
+# is a base-37 digit (0 = past the end of the code), so a code packs into one
+# int64 and every code in a category sorts between the category's lowest and
+# highest completion.
+_ICD_MAX_LENGTH = 7
+_ICD_DIGITS = {char: value for value, char in enumerate('0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ', start=1)}
+_ICD_BASE = 37
+
+
+def _encode_icd(code: str, fill: int = 0) -> Optional[int]:
+    if not 3 <= len(code) <= _ICD_MAX_LENGTH or not 'A' <= code[0] <= 'Z':
+        return None
+    value = 0
+    for char in code:
+        digit = _ICD_DIGITS.get(char)
+        if digit is None:
+            return None
+        value = value * _ICD_BASE + digit
+    for _ in range(_ICD_MAX_LENGTH - len(code)):
+        value = value * _ICD_BASE + fill
+    return value
+
+
+def _bit_index(code: str, code_type: str) -> Optional[int]:
+    """Position of a CPT (00000-99999) or HCPCS (A0000-Z9999) code in its bitset"""
+    if code_type == 'CPT':
+        return int(code) if len(code) == 5 and code.isdigit() else None
+    if len(code) == 5 and 'A' <= code[0] <= 'Z' and code[1:].isdigit():
+        return (ord(code[0]) - ord('A')) * 10000 + int(code[1:])
+    return None
+
+
+class CodeSets:
+    """Membership index over the local code-set files
+
+    CPT and HCPCS are bitsets over their whole code space (12.5 KB and 32.5 KB);
+    ICD-10-CM is a sorted int64 array searched with bisect, which also answers
+    "is this a valid category" for codes quoted without all their characters.
+    """
+
+    def __init__(self, directory: Optional[str] = None, mode: Optional[str] = None):
+        self.directory = directory or os.getenv('SCRAPER_CODE_SET_DIR', DEFAULT_CODE_SET_DIR)
+        self.mode = (mode or os.getenv('SCRAPER_CODE_VALIDATION', 'drop')).lower()
+        if self.mode not in VALIDATION_MODES:
+            raise ValueError(f"Unknown SCRAPER_CODE_VALIDATION: {self.mode}")
+
+        self._bitsets: Dict[str, bytearray] = {}
+        self._icd10: Optional[array] = None
+        self.sizes: Dict[str, int] = {}
+        digest = hashlib.sha256()
+        if self.mode != 'off':
+            for code_type, filename in CODE_SET_FILES.items():
+                path = os.path.join(self.directory, filename)
+                if not os.path.exists(path):
+                    continue
+                with open(path, 'rb') as f:
+                    content = f.read()
+                digest.update(code_type.encode() + b'\0' + content)
+                self._load(code_type, content.decode('utf-8', errors='replace'))
+            if self.sizes:
+                logger.info(f"📚 Loaded code sets from {self.directory}: {self.sizes}")
+            else:
+                logger.info(f"📚 No code sets in {self.directory}; medical codes are not validated")
+        # Identifies the loaded code sets, so cached analyses made with others aren't reused
+        self.version = f"{self.mode}:{digest.hexdigest()[:12]}" if self.sizes else 'none'
+
+        self._lock = threading.Lock()
+        self._counters = {'checked': 0, 'rejected': 0, 'unchecked': 0}
+
+    def _load(self, code_type: str, content: str):
+        codes = []
+        for line in content.splitlines():
+            token = line.split('#', 1)[0].strip().split(maxsplit=1)
+            if token:
+                codes.append(token[0].upper().replace('.', ''))
+
+        if code_type == 'ICD-10':
+            encoded = {value for value in map(_encode_icd, codes) if value is not None}
+            self._icd10 = array('q', sorted(encoded))
+            self.sizes[code_type] = len(self._icd10)
+            return
+
+        bitset = bytearray(100000 // 8 if code_type == 'CPT' else 260000 // 8)
+        count = 0
+        for code in codes:
+            index = _bit_index(code, code_type)
+            if index is not None and not bitset[index >> 3] & (1 << (index & 7)):
+                bitset[index >> 3] |= 1 << (index & 7)
+                count += 1
+        self._bitsets[code_type] = bitset
+        self.sizes[code_type] = count
+
+    def covers(self, code_type: str) -> bool:
+        """Whether a code set is loaded for code_type"""
+        return code_type in self.sizes
+
+    def contains(self, code: str, code_type: str) -> Optional[bool]:
+        """Whether code is a known code (or, for ICD-10, category); None if code_type has no code set"""
+        if not self.covers(code_type):
+            return None
+        code = code.upper()
+        if code_type == 'ICD-10':
+            code = code.replace('.', '')
+            low = _encode_icd(code)
+            if low is None:
+                return False
+            position = bisect_left(self._icd10, low)
+            return position < len(self._icd10) and self._icd10[position] <= _encode_icd(code, fill=_ICD_BASE - 1)
+
+        index = _bit_index(code, code_type)
+        if index is None:
+            return False
+        return bool(self._bitsets[code_type][index >> 3] & (1 << (index & 7)))
+
+    def validate(self, code: str, code_type: str) -> Optional[bool]:
+        """contains(), counted in stats(); always None when validation is off"""
+        if self.mode == 'off':
+            return None
+        valid = self.contains(code, code_type)
+        with self._lock:
+            if valid is None:
+                self._counters['unchecked'] += 1
+            else:
+                self._counters['checked'] += 1
+                if not valid:
+                    self._counters['rejected'] += 1
+        return valid
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return dict(self._counters, mode=self.mode, code_sets=dict(self.sizes))
+
+
+_code_sets: Optional[CodeSets] = None
+_code_sets_pid: Optional[int] = None
+
+
+def get_code_sets() -> CodeSets:
+    """Return the code-set index for the current process, loading the files on first use"""
+    global _code_sets, _code_sets_pid
+    pid = os.getpid()
+    if _code_sets is None or _code_sets_pid != pid:
+        _code_sets = CodeSets()
+        _code_sets_pid = pid
+    return _code_sets
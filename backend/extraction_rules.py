@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Extraction Rules Registry
+Loads the regex rules used by the policy extractors from extraction_rules.json, compiles them once per process and keeps per-rule hit counts and match time
+
+Usage:
+    python extraction_rules.py            # validate the rules file (scanner rules against their examples) and list its rule sets
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'extraction_rules.json')
+
+
+def _compile_flags(flags: str) -> int:
+    value = 0
+    for name in filter(None, (flag.strip() for flag in flags.split('|'))):
+        flag = getattr(re.RegexFlag, name.upper(), None)
+        if flag is None:
+            raise ValueError(f"Unknown regex flag: {name}")
+        value |= flag
+    return value
+
+
+class Rule:
+    """One compiled pattern plus the rule's extra fields (document_type, code_type, ...)"""
+
+    def __init__(self, rule_set: str, config: Dict):
+        self.rule_set = rule_set
+        self.name = config['name']
+        self.params = {key: value for key, value in config.items() if key not in ('name', 'pattern', 'flags')}
+        try:
+            self.pattern = re.compile(config['pattern'], _compile_flags(config.get('flags', '')))
+        except (re.error, ValueError) as e:
+            raise ValueError(f"Invalid extraction rule {rule_set}.{self.name}: {e}") from e
+
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hits = 0
+        self.seconds = 0.0
+
+    def __getitem__(self, key):
+        return self.params[key]
+
+    def record(self, hits: int, seconds: float, calls: int = 1):
+        with self._lock:
+            self.calls += calls
+            self.hits += hits
+            self.seconds += seconds
+
+    def finditer(self, text: str) -> List[re.Match]:
+        """All matches in text; only the matching itself is timed, not what the caller does with them"""
+        start = time.perf_counter()
+        matches = list(self.pattern.finditer(text))
+        self.record(len(matches), time.perf_counter() - start)
+        return matches
+
+    def search(self, text: str) -> Optional[re.Match]:
+        start = time.perf_counter()
+        match = self.pattern.search(text)
+        self.record(1 if match else 0, time.perf_counter() - start)
+        return match
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'rule': f"{self.rule_set}.{self.name}",
+                'calls': self.calls,
+                'hits': self.hits,
+                'ms': round(self.seconds * 1000, 3),
+            }
+
+
+class ExtractionRules:
+    """Named, ordered rule sets compiled from the rules file
+
+    Environment:
+        SCRAPER_EXTRACTION_RULES    path of the rules file (default: extraction_rules.json next to this module)
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.getenv('SCRAPER_EXTRACTION_RULES', DEFAULT_RULES_FILE)
+        with open(self.path, 'rb') as f:
+            content = f.read()
+        # Identifies the rules, so analyses made with other rules aren't reused from the parsed cache
+        self.version = hashlib.sha256(content).hexdigest()[:12]
+
+        config = json.loads(content)
+        self._rule_sets: Dict[str, List[Rule]] = {}
+        for name, rule_set in config['rule_sets'].items():
+            rules = [Rule(name, rule) for rule in rule_set['rules']]
+            if len({rule.name for rule in rules}) != len(rules):
+                raise ValueError(f"Duplicate rule names in rule set {name}")
+            self._rule_sets[name] = rules
+        # Rule sets matched by one shared scan (medical_codes) are timed as a whole: [calls, hits, seconds]
+        self._scans: Dict[str, List] = {}
+        self._lock = threading.Lock()
+        logger.info(f"📐 Compiled {sum(len(rules) for rules in self._rule_sets.values())} extraction rules from {self.path}")
+
+    def rule_set(self, name: str) -> List[Rule]:
+        try:
+            return self._rule_sets[name]
+        except KeyError:
+            raise KeyError(f"No rule set {name!r} in {self.path}") from None
+
+    def rule_sets(self) -> Dict[str, List[Rule]]:
+        return dict(self._rule_sets)
+
+    def record_rule_set(self, name: str, hits: int, seconds: float):
+        """Count one scan that matched a whole rule set at once"""
+        with self._lock:
+            counters = self._scans.setdefault(name, [0, 0, 0.0])
+            counters[0] += 1
+            counters[1] += hits
+            counters[2] += seconds
+
+    def stats(self) -> List[Dict]:
+        """Per-rule counters plus one '<rule set>.*' entry per shared scan, most expensive first"""
+        rules = [rule.stats() for rules in self._rule_sets.values() for rule in rules]
+        with self._lock:
+            rules.extend({'rule': f"{name}.*", 'calls': calls, 'hits': hits, 'ms': round(seconds * 1000, 3)}
+                         for name, (calls, hits, seconds) in self._scans.items())
+        return sorted(rules, key=lambda rule: rule['ms'], reverse=True)
+
+
+_rules: Optional[ExtractionRules] = None
+_rules_pid: Optional[int] = None
+
+
+def get_extraction_rules() -> ExtractionRules:
+    """Return the extraction rules for the current process, compiling them on first use"""
+    global _rules, _rules_pid
+    pid = os.getpid()
+    if _rules is None or _rules_pid != pid:
+        _rules = ExtractionRules()
+        _rules_pid = pid
+    return _rules
+
+
+def main():
+    from code_scanner import scan_plan
+
+    rules = get_extraction_rules()
+    scan_plan()
+    print(f"📐 {rules.path} (version {rules.version})")
+    for name, rule_set in rules.rule_sets().items():
+        print(f"   {name}: {', '.join(rule.name for rule in rule_set)}")
+    return 0
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
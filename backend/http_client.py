@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Pooled HTTP Client for Cigna Policy Scraper
+One keep-alive session per worker process with retry/backoff and connection reuse stats
+"""
+
+import os
+import tempfile
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_fixtures import FixtureMode
+from rate_limiter import get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (compatible; CignaPolicyScraper/1.0)'
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Retried by request() itself, so every attempt takes a rate limiter token
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+RETRY_METHODS = frozenset(['GET', 'HEAD'])
+MAX_BACKOFF_SECONDS = 120
+
+
+class PooledHTTPClient:
+    """requests.Session wrapper shared by every fetch in a worker process"""
+
+    def __init__(self,
+                 pool_connections: Optional[int] = None,
+                 pool_maxsize: Optional[int] = None,
+                 max_retries: Optional[int] = None,
+                 backoff_factor: Optional[float] = None,
+                 timeout: Optional[float] = None,
+                 user_agent: Optional[str] = None,
+                 rate_limiter=None,
+                 fixtures: Optional[FixtureMode] = None):
+        self.pool_connections = pool_connections or int(os.getenv('SCRAPER_POOL_CONNECTIONS', '4'))
+        self.pool_maxsize = pool_maxsize or int(os.getenv('SCRAPER_POOL_MAXSIZE', '16'))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv('SCRAPER_MAX_RETRIES', '3'))
+        self.backoff_factor = backoff_factor if backoff_factor is not None else float(os.getenv('SCRAPER_BACKOFF_FACTOR', '0.5'))
+        self.timeout = timeout or float(os.getenv('SCRAPER_TIMEOUT', '30'))
+        self.user_agent = user_agent or os.getenv('SCRAPER_USER_AGENT') or DEFAULT_USER_AGENT
+        self.spool_max_bytes = int(os.getenv('SCRAPER_SPOOL_MAX_MB', '8')) * 1024 * 1024
+        # Shared per-host token buckets so all workers together stay under the upstream limit
+        self.rate_limiter = rate_limiter
+        # Record/replay of responses for offline, repeatable runs (SCRAPER_HTTP_MODE)
+        self.fixtures = fixtures or FixtureMode()
+
+        self.session = self._build_session()
+        self._lock = threading.Lock()
+        self._counters = {
+            'requests': 0,
+            'errors': 0,
+            'retries': 0,
+            'bytes_received': 0,
+            'request_seconds': 0.0,
+        }
+
+    def _build_session(self) -> requests.Session:
+        """Create a session whose adapters keep connections alive
+
+        The adapters don't retry: retries happen in request(), after a fresh
+        rate limiter token, so throttled responses aren't answered with bursts.
+        """
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=0,
+        )
+
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({'User-Agent': self.user_agent})
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the pooled session"""
+        kwargs.setdefault('timeout', self.timeout)
+        recorded_url = url
+
+        if self.fixtures.replaying:
+            if not self.fixtures.replay_server:
+                return self._replay(method, url, kwargs.get('headers'))
+            url = self.fixtures.server_url(url)
+        elif self.fixtures.recording:
+            # Always capture full bodies, never a 304 for a copy we already hold
+            kwargs['headers'] = {
+                name: value for name, value in (kwargs.get('headers') or {}).items()
+                if name.lower() not in ('if-none-match', 'if-modified-since')
+            }
+
+        attempt = 0
+        while True:
+            if self.rate_limiter and not self.fixtures.replaying:
+                self.rate_limiter.acquire(url)
+
+            start_time = time.time()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._count_attempt(start_time, error=True)
+                if method.upper() not in RETRY_METHODS or attempt >= self.max_retries:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.info(f"🔁 Retrying {url} in {delay:.1f}s after {type(e).__name__}")
+            except Exception:
+                self._count_attempt(start_time, error=True)
+                raise
+            else:
+                if (response.status_code not in RETRY_STATUSES or method.upper() not in RETRY_METHODS
+                        or attempt >= self.max_retries):
+                    break
+                self._count_attempt(start_time)
+                delay = self._retry_delay(attempt, response)
+                logger.info(f"🔁 Retrying {url} in {delay:.1f}s after HTTP {response.status_code}")
+                response.close()
+
+            attempt += 1
+            with self._lock:
+                self._counters['retries'] += 1
+            time.sleep(delay)
+
+        try:
+            if self.fixtures.recording:
+                self.fixtures.archive.save(method, recorded_url, response)
+        except Exception:
+            self._count_attempt(start_time, error=True)
+            raise
+
+        self._count_attempt(start_time)
+        if not kwargs.get('stream'):
+            with self._lock:
+                self._counters['bytes_received'] += len(response.content)
+        return response
+
+    def _count_attempt(self, start_time: float, error: bool = False):
+        with self._lock:
+            self._counters['requests'] += 1
+            self._counters['request_seconds'] += time.time() - start_time
+            if error:
+                self._counters['errors'] += 1
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Seconds before the next attempt: the server's Retry-After if it sent one, else exponential backoff"""
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                try:
+                    return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+        return min(MAX_BACKOFF_SECONDS, self.backoff_factor * (2 ** attempt))
+
+    def _replay(self, method: str, url: str, headers: Optional[Dict]) -> requests.Response:
+        """Answer a request from the fixture archive without touching the network"""
+        start_time = time.time()
+        response = self.fixtures.archive.build_response(method, url, headers)
+        with self._lock:
+            self._counters['requests'] += 1
+            self._counters['request_seconds'] += time.time() - start_time
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('allow_redirects', True)
+        return self.request('HEAD', url, **kwargs)
+
+    def copy_body(self, response: requests.Response, fileobj, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> int:
+        """Stream a response body into fileobj chunk by chunk and return the byte count"""
+        total_bytes = 0
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if chunk:
+                fileobj.write(chunk)
+                total_bytes += len(chunk)
+
+        with self._lock:
+            self._counters['bytes_received'] += total_bytes
+        return total_bytes
+
+    def download(self, url: str, **kwargs):
+        """Download a body into a SpooledTemporaryFile instead of holding response.content
+
+        Bodies up to SCRAPER_SPOOL_MAX_MB stay in memory, larger ones roll over to
+        a temporary file on disk. The returned file is rewound; the caller closes it.
+        """
+        response = self.get(url, stream=True, **kwargs)
+        try:
+            response.raise_for_status()
+            spool = tempfile.SpooledTemporaryFile(max_size=self.spool_max_bytes)
+            self.copy_body(response, spool)
+        finally:
+            response.close()
+
+        spool.seek(0)
+        return spool
+
+    def stats(self) -> Dict:
+        """Request counters plus connection reuse taken from the urllib3 pools"""
+        connections_opened = 0
+        pooled_requests = 0
+        for adapter in self.session.adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                connections_opened += pool.num_connections
+                pooled_requests += pool.num_requests
+
+        with self._lock:
+            counters = dict(self._counters)
+
+        reused = max(0, pooled_requests - connections_opened)
+        counters.update({
+            'connections_opened': connections_opened,
+            'connections_reused': reused,
+            'reuse_ratio': round(reused / pooled_requests, 3) if pooled_requests else 0.0,
+            'avg_request_seconds': round(counters['request_seconds'] / counters['requests'], 3) if counters['requests'] else 0.0,
+            'pid': os.getpid(),
+        })
+        if self.rate_limiter:
+            counters['rate_limiter'] = self.rate_limiter.stats()
+        return counters
+
+    def close(self):
+        self.session.close()
+
+
+# One client per worker process - rebuilt after fork so sockets are never shared
+_client: Optional[PooledHTTPClient] = None
+_client_pid: Optional[int] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> PooledHTTPClient:
+    """Return the pooled client for the current process"""
+    global _client, _client_pid
+    pid = os.getpid()
+    if _client is None or _client_pid != pid:
+        with _client_lock:
+            if _client is None or _client_pid != pid:
+                _client = PooledHTTPClient(rate_limiter=get_rate_limiter())
+                _client_pid = pid
+                logger.info(f"🌐 Created pooled HTTP client for process {pid}")
+    return _client
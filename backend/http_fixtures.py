@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+HTTP Record/Replay Fixtures for Cigna Policy Scraper
+Captures every response the scraper fetches so runs and benchmarks can be repeated offline
+
+Usage:
+    SCRAPER_HTTP_MODE=record python scraper.py     # capture listing, monthly and policy PDFs
+    SCRAPER_HTTP_MODE=replay python scraper.py     # serve them back without touching the network
+    python http_fixtures.py serve --port 8899      # stand-in server for the recorded archive
+    python http_fixtures.py info                   # list what an archive contains
+
+The archive location is SCRAPER_HTTP_FIXTURES (default backend/fixtures/http).
+Setting SCRAPER_REPLAY_SERVER=http://localhost:8899 in replay mode sends requests
+to the stand-in server over real sockets instead of answering them in-process.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+import logging
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARCHIVE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'http')
+
+# Response headers worth keeping - the rest vary per request and only add noise
+RECORDED_HEADERS = ('Content-Type', 'Content-Length', 'ETag', 'Last-Modified', 'Accept-Ranges')
+
+HTTP_REASONS = {200: 'OK', 206: 'Partial Content', 304: 'Not Modified', 404: 'Not Found'}
+
+
+class FixtureArchive:
+    """Directory of recorded responses: one JSON file per request plus content-addressed bodies
+
+    Every entry lives in its own file, so several Celery workers can record into
+    the same archive at once without sharing an index.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.getenv('SCRAPER_HTTP_FIXTURES', DEFAULT_ARCHIVE_DIR)
+        self.entries_dir = os.path.join(self.path, 'entries')
+        self.bodies_dir = os.path.join(self.path, 'bodies')
+        os.makedirs(self.entries_dir, exist_ok=True)
+        os.makedirs(self.bodies_dir, exist_ok=True)
+
+    @staticmethod
+    def _entry_name(method: str, url: str) -> str:
+        return hashlib.sha1(f"{method.upper()} {url}".encode('utf-8')).hexdigest()
+
+    def _write_atomic(self, path: str, data: bytes):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def save(self, method: str, url: str, response: requests.Response):
+        """Record a fully read response"""
+        body = response.content or b''
+        body_sha256 = hashlib.sha256(body).hexdigest()
+        body_path = os.path.join(self.bodies_dir, body_sha256)
+        if not os.path.exists(body_path):
+            self._write_atomic(body_path, body)
+
+        entry = {
+            'method': method.upper(),
+            'url': url,
+            'status': response.status_code,
+            'headers': {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+            'body_sha256': body_sha256,
+            'body_size': len(body),
+        }
+        entry_path = os.path.join(self.entries_dir, f"{self._entry_name(method, url)}.json")
+        self._write_atomic(entry_path, json.dumps(entry, indent=2).encode('utf-8'))
+
+    def lookup(self, method: str, url: str) -> Optional[Dict]:
+        """Find the recorded entry for a request; HEAD falls back to the recorded GET"""
+        for candidate in (method.upper(), 'GET'):
+            entry_path = os.path.join(self.entries_dir, f"{self._entry_name(candidate, url)}.json")
+            if os.path.exists(entry_path):
+                with open(entry_path, 'r') as f:
+                    return json.load(f)
+        return None
+
+    def load_body(self, entry: Dict) -> bytes:
+        with open(os.path.join(self.bodies_dir, entry['body_sha256']), 'rb') as f:
+            return f.read()
+
+    def iter_entries(self):
+        for name in sorted(os.listdir(self.entries_dir)):
+            if name.endswith('.json'):
+                with open(os.path.join(self.entries_dir, name), 'r') as f:
+                    yield json.load(f)
+
+    def replay(self, method: str, url: str, request_headers: Optional[Dict] = None):
+        """Return (status, headers, body) for a request, honouring conditional headers"""
+        entry = self.lookup(method, url)
+        if entry is None:
+            logger.warning(f"⚠️ No recorded response for {method} {url}")
+            return 404, {}, b''
+
+        headers = dict(entry['headers'])
+        request_headers = CaseInsensitiveDict(request_headers or {})
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if entry['status'] == 200 and (
+            (etag and request_headers.get('If-None-Match') == etag) or
+            (last_modified and request_headers.get('If-Modified-Since') == last_modified)
+        ):
+            return 304, headers, b''
+
+        body = b'' if method.upper() == 'HEAD' else self.load_body(entry)
+        return entry['status'], headers, body
+
+    def build_response(self, method: str, url: str, request_headers: Optional[Dict] = None) -> requests.Response:
+        """Build a requests.Response from the archive that behaves like a fully read live one"""
+        status, headers, body = self.replay(method, url, request_headers)
+
+        response = requests.Response()
+        response.status_code = status
+        response.reason = HTTP_REASONS.get(status, '')
+        response.headers = CaseInsensitiveDict(headers)
+        response.url = url
+        response._content = body
+        response._content_consumed = True
+        return response
+
+
+class FixtureMode:
+    """Record/replay switch consulted by the pooled HTTP client"""
+
+    def __init__(self, mode: Optional[str] = None, archive: Optional[FixtureArchive] = None):
+        self.mode = (mode or os.getenv('SCRAPER_HTTP_MODE', 'live')).lower()
+        if self.mode not in ('live', 'record', 'replay'):
+            raise ValueError(f"Unknown SCRAPER_HTTP_MODE: {self.mode}")
+        self.archive = archive or (FixtureArchive() if self.mode != 'live' else None)
+        self.replay_server = os.getenv('SCRAPER_REPLAY_SERVER', '').rstrip('/')
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == 'record'
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    def server_url(self, url: str) -> str:
+        """Point a live URL at the stand-in server, keeping path and query"""
+        parts = urlsplit(url)
+        path = parts.path + (f"?{parts.query}" if parts.query else '')
+        return f"{self.replay_server}{path}"
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    archive: FixtureArchive = None
+    urls_by_path: Dict[str, str] = {}
+
+    def _respond(self, method: str):
+        url = self.urls_by_path.get(self.path)
+        if url is None:
+            status, headers, body = 404, {}, b''
+        else:
+            status, headers, body = self.archive.replay(method, url, dict(self.headers))
+
+        self.send_response(status)
+        for name, value in headers.items():
+            if name != 'Content-Length':
+                self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body) if method == 'GET' else headers.get('Content-Length', 0)))
+        self.end_headers()
+        if method == 'GET':
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond('GET')
+
+    def do_HEAD(self):
+        self._respond('HEAD')
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+def serve(archive: FixtureArchive, host: str = '127.0.0.1', port: int = 8899):
+    """Serve a recorded archive over HTTP, matching requests by path and query"""
+    urls_by_path = {}
+    for entry in archive.iter_entries():
+        parts = urlsplit(entry['url'])
+        urls_by_path[parts.path + (f"?{parts.query}" if parts.query else '')] = entry['url']
+
+    handler = type('ReplayHandler', (_ReplayHandler,), {'archive': archive, 'urls_by_path': urls_by_path})
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"🎞️ Serving {len(urls_by_path)} recorded URLs from {archive.path} on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Recorded HTTP fixtures for the Cigna scraper')
+    parser.add_argument('command', choices=['serve', 'info'])
+    parser.add_argument('--archive', default=None, help='Archive directory (default: SCRAPER_HTTP_FIXTURES)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8899)
+    args = parser.parse_args(argv)
+
+    archive = FixtureArchive(args.archive)
+    if args.command == 'serve':
+        serve(archive, args.host, args.port)
+    else:
+        entries = list(archive.iter_entries())
+        total_bytes = sum(entry['body_size'] for entry in entries)
+        print(f"📦 {archive.path}: {len(entries)} responses, {total_bytes / 1024 / 1024:.1f} MB")
+        for entry in entries:
+            print(f"  {entry['method']:4} {entry['status']} {entry['body_size']:>10}  {entry['url']}")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Keyword Automaton
+Aho-Corasick matcher that finds every occurrence of a keyword dictionary in one linear pass over the text
+"""
+
+import re
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# re.IGNORECASE also treats these as ASCII letters, but str.lower() does not
+# map them (or, for U+0130, changes the text length)
+_RE_CASE_EXTRAS = str.maketrans({'İ': 'i', 'ı': 'i', 'ſ': 's'})
+
+
+def fold_ignorecase(text: str) -> str:
+    """Lowercase text the way re.IGNORECASE compares it to ASCII keywords, keeping offsets unchanged"""
+    if not text.isascii():
+        text = text.translate(_RE_CASE_EXTRAS)
+    return text.lower()
+
+
+class KeywordHit(NamedTuple):
+    start: int
+    end: int
+    keyword: str
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over lowercase keywords
+
+    The goto/failure structure is flattened into a DFA when the automaton is
+    built, so scanning costs one dict lookup per character however many
+    keywords there are. Overlapping occurrences are all reported.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(dict.fromkeys(keyword.lower() for keyword in keywords if keyword))
+
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[str, ...]] = [()]
+        for keyword in self.keywords:
+            state = 0
+            for char in keyword:
+                if char not in goto[state]:
+                    goto.append({})
+                    outputs.append(())
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            outputs[state] += (keyword,)
+
+        # Breadth-first so every failure state is complete before it is used
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        pending = deque(goto[0].values())
+        while pending:
+            state = pending.popleft()
+            outputs[state] += outputs[fail[state]]
+            delta[state] = dict(delta[fail[state]])
+            for char, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(char, 0)
+                delta[state][char] = child
+                pending.append(child)
+
+        self._delta = delta
+        self._outputs = outputs
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """Every keyword occurrence in text, ordered by end offset
+
+        text is matched as given; use fold_ignorecase() or str.lower() first
+        for case-insensitive matching.
+        """
+        delta = self._delta
+        outputs = self._outputs
+        hits = []
+        state = 0
+        for index, char in enumerate(text):
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                end = index + 1
+                for keyword in outputs[state]:
+                    hits.append(KeywordHit(end - len(keyword), end, keyword))
+        return hits
+
+    def found(self, text: str) -> set:
+        """The set of keywords that occur in text"""
+        return {hit.keyword for hit in self.find_all(text)}
+
+
+def leftmost_non_overlapping(hits: Iterable[KeywordHit], keywords: Iterable[str]) -> List[KeywordHit]:
+    """The hits re.finditer would report for an alternation of keywords that never start at the same offset"""
+    wanted = set(keywords)
+    selected = []
+    position = 0
+    for hit in sorted(hit for hit in hits if hit.keyword in wanted):
+        if hit.start >= position:
+            selected.append(hit)
+            position = hit.end
+    return selected
+
+
+def _guideline_statement(acronym: str):
+    # "<acronym> Guideline(s): <title>"; it can only start where the acronym does
+    return re.compile(acronym + r'\s+Guidelines?\s*[:\-]?\s*([^.\n]+)', re.IGNORECASE)
+
+
+# Guideline organizations referenced in policy text. Acronyms are also used,
+# case-sensitively, to find the line that holds a guideline's title.
+GUIDELINE_ORGANIZATIONS = [
+    # (acronym, full name, document type, guideline statement pattern or None)
+    ('NCCN', 'National Comprehensive Cancer Network', 'NCCN Clinical Guideline', _guideline_statement('NCCN')),
+    ('ASCO', 'American Society of Clinical Oncology', 'ASCO Clinical Guideline', _guideline_statement('ASCO')),
+    ('CMS', 'Centers for Medicare and Medicaid Services', 'CMS Reimbursement Policy', _guideline_statement('CMS')),
+    ('FDA', 'Food and Drug Administration', 'FDA Regulatory Policy', _guideline_statement('FDA')),
+    ('AHA', 'American Heart Association', 'AHA Clinical Guideline', None),
+    ('ADA', 'American Diabetes Association', 'ADA Clinical Guideline', None),
+    ('ACOG', 'American College of Obstetricians and Gynecologists', 'ACOG Clinical Guideline', None),
+    ('AAP', 'American Academy of Pediatrics', 'AAP Clinical Guideline', None),
+    ('ACP', 'American College of Physicians', 'ACP Clinical Guideline', None),
+    ('ASPS', 'American Society of Plastic Surgeons', 'ASPS Clinical Guideline', None),
+]
+GUIDELINE_ACRONYMS = tuple(acronym for acronym, _, _, _ in GUIDELINE_ORGANIZATIONS)
+
+# Comment keywords; the first category with any keyword in the comment wins
+CHANGE_TYPE_KEYWORDS = {
+    'Addition': ['new', 'added', 'addition', 'introduced', 'created'],
+    'Removal': ['removed', 'deleted', 'retired', 'discontinued', 'eliminated'],
+    'Modification': ['updated', 'modified', 'changed', 'revised', 'amended'],
+    'Clarification': ['clarified', 'clarification', 'explained'],
+}
+
+SECTION_KEYWORDS = {
+    'coverage criteria': ['coverage', 'criteria', 'eligibility'],
+    'exclusions': ['exclusion', 'excluded', 'not covered'],
+    'limitations': ['limitation', 'limit', 'restricted'],
+    'prior authorization': ['prior auth', 'pre-authorization', 'pa required'],
+    'medical necessity': ['medical necessity', 'medically necessary'],
+    'coding': ['code', 'coding', 'cpt', 'icd', 'hcpcs'],
+    'reimbursement': ['reimbursement', 'payment', 'billing'],
+    'clinical guidelines': ['guideline', 'protocol', 'standard'],
+}
+
+GUIDELINE_AUTOMATON = KeywordAutomaton(
+    name for acronym, full_name, _, _ in GUIDELINE_ORGANIZATIONS for name in (acronym, full_name)
+)
+CHANGE_TYPE_AUTOMATON = KeywordAutomaton(keyword for keywords in CHANGE_TYPE_KEYWORDS.values() for keyword in keywords)
+SECTION_AUTOMATON = KeywordAutomaton(keyword for keywords in SECTION_KEYWORDS.values() for keyword in keywords)
+
+
+def guideline_acronym_spans(text: str, hits: Optional[List[KeywordHit]] = None) -> List[Tuple[int, int]]:
+    """Spans where a guideline acronym appears in text exactly as written (case-sensitive)
+
+    hits is a GUIDELINE_AUTOMATON scan of the folded text, if one was already made.
+    """
+    if hits is None:
+        hits = GUIDELINE_AUTOMATON.find_all(fold_ignorecase(text))
+    return sorted((hit.start, hit.end) for hit in hits if text[hit.start:hit.end] in GUIDELINE_ACRONYMS)
+
+
+def first_category(found: set, categories: Dict[str, List[str]]):
+    """The first category, in dictionary order, with any keyword in found"""
+    for category, keywords in categories.items():
+        if any(keyword in found for keyword in keywords):
+            return category
+    return None
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Per-page Analysis Memo for pdfplumber Pages
+Computes text, tables, words and annotations once per page and shares them with every extractor
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+from functools import cached_property
+from typing import Dict, List, Optional
+
+from pdfminer.pdftypes import resolve1
+
+from table_gate import get_table_gate
+
+
+def _decode_pdf_string(value):
+    """PDF text strings are UTF-8/ASCII or UTF-16 with a byte order mark"""
+    if isinstance(value, bytes):
+        try:
+            return value.decode('utf-8')
+        except UnicodeDecodeError:
+            return value.decode('utf-16', errors='replace')
+    return value
+
+
+def release_page(page):
+    """Drop a pdfplumber page's parsed layout objects once it has been processed"""
+    close = getattr(page, 'close', None)
+    if close is not None:
+        close()
+    else:
+        page.flush_cache()
+
+
+class WordGrid:
+    """Row-bucketed spatial index over a page's words
+
+    Words are grouped into horizontal bands by their top coordinate and sorted
+    by x0 within each band, so a lookup only touches the few bands around the
+    query and the words left of its right edge.
+    """
+
+    def __init__(self, words: List[Dict], band_height: float = 15):
+        self.band_height = band_height
+        self._bands = defaultdict(list)
+        for word in words:
+            self._bands[int(word['top'] // band_height)].append(word)
+        for band in self._bands.values():
+            band.sort(key=lambda w: w['x0'])
+        self._band_x0 = {key: [w['x0'] for w in band] for key, band in self._bands.items()}
+
+    def near(self, top: float, x0: float, x1: float, max_dy: float = 15, max_dx: float = 100) -> List[Dict]:
+        """Words whose top is within max_dy of top and that overlap [x0 - max_dx, x1 + max_dx], in x order"""
+        found = []
+        for key in range(int((top - max_dy) // self.band_height), int((top + max_dy) // self.band_height) + 1):
+            band = self._bands.get(key)
+            if not band:
+                continue
+            end = bisect_left(self._band_x0[key], x1 + max_dx)
+            for word in band[:end]:
+                if word['x1'] > x0 - max_dx and abs(word['top'] - top) < max_dy:
+                    found.append(word)
+        found.sort(key=lambda w: w['x0'])
+        return found
+
+
+class PageAnalysis:
+    """Lazily computed, memoized pdfplumber results for one page
+
+    Table detection is by far the most expensive pdfplumber call, and the link
+    extractors used to run it once per hyperlink. Every property here is
+    computed on first access only.
+    """
+
+    def __init__(self, page, page_number: Optional[int] = None):
+        self.page = page
+        self.page_number = page_number if page_number is not None else getattr(page, 'page_number', None)
+
+    @classmethod
+    def of(cls, page_or_analysis) -> 'PageAnalysis':
+        """Wrap a pdfplumber page, or pass an existing analysis through unchanged"""
+        if isinstance(page_or_analysis, cls):
+            return page_or_analysis
+        return cls(page_or_analysis)
+
+    @cached_property
+    def text(self) -> Optional[str]:
+        return self.page.extract_text()
+
+    @cached_property
+    def tables(self) -> List[List[List[Optional[str]]]]:
+        return get_table_gate().extract_tables(self.page)
+
+    @cached_property
+    def words(self) -> List[Dict]:
+        return self.page.extract_words()
+
+    @cached_property
+    def word_grid(self) -> WordGrid:
+        return WordGrid(self.words)
+
+    @cached_property
+    def annots(self) -> List[Dict]:
+        return getattr(self.page, 'annots', None) or []
+
+    @cached_property
+    def uri_annots(self) -> List[Dict]:
+        """Link annotations with a URI action, read straight from the page's /Annots array
+
+        Unlike page.annots this resolves only the Rect and action of each
+        annotation, not every object the annotation refers to (its parent
+        page, appearance streams...), and needs no layout analysis at all.
+        """
+        page = self.page
+        found = []
+        for ref in resolve1(page.page_obj.annots) or []:
+            annot = resolve1(ref)
+            if not isinstance(annot, dict):
+                continue
+            action = resolve1(annot.get('A'))
+            if not isinstance(action, dict):
+                continue
+            uri = _decode_pdf_string(resolve1(action.get('URI')))
+            rect = resolve1(annot.get('Rect'))
+            if not uri or not rect or len(rect) != 4:
+                continue
+
+            x0, y0, x1, y1 = (float(resolve1(value)) for value in rect)
+            x0, x1 = min(x0, x1), max(x0, x1)
+            y0, y1 = min(y0, y1), max(y0, y1)
+            found.append({
+                'uri': uri,
+                'x0': x0, 'y0': y0, 'x1': x1, 'y1': y1,
+                'top': page.height - y1, 'bottom': page.height - y0,
+                'page_number': self.page_number,
+            })
+        return found
+
+    @cached_property
+    def links(self) -> List[Dict]:
+        return getattr(self.page, 'links', None) or []
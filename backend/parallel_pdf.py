@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Page-parallel Parsing of Monthly Update PDFs
+Fans page ranges of one PDF out to a process pool and merges the link records back in page order
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_pid: Optional[int] = None
+_executor_workers = 0
+
+# Parser instance reused by every task a pool process runs
+_worker_parser = None
+
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    """Return the page pool for the current process, creating it on first use"""
+    global _executor, _executor_pid, _executor_workers
+    pid = os.getpid()
+    if _executor is None or _executor_pid != pid or _executor_workers != workers:
+        if _executor is not None and _executor_pid == pid:
+            _executor.shutdown(wait=False)
+        _executor = ProcessPoolExecutor(max_workers=workers)
+        _executor_pid = pid
+        _executor_workers = workers
+    return _executor
+
+
+@atexit.register
+def _shutdown_executor():
+    if _executor is not None and _executor_pid == os.getpid():
+        _executor.shutdown(wait=False)
+
+
+@contextmanager
+def pdf_file_path(pdf_source):
+    """Yield a filesystem path for a PDF given as bytes, an open file or a path
+
+    Files that already live on disk (e.g. PDF cache objects) are shared as-is;
+    anything else is copied to a temporary file for the pool processes to open.
+    """
+    if isinstance(pdf_source, str):
+        yield pdf_source
+        return
+
+    name = getattr(pdf_source, 'name', None)
+    if isinstance(name, str) and os.path.isfile(name):
+        yield name
+        return
+
+    tmp = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
+    try:
+        with tmp:
+            if isinstance(pdf_source, (bytes, bytearray)):
+                tmp.write(pdf_source)
+            else:
+                position = pdf_source.tell()
+                pdf_source.seek(0)
+                shutil.copyfileobj(pdf_source, tmp)
+                pdf_source.seek(position)
+        yield tmp.name
+    finally:
+        os.remove(tmp.name)
+
+
+def _parse_page_range(pdf_path: str, month_year: str, first_page: int, last_page: int):
+    """Pool task: extract compact link records from pages first_page..last_page (1-based)"""
+    global _worker_parser
+    import pdfplumber
+    from page_analysis import PageAnalysis, release_page
+    from scraper import CignaPolicyScraper
+
+    if _worker_parser is None:
+        _worker_parser = CignaPolicyScraper(parse_only=True)
+
+    before = dict(_worker_parser.link_path_stats)
+    records = []
+    with pdfplumber.open(pdf_path, pages=list(range(first_page, last_page + 1))) as pdf:
+        for page in pdf.pages:
+            analysis = PageAnalysis(page, page.page_number)
+            records.append((page.page_number, _worker_parser.extract_policy_links_from_page(analysis, month_year)))
+            release_page(page)
+    path_stats = {key: value - before[key] for key, value in _worker_parser.link_path_stats.items()}
+    return records, path_stats
+
+
+def page_ranges(page_count: int, workers: int) -> List[tuple]:
+    """Split pages 1..page_count into about two ranges per worker for load balancing"""
+    chunk_size = max(1, -(-page_count // (workers * 2)))
+    return [(first, min(page_count, first + chunk_size - 1)) for first in range(1, page_count + 1, chunk_size)]
+
+
+def parse_monthly_pdf_pages(pdf_source, month_year: str, page_count: int, workers: int,
+                            link_path_stats: Optional[Dict[str, int]] = None) -> Optional[List[list]]:
+    """Parse a monthly PDF's pages in parallel
+
+    Returns one list of link records per page, in page order, or None if the
+    pool could not be used (for example inside a daemonic Celery prefork child)
+    so the caller can fall back to serial parsing. The workers' link discovery
+    counters are added to link_path_stats when given.
+    """
+    try:
+        with pdf_file_path(pdf_source) as pdf_path:
+            executor = _get_executor(workers)
+            futures = [
+                executor.submit(_parse_page_range, pdf_path, month_year, first, last)
+                for first, last in page_ranges(page_count, workers)
+            ]
+
+            links_by_page = {}
+            path_stats = {}
+            for future in futures:
+                records, range_stats = future.result()
+                for page_number, links in records:
+                    links_by_page[page_number] = links
+                for key, value in range_stats.items():
+                    path_stats[key] = path_stats.get(key, 0) + value
+    except Exception as e:
+        logger.warning(f"⚠️ Page-parallel parsing unavailable, parsing serially: {e}")
+        return None
+
+    if link_path_stats is not None:
+        for key, value in path_stats.items():
+            link_path_stats[key] = link_path_stats.get(key, 0) + value
+    logger.info(f"⚡ Parsed {page_count} pages with {workers} processes")
+    return [links_by_page.get(page_number, []) for page_number in range(1, page_count + 1)]
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Parsed Policy Document Cache
+Stores extracted text and analysis results keyed by the PDF's SHA-256, so unchanged PDFs are never parsed twice
+"""
+
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Dict, Optional
+import logging
+
+from range_file import HTTPRangeFile
+
+logger = logging.getLogger(__name__)
+
+try:
+    import msgpack
+except ImportError:  # optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+DEFAULT_CACHE_DIR = '/tmp/cigna_parsed_cache'
+
+
+def _encode(value: Dict):
+    """Serialize and compress a cache entry with the best codec installed"""
+    if msgpack is not None and zstandard is not None:
+        return 'msgpack+zstd', zstandard.ZstdCompressor(level=9).compress(msgpack.packb(value, use_bin_type=True))
+    return 'json+zlib', zlib.compress(json.dumps(value, separators=(',', ':')).encode('utf-8'), 6)
+
+
+def _decode(codec: str, payload: bytes) -> Optional[Dict]:
+    if codec == 'msgpack+zstd':
+        if msgpack is None or zstandard is None:
+            return None
+        return msgpack.unpackb(zstandard.ZstdDecompressor().decompress(payload), raw=False)
+    if codec == 'json+zlib':
+        return json.loads(zlib.decompress(payload).decode('utf-8'))
+    return None
+
+
+def content_sha256(pdf_file) -> Optional[str]:
+    """SHA-256 of a PDF given as bytes or an open file, or None if hashing would defeat lazy loading
+
+    Files from the PDF cache are named after their SHA-256 already, so they
+    are not read again.
+    """
+    if isinstance(pdf_file, (bytes, bytearray)):
+        return hashlib.sha256(pdf_file).hexdigest()
+
+    if isinstance(pdf_file, io.BufferedReader) and isinstance(pdf_file.raw, HTTPRangeFile):
+        return None
+
+    name = getattr(pdf_file, 'name', None)
+    if isinstance(name, str):
+        stem, extension = os.path.splitext(os.path.basename(name))
+        if extension == '.pdf' and len(stem) == 64 and all(c in '0123456789abcdef' for c in stem):
+            return stem
+
+    digest = hashlib.sha256()
+    position = pdf_file.tell()
+    pdf_file.seek(0)
+    for chunk in iter(lambda: pdf_file.read(1024 * 1024), b''):
+        digest.update(chunk)
+    pdf_file.seek(position)
+    return digest.hexdigest()
+
+
+class ParsedDocumentCache:
+    """(PDF SHA-256, extractor version) -> extracted text and analysis, with LRU eviction
+
+    Entries are compressed (msgpack+zstd when installed, json+zlib otherwise) and
+    kept in one SQLite database shared by every worker process on the node.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.cache_dir = cache_dir or os.getenv('SCRAPER_PARSED_CACHE_DIR', DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes or int(os.getenv('SCRAPER_PARSED_CACHE_MAX_MB', '512')) * 1024 * 1024
+        self.db_path = os.path.join(self.cache_dir, 'parsed.db')
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._init_db()
+
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS documents (
+                    sha256 TEXT NOT NULL,
+                    extractor_version TEXT NOT NULL,
+                    codec TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (sha256, extractor_version)
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_documents_last_access ON documents (last_access)')
+
+    def _count(self, **increments):
+        with self._lock:
+            for name, value in increments.items():
+                self._counters[name] += value
+
+    def get(self, sha256: str, extractor_version: str) -> Optional[Dict]:
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT codec, payload FROM documents WHERE sha256 = ? AND extractor_version = ?',
+                (sha256, extractor_version)
+            ).fetchone()
+            if row:
+                conn.execute(
+                    'UPDATE documents SET last_access = ? WHERE sha256 = ? AND extractor_version = ?',
+                    (time.time(), sha256, extractor_version)
+                )
+
+        value = _decode(row[0], row[1]) if row else None
+        if value is None:
+            self._count(misses=1)
+            return None
+        self._count(hits=1)
+        logger.info(f"🧠 Parsed document cache hit: {sha256[:12]}")
+        return value
+
+    def put(self, sha256: str, extractor_version: str, value: Dict):
+        codec, payload = _encode(value)
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO documents '
+                '(sha256, extractor_version, codec, payload, size, created_at, last_access) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (sha256, extractor_version, codec, payload, len(payload), now, now)
+            )
+        self._count(stores=1)
+        self.evict()
+
+    def evict(self):
+        """Drop least recently used documents until the cache fits in max_bytes"""
+        with self._connect() as conn:
+            total_bytes = conn.execute('SELECT COALESCE(SUM(size), 0) FROM documents').fetchone()[0]
+            if total_bytes <= self.max_bytes:
+                return
+
+            evicted = 0
+            rows = conn.execute('SELECT sha256, extractor_version, size FROM documents ORDER BY last_access').fetchall()
+            for sha256, extractor_version, size in rows:
+                if total_bytes <= self.max_bytes:
+                    break
+                conn.execute('DELETE FROM documents WHERE sha256 = ? AND extractor_version = ?', (sha256, extractor_version))
+                total_bytes -= size
+                evicted += 1
+
+        self._count(evictions=evicted)
+        logger.info(f"🧹 Evicted {evicted} parsed documents from cache")
+
+    def stats(self) -> Dict:
+        with self._lock:
+            counters = dict(self._counters)
+
+        with self._connect() as conn:
+            entries, stored_bytes = conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM documents').fetchone()
+
+        lookups = counters['hits'] + counters['misses']
+        counters.update({
+            'hit_ratio': round(counters['hits'] / lookups, 3) if lookups else 0.0,
+            'entries': entries,
+            'stored_bytes': stored_bytes,
+            'max_bytes': self.max_bytes,
+        })
+        return counters
+
+
+_cache: Optional[ParsedDocumentCache] = None
+_cache_pid: Optional[int] = None
+
+
+def get_parsed_cache() -> ParsedDocumentCache:
+    """Return the parsed document cache for the current process"""
+    global _cache, _cache_pid
+    pid = os.getpid()
+    if _cache is None or _cache_pid != pid:
+        _cache = ParsedDocumentCache()
+        _cache_pid = pid
+    return _cache
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Isolated Parser Subprocess Pool
+Runs policy PDF text extraction and monthly PDF link extraction in long-lived worker processes with per-document CPU-time and memory budgets
+
+A pathological PDF can keep pdfplumber/pdfminer busy for minutes or make it
+allocate gigabytes. In a parser process that only costs the parser: the
+document gets a structured 'parse_timeout' / 'parse_memory' result and the
+Celery task carries on with the next policy.
+
+Usage (started by ParserPool, not by hand):
+    python parser_pool.py worker --cpu-seconds 120 --memory-mb 2048
+"""
+
+import argparse
+import atexit
+import json
+import os
+import queue
+import resource
+import signal
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, Optional
+import logging
+
+from parallel_pdf import pdf_file_path
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class CPUBudgetExceeded(BaseException):
+    """Raised in a parser process when SIGXCPU reports the document's CPU budget is used up
+
+    A BaseException, like KeyboardInterrupt, so the parsers' and the scraper's
+    broad except clauses don't swallow it and carry on parsing.
+    """
+
+
+def _on_sigxcpu(signum, frame):
+    raise CPUBudgetExceeded()
+
+
+def _cpu_time_used() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _address_space_used() -> int:
+    """Bytes of address space the process has mapped (0 where /proc isn't available)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[0]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def worker_main(cpu_seconds: float, memory_mb: int):
+    """Parser process loop: one JSON request per stdin line, one JSON response per stdout line"""
+    # Keep stdout for the protocol; the scraper's progress prints go to stderr
+    protocol = sys.stdout
+    sys.stdout = sys.stderr
+
+    from scraper import CignaPolicyScraper
+    parser = CignaPolicyScraper(parse_only=True)
+
+    # The memory budget applies to documents, on top of what importing the
+    # scraper (spaCy, Celery, Supabase) has already mapped
+    if memory_mb:
+        limit = _address_space_used() + memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    signal.signal(signal.SIGXCPU, _on_sigxcpu)
+    _, cpu_hard = resource.getrlimit(resource.RLIMIT_CPU)
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        start = time.monotonic()
+        exit_after = False
+
+        # RLIMIT_CPU counts the whole process lifetime, so each document gets
+        # its budget on top of what the process has already used
+        soft = int(_cpu_time_used() + cpu_seconds) + 1
+        if cpu_hard != resource.RLIM_INFINITY:
+            soft = min(soft, cpu_hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, cpu_hard))
+        try:
+            with open(request['path'], 'rb') as pdf_file:
+                if request.get('kind') == 'links':
+                    before = dict(parser.link_path_stats)
+                    links = parser.parse_monthly_pdf_links(pdf_file, request['month_year'])
+                    path_stats = {key: value - before[key] for key, value in parser.link_path_stats.items()}
+                    response = {'status': 'ok', 'links': links, 'link_path_stats': path_stats}
+                else:
+                    parser.policy_max_pages = request.get('max_pages', 0)
+                    text = '\n'.join(parser.iter_policy_text(pdf_file, request.get('text_backend')))
+                    response = {'status': 'ok', 'text': text}
+        except CPUBudgetExceeded:
+            response = {'status': 'parse_timeout', 'limit': 'cpu', 'budget_seconds': cpu_seconds}
+        except MemoryError:
+            # The heap may be in a bad state after this - answer, then let the pool start a fresh process
+            response = {'status': 'parse_memory', 'budget_mb': memory_mb}
+            exit_after = True
+        except Exception as e:
+            response = {'status': 'parse_error', 'error': str(e)}
+        finally:
+            resource.setrlimit(resource.RLIMIT_CPU, (cpu_hard, cpu_hard))
+
+        response['id'] = request['id']
+        response['seconds'] = round(time.monotonic() - start, 3)
+        protocol.write(json.dumps(response) + '\n')
+        protocol.flush()
+        if exit_after:
+            return 1
+    return 0
+
+
+class _ParserProcess:
+    """One parser subprocess plus a thread that collects its response lines"""
+
+    def __init__(self, cpu_seconds: float, memory_mb: int):
+        self.process = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), 'worker',
+             '--cpu-seconds', str(cpu_seconds), '--memory-mb', str(memory_mb)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=BACKEND_DIR,
+            text=True,
+        )
+        self.responses = queue.Queue()
+        self.exited = False
+        self._next_id = 0
+        threading.Thread(target=self._read_responses, daemon=True).start()
+
+    def _read_responses(self):
+        for line in self.process.stdout:
+            self.responses.put(json.loads(line))
+        self.exited = True
+        self.responses.put(None)  # process exited
+
+    def request(self, payload: Dict, timeout: float) -> Optional[Dict]:
+        """Send one request and wait for its response; None if the process died"""
+        self._next_id += 1
+        payload = dict(payload, id=self._next_id)
+        try:
+            self.process.stdin.write(json.dumps(payload) + '\n')
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError):
+            return None
+
+        deadline = time.monotonic() + timeout
+        while True:
+            response = self.responses.get(timeout=max(0.0, deadline - time.monotonic()))
+            if response is None or response.get('id') == self._next_id:
+                return response
+
+    def alive(self) -> bool:
+        return not self.exited and self.process.poll() is None
+
+    def kill(self):
+        if self.alive():
+            self.process.kill()
+        self.process.wait()
+
+
+class ParserPool:
+    """Long-lived parser subprocesses with per-document CPU, memory and wall-clock budgets
+
+    Environment:
+        SCRAPER_PARSER_POOL_SIZE       number of parser processes (0 disables the pool)
+        SCRAPER_PARSER_CPU_SECONDS     CPU time per document before 'parse_timeout'
+        SCRAPER_PARSER_MEMORY_MB       address space each parser process may add after startup
+        SCRAPER_PARSER_WALL_SECONDS    wall-clock backstop; the process is killed and replaced
+    """
+
+    def __init__(self, size: Optional[int] = None, cpu_seconds: Optional[float] = None,
+                 memory_mb: Optional[int] = None, wall_seconds: Optional[float] = None):
+        self.size = size or int(os.getenv('SCRAPER_PARSER_POOL_SIZE', '2'))
+        self.cpu_seconds = cpu_seconds or float(os.getenv('SCRAPER_PARSER_CPU_SECONDS', '120'))
+        self.memory_mb = memory_mb or int(os.getenv('SCRAPER_PARSER_MEMORY_MB', '2048'))
+        self.wall_seconds = wall_seconds or float(os.getenv('SCRAPER_PARSER_WALL_SECONDS', str(self.cpu_seconds * 2 + 30)))
+
+        self._idle = queue.Queue()
+        self._slots = threading.Semaphore(self.size)
+        self._lock = threading.Lock()
+        self._processes = []
+        self._counters = {'documents': 0, 'ok': 0, 'parse_timeout': 0, 'parse_memory': 0,
+                          'parse_error': 0, 'parse_crashed': 0, 'processes_started': 0}
+
+    def _acquire(self) -> _ParserProcess:
+        self._slots.acquire()
+        while True:
+            try:
+                process = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if process.alive():
+                return process
+            self._discard(process)
+
+        process = _ParserProcess(self.cpu_seconds, self.memory_mb)
+        with self._lock:
+            self._processes.append(process)
+            self._counters['processes_started'] += 1
+        return process
+
+    def _discard(self, process: _ParserProcess):
+        process.kill()
+        with self._lock:
+            if process in self._processes:
+                self._processes.remove(process)
+
+    def _release(self, process: _ParserProcess):
+        if process.alive():
+            self._idle.put(process)
+        else:
+            self._discard(process)
+        self._slots.release()
+
+    def extract_text(self, pdf_source, text_backend: Optional[str] = None, max_pages: int = 0) -> Dict:
+        """Extract a policy PDF's text in a parser process
+
+        Returns {'status': 'ok', 'text': ...} or a structured failure with status
+        'parse_timeout', 'parse_memory', 'parse_error' or 'parse_crashed'.
+        """
+        return self._parse(pdf_source, {'kind': 'text', 'text_backend': text_backend, 'max_pages': max_pages})
+
+    def extract_links(self, pdf_source, month_year: str) -> Dict:
+        """Extract a monthly PDF's policy links in a parser process
+
+        Returns {'status': 'ok', 'links': [...], 'link_path_stats': {...}} or a
+        structured failure, as extract_text() does.
+        """
+        return self._parse(pdf_source, {'kind': 'links', 'month_year': month_year})
+
+    def _parse(self, pdf_source, payload: Dict) -> Dict:
+        with pdf_file_path(pdf_source) as pdf_path:
+            process = self._acquire()
+            try:
+                response = process.request(dict(payload, path=pdf_path), timeout=self.wall_seconds)
+                if response is None:
+                    process.kill()
+                    response = {'status': 'parse_crashed', 'returncode': process.process.returncode}
+                elif response['status'] == 'parse_memory':
+                    # The parser process exits after a MemoryError; don't hand it out again
+                    process.kill()
+            except queue.Empty:
+                process.kill()
+                response = {'status': 'parse_timeout', 'limit': 'wall', 'budget_seconds': self.wall_seconds}
+            finally:
+                self._release(process)
+
+        with self._lock:
+            self._counters['documents'] += 1
+            self._counters[response['status']] = self._counters.get(response['status'], 0) + 1
+        if response['status'] != 'ok':
+            logger.warning(f"⚠️ Parser process gave up on document: {response}")
+        return response
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return dict(self._counters, size=self.size, running=sum(1 for p in self._processes if p.alive()))
+
+    def close(self):
+        with self._lock:
+            processes, self._processes = self._processes, []
+        for process in processes:
+            try:
+                process.process.stdin.close()
+            except OSError:
+                pass
+            process.kill()
+
+
+_pool: Optional[ParserPool] = None
+_pool_pid: Optional[int] = None
+
+
+def get_parser_pool() -> ParserPool:
+    """Return the parser pool for the current process, starting processes on first use"""
+    global _pool, _pool_pid
+    pid = os.getpid()
+    if _pool is None or _pool_pid != pid:
+        _pool = ParserPool()
+        _pool_pid = pid
+    return _pool
+
+
+@atexit.register
+def _close_pool():
+    if _pool is not None and _pool_pid == os.getpid():
+        _pool.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Isolated policy PDF parser process')
+    parser.add_argument('command', choices=['worker'])
+    parser.add_argument('--cpu-seconds', type=float, default=120)
+    parser.add_argument('--memory-mb', type=int, default=2048)
+    args = parser.parse_args(argv)
+    return worker_main(args.cpu_seconds, args.memory_mb)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
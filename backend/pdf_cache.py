@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+On-disk PDF Cache for Cigna Policy Scraper
+Content-addressed PDF store shared by all workers on a node, revalidated with conditional GETs
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = '/tmp/cigna_pdf_cache'
+
+
+class PDFCache:
+    """URL -> PDF body cache with ETag/Last-Modified revalidation and LRU eviction
+
+    Bodies live under objects/ named by their SHA-256, so identical PDFs published
+    under several URLs are stored once. The index is a SQLite database, which lets
+    every Celery worker process on the node share the same cache safely.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.cache_dir = cache_dir or os.getenv('SCRAPER_PDF_CACHE_DIR', DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes or int(os.getenv('SCRAPER_PDF_CACHE_MAX_MB', '2048')) * 1024 * 1024
+        self.objects_dir = os.path.join(self.cache_dir, 'objects')
+        self.index_path = os.path.join(self.cache_dir, 'index.db')
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._init_index()
+
+        self._lock = threading.Lock()
+        self._counters = {
+            'hits': 0,
+            'misses': 0,
+            'revalidations': 0,
+            'bytes_saved': 0,
+            'bytes_downloaded': 0,
+            'evictions': 0,
+        }
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _init_index(self):
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS entries (
+                    url TEXT PRIMARY KEY,
+                    sha256 TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    size INTEGER NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access)')
+
+    def _object_path(self, sha256: str) -> str:
+        return os.path.join(self.objects_dir, sha256[:2], f"{sha256}.pdf")
+
+    def _count(self, **increments):
+        with self._lock:
+            for name, value in increments.items():
+                self._counters[name] += value
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """Return the index entry for a URL if its body is still on disk"""
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT sha256, etag, last_modified, size FROM entries WHERE url = ?', (url,)
+            ).fetchone()
+        if not row:
+            return None
+
+        entry = {'sha256': row[0], 'etag': row[1], 'last_modified': row[2], 'size': row[3]}
+        if not os.path.exists(self._object_path(entry['sha256'])):
+            return None
+        return entry
+
+    def open(self, url: str, http, timeout: float = 30):
+        """Return an open binary file with the PDF body for a URL
+
+        Any cached copy is revalidated with the server first. Bodies are streamed
+        straight into the store, so the PDF is never held in memory as one bytes
+        object. The caller closes the returned file.
+        """
+        entry = self.lookup(url)
+
+        headers = {}
+        if entry:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = http.get(url, timeout=timeout, headers=headers, stream=True)
+        try:
+            if entry and response.status_code == 304:
+                try:
+                    pdf_file = open(self._object_path(entry['sha256']), 'rb')
+                except FileNotFoundError:
+                    # Evicted by another worker since the lookup: fetch it again without validators
+                    logger.info(f"📦 Cached copy of {url} was evicted during revalidation, downloading again")
+                    self._forget(url)
+                    response.close()
+                    return self.open(url, http, timeout=timeout)
+                self._touch(url)
+                self._count(hits=1, revalidations=1, bytes_saved=entry['size'])
+                logger.info(f"📦 PDF cache hit (304): {url}")
+                return pdf_file
+
+            response.raise_for_status()
+            try:
+                pdf_file = self._store_response(url, response, http)
+            except OSError as e:
+                logger.warning(f"Could not cache {url}: {e}")
+                response.close()
+                return http.download(url, timeout=timeout)
+        finally:
+            response.close()
+
+        self.evict()
+        return pdf_file
+
+    def fetch(self, url: str, http, timeout: float = 30) -> bytes:
+        """Return the PDF body for a URL as bytes"""
+        with self.open(url, http, timeout=timeout) as pdf_file:
+            return pdf_file.read()
+
+    def _store_response(self, url: str, response, http):
+        """Stream a response into the content-addressed store and point the URL at it"""
+        os.makedirs(self.objects_dir, exist_ok=True)
+        tmp_path = os.path.join(self.objects_dir, f"incoming.{os.getpid()}.{threading.get_ident()}.tmp")
+
+        digest = hashlib.sha256()
+        try:
+            with open(tmp_path, 'wb') as tmp_file:
+                hashing_writer = _HashingWriter(tmp_file, digest)
+                size = http.copy_body(response, hashing_writer)
+
+            sha256 = digest.hexdigest()
+            path = self._object_path(sha256)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        # Open before recording the entry so a concurrent eviction can't pull the file away
+        pdf_file = open(path, 'rb')
+
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('''
+                INSERT OR REPLACE INTO entries (url, sha256, etag, last_modified, size, fetched_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (url, sha256, response.headers.get('ETag'), response.headers.get('Last-Modified'), size, now, now))
+
+        self._count(misses=1, bytes_downloaded=size)
+        return pdf_file
+
+    def _touch(self, url: str):
+        with self._connect() as conn:
+            conn.execute('UPDATE entries SET last_access = ? WHERE url = ?', (time.time(), url))
+
+    def _forget(self, url: str):
+        with self._connect() as conn:
+            conn.execute('DELETE FROM entries WHERE url = ?', (url,))
+
+    def evict(self):
+        """Drop least recently used entries until the store fits in max_bytes"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT sha256, MAX(size), MAX(last_access) FROM entries GROUP BY sha256 ORDER BY MAX(last_access)'
+            ).fetchall()
+            total_bytes = sum(row[1] for row in rows)
+
+            evicted = 0
+            for sha256, size, _ in rows:
+                if total_bytes <= self.max_bytes:
+                    break
+                conn.execute('DELETE FROM entries WHERE sha256 = ?', (sha256,))
+                try:
+                    os.remove(self._object_path(sha256))
+                except FileNotFoundError:
+                    pass
+                total_bytes -= size
+                evicted += 1
+
+        if evicted:
+            self._count(evictions=evicted)
+            logger.info(f"🧹 Evicted {evicted} PDFs from cache")
+
+    def stats(self) -> Dict:
+        """Per-process hit/miss counters plus the current size of the shared store"""
+        with self._lock:
+            counters = dict(self._counters)
+
+        with self._connect() as conn:
+            entries = conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+            stored_bytes = conn.execute(
+                'SELECT COALESCE(SUM(size), 0) FROM (SELECT MAX(size) AS size FROM entries GROUP BY sha256)'
+            ).fetchone()[0]
+
+        lookups = counters['hits'] + counters['misses']
+        counters.update({
+            'hit_ratio': round(counters['hits'] / lookups, 3) if lookups else 0.0,
+            'entries': entries,
+            'stored_bytes': stored_bytes,
+            'max_bytes': self.max_bytes,
+        })
+        return counters
+
+
+class _HashingWriter:
+    """File wrapper that feeds every written chunk into a hash"""
+
+    def __init__(self, fileobj, digest):
+        self.fileobj = fileobj
+        self.digest = digest
+
+    def write(self, chunk: bytes) -> int:
+        self.digest.update(chunk)
+        return self.fileobj.write(chunk)
+
+
+_cache: Optional[PDFCache] = None
+_cache_pid: Optional[int] = None
+
+
+def get_pdf_cache() -> PDFCache:
+    """Return the PDF cache for the current process"""
+    global _cache, _cache_pid
+    pid = os.getpid()
+    if _cache is None or _cache_pid != pid:
+        _cache = PDFCache()
+        _cache_pid = pid
+    return _cache
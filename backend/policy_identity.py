@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Canonical Policy Identity
+Normalizes policy links to one key per policy so duplicates are collapsed before anything is downloaded
+"""
+
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import logging
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+# Policy PDFs are named <type>_<number>_..., e.g. mm_0586_coveragepositioncriteria_alveoloplasty.pdf
+POLICY_FILE_PATTERN = re.compile(r'(?:^|/)([a-z]{2})_(\d{4})_', re.IGNORECASE)
+TITLE_NUMBER_PATTERN = re.compile(r'\((\d{4})\)')
+
+# Title -> URL slug, in one pass: whitespace and hyphens become underscores,
+# punctuation is dropped and '&' is spelled out
+_SLUG_TABLE = str.maketrans({
+    ' ': '_', '\n': '_', '\r': '_', '-': '_',
+    '(': None, ')': None, ',': None, '.': None,
+    '&': 'and',
+})
+
+# Lower rank wins when two links describe the same policy: annotation URLs are
+# real links, text and table URLs are reconstructed from the title
+SOURCE_RANK = {'annotation': 0, 'table': 1, 'text': 2}
+
+
+def policy_title_slug(title: str) -> str:
+    """URL slug for a policy title, as used in Cigna's coverage position PDF names"""
+    return title.lower().translate(_SLUG_TABLE).replace('__', '_').strip('_')
+
+
+def canonical_policy_key(url: str = '', title: str = '', policy_number: str = '') -> Optional[str]:
+    """Identify a policy by type prefix and number, e.g. 'mm_0586'
+
+    The URL is the most reliable source. Text and table matches only carry a
+    number, and their URLs are built under the medical (mm_) prefix.
+    """
+    match = POLICY_FILE_PATTERN.search(url or '')
+    if match:
+        return f"{match.group(1).lower()}_{match.group(2)}"
+
+    number = policy_number if policy_number and policy_number != 'N/A' else ''
+    if not number:
+        title_match = TITLE_NUMBER_PATTERN.search(title or '')
+        number = title_match.group(1) if title_match else ''
+    return f"mm_{number}" if number else None
+
+
+def policy_link_key(link: Dict) -> str:
+    """Dedupe key for a policy link; links without a policy number fall back to their URL"""
+    return canonical_policy_key(link.get('url', ''), link.get('title', ''), link.get('policy_number', '')) or link.get('url', '')
+
+
+def _merge(kept: Dict, duplicate: Dict) -> Dict:
+    """Prefer the better-sourced link, filling in anything it lacks from the duplicate"""
+    if SOURCE_RANK.get(duplicate.get('source'), 3) < SOURCE_RANK.get(kept.get('source'), 3):
+        kept, duplicate = dict(duplicate), kept
+    if kept.get('title') in (None, '', 'Unknown Policy') and duplicate.get('title'):
+        kept['title'] = duplicate['title']
+    if not kept.get('comments') and duplicate.get('comments'):
+        kept['comments'] = duplicate['comments']
+    return kept
+
+
+def dedupe_policy_links(policy_links: Iterable[Dict]) -> Tuple[List[Dict], int]:
+    """Collapse links that refer to the same policy, keeping first-seen order
+
+    Returns the unique links and the number of duplicates dropped.
+    """
+    unique: Dict[str, Dict] = {}
+    duplicates = 0
+    for link in policy_links:
+        key = policy_link_key(link)
+        if key in unique:
+            unique[key] = _merge(unique[key], link)
+            duplicates += 1
+        else:
+            unique[key] = dict(link)
+    return list(unique.values()), duplicates
+
+
+class PolicyClaims:
+    """Policies already taken by a month of the current run
+
+    Months of one run are processed by parallel Celery tasks, so claims live in
+    a Redis set per run id. Without a run id (or without Redis) claims are only
+    remembered in this process, which still covers sequential runs.
+    """
+
+    def __init__(self, redis_client=None, ttl_hours: Optional[float] = None):
+        self.redis_client = redis_client or redis.Redis.from_url(
+            os.getenv('SCRAPER_STATE_REDIS_URL', 'redis://localhost:6379/1'),
+            decode_responses=True
+        )
+        self.ttl_seconds = int(float(ttl_hours or os.getenv('SCRAPER_POLICY_CLAIM_TTL_HOURS', '24')) * 3600)
+        self._local: Dict[Optional[str], Set[str]] = {}
+
+    def claim(self, keys: List[str], run_id: Optional[str] = None) -> Set[str]:
+        """Claim keys for the caller; returns the ones no other month claimed first"""
+        if run_id:
+            try:
+                redis_key = f"policy_claims:{run_id}"
+                pipeline = self.redis_client.pipeline()
+                for key in keys:
+                    pipeline.sadd(redis_key, key)
+                pipeline.expire(redis_key, self.ttl_seconds)
+                added = pipeline.execute()[:-1]
+                return {key for key, was_added in zip(keys, added) if was_added}
+            except redis.RedisError as e:
+                logger.warning(f"⚠️ Policy claims unavailable, deduping within this process only: {e}")
+
+        seen = self._local.setdefault(run_id, set())
+        claimed = {key for key in keys if key not in seen}
+        seen.update(claimed)
+        return claimed
+
+    def release(self, keys: List[str], run_id: Optional[str] = None):
+        """Give up claims on policies that failed, so a later month of the run can fetch them"""
+        if run_id:
+            try:
+                self.redis_client.srem(f"policy_claims:{run_id}", *keys)
+            except redis.RedisError as e:
+                logger.warning(f"⚠️ Could not release policy claims: {e}")
+        self._local.get(run_id, set()).difference_update(keys)
+
+
+_claims: Optional[PolicyClaims] = None
+
+
+def get_policy_claims() -> PolicyClaims:
+    """Return the shared policy claim store"""
+    global _claims
+    if _claims is None:
+        _claims = PolicyClaims()
+    return _claims
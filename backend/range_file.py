@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Lazy Remote PDF File
+Seekable file object that fetches byte ranges on demand so pdfplumber can open remote PDFs lazily
+"""
+
+import io
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+
+class RangeNotSupported(Exception):
+    """The server ignored or rejected a Range request"""
+
+
+class HTTPRangeFile(io.RawIOBase):
+    """Read-only, seekable view of a remote file backed by HTTP Range requests
+
+    Reads are served from fixed-size blocks. Missing blocks needed by a read are
+    fetched with a single Range request and kept in a small LRU cache, so the
+    PDF parser's back-and-forth seeking (trailer, xref, then objects) only
+    downloads the parts of the file it actually touches.
+
+    If a Range request is answered with the whole file (200 instead of 206,
+    e.g. from a different CDN edge), that body is kept and every later read
+    is served from it.
+    """
+
+    def __init__(self, url: str, http, size: int, block_size: int = DEFAULT_BLOCK_SIZE,
+                 max_cached_blocks: int = 256, timeout: float = 30):
+        super().__init__()
+        self.url = url
+        self.http = http
+        self.size = size
+        self.block_size = block_size
+        self.max_cached_blocks = max_cached_blocks
+        self.timeout = timeout
+        self.position = 0
+
+        self._blocks = OrderedDict()
+        self._full_content: Optional[bytes] = None
+        self._lock = threading.Lock()
+        self.range_requests = 0
+        self.bytes_fetched = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self.position = position
+        return self.position
+
+    def _fetch_blocks(self, first_block: int, last_block: int):
+        """Download a run of consecutive blocks with one Range request"""
+        start = first_block * self.block_size
+        end = min(self.size, (last_block + 1) * self.block_size) - 1
+        response = self.http.get(self.url, headers={'Range': f"bytes={start}-{end}"}, timeout=self.timeout)
+        if response.status_code == 200:
+            # The server sent the whole file: keep it rather than downloading it again
+            self._full_content = response.content
+            self.range_requests += 1
+            self.bytes_fetched += len(self._full_content)
+            self.size = len(self._full_content)
+            self._blocks.clear()
+            logger.info(f"Range request answered with the full file, reading {self.url} from memory")
+            return
+        if response.status_code != 206:
+            raise RangeNotSupported(f"Expected 206 for range request, got {response.status_code}")
+
+        data = response.content
+        self.range_requests += 1
+        self.bytes_fetched += len(data)
+
+        for block in range(first_block, last_block + 1):
+            offset = (block - first_block) * self.block_size
+            self._blocks[block] = data[offset:offset + self.block_size]
+            self._blocks.move_to_end(block)
+        while len(self._blocks) > self.max_cached_blocks:
+            self._blocks.popitem(last=False)
+
+    def _read_range(self, start: int, end: int) -> bytes:
+        first_block = start // self.block_size
+        last_block = (end - 1) // self.block_size
+
+        with self._lock:
+            # Fetch each run of missing blocks in one request
+            block = first_block
+            while block <= last_block and self._full_content is None:
+                if block in self._blocks:
+                    block += 1
+                    continue
+                run_end = block
+                while run_end + 1 <= last_block and (run_end + 1) not in self._blocks:
+                    run_end += 1
+                self._fetch_blocks(block, run_end)
+                block = run_end + 1
+
+            if self._full_content is not None:
+                return self._full_content[start:end]
+
+            chunks = []
+            for block in range(first_block, last_block + 1):
+                data = self._blocks[block]
+                self._blocks.move_to_end(block)
+                block_start = block * self.block_size
+                chunks.append(data[max(0, start - block_start):max(0, end - block_start)])
+        return b''.join(chunks)
+
+    def readinto(self, buffer) -> int:
+        if self.position >= self.size:
+            return 0
+        end = min(self.size, self.position + len(buffer))
+        data = self._read_range(self.position, end)
+        buffer[:len(data)] = data
+        self.position += len(data)
+        return len(data)
+
+    def readall(self) -> bytes:
+        return self.read(max(0, self.size - self.position))
+
+    def stats(self) -> Dict:
+        return {
+            'size': self.size,
+            'range_requests': self.range_requests,
+            'bytes_fetched': self.bytes_fetched,
+            'fraction_fetched': round(self.bytes_fetched / self.size, 3) if self.size else 0.0,
+            'full_download': self._full_content is not None,
+        }
+
+
+class _LazyPDFReader(io.BufferedReader):
+    """Buffered wrapper that logs how much of the remote file was downloaded on close"""
+
+    def close(self):
+        if not self.closed:
+            stats = self.raw.stats()
+            logger.info(f"📉 Lazy PDF read {stats['bytes_fetched']} of {stats['size']} bytes "
+                        f"in {stats['range_requests']} range requests: {self.raw.url}")
+        super().close()
+
+
+def open_lazy_pdf(url: str, http, timeout: float = 30):
+    """Open a remote PDF lazily, or download it in full if the server can't serve ranges
+
+    Returns a binary file object; the caller closes it.
+    """
+    block_size = int(os.getenv('SCRAPER_RANGE_BLOCK_KB', '64')) * 1024
+
+    try:
+        response = http.head(url, timeout=timeout)
+        response.raise_for_status()
+        size = int(response.headers.get('Content-Length') or 0)
+        supports_ranges = 'bytes' in response.headers.get('Accept-Ranges', '').lower()
+
+        if supports_ranges and size > block_size:
+            raw = HTTPRangeFile(url, http, size, block_size=block_size, timeout=timeout)
+            # Probe the tail first: the trailer and xref are read before anything else
+            raw.seek(-min(size, 1024), io.SEEK_END)
+            raw.read(1)
+            raw.seek(0)
+            return _LazyPDFReader(raw, buffer_size=block_size)
+    except RangeNotSupported as e:
+        logger.info(f"Range requests not honoured for {url}, downloading in full: {e}")
+    except Exception as e:
+        logger.warning(f"Could not open {url} lazily, downloading in full: {e}")
+
+    return http.download(url, timeout=timeout)
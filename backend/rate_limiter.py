@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Distributed Rate Limiter for Upstream Requests
+Token bucket per host shared by every Celery worker through Redis
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+import logging
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+# Reserve tokens atomically and tell the caller how long to wait for them.
+# The bucket may go negative: each caller gets its own slot in line, so
+# requests are paced evenly instead of racing for the next free token.
+TOKEN_BUCKET_SCRIPT = """
+local key = KEYS[1]
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local state = redis.call('HMGET', key, 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil then
+    tokens = burst
+    ts = now
+end
+
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+tokens = tokens - requested
+
+local wait = 0
+if tokens < 0 then
+    wait = -tokens / rate
+end
+
+redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', key, math.ceil((wait + burst / rate) * 1000) + 1000)
+return tostring(wait)
+"""
+
+DEFAULT_RATE_LIMITS = '*=5:10'
+
+# After a Redis error, stay on the local bucket this long before trying Redis again
+REDIS_RETRY_SECONDS = 30
+
+
+def parse_rate_limits(spec: str) -> Dict[str, Tuple[float, float]]:
+    """Parse 'host=rate:burst,host=rate:burst' into {host: (rate, burst)}"""
+    limits = {}
+    for item in spec.split(','):
+        item = item.strip()
+        if not item or '=' not in item:
+            continue
+        host, values = item.split('=', 1)
+        rate, _, burst = values.partition(':')
+        rate = float(rate)
+        limits[host.strip().lower()] = (rate, float(burst) if burst else rate)
+    return limits
+
+
+def validate_rate_limits(limits: Dict[str, Tuple[float, float]]):
+    for host, (rate, burst) in limits.items():
+        if rate <= 0 or burst <= 0:
+            raise ValueError(f"Rate limit for {host} must have a positive rate and burst, got {rate}:{burst}")
+
+
+class DistributedRateLimiter:
+    """Per-host token buckets stored in Redis
+
+    Limits come from SCRAPER_RATE_LIMITS, e.g. 'static.cigna.com=4:8,*=10:20'
+    (requests per second : burst). If Redis is unreachable the limiter falls
+    back to an in-process bucket so scraping keeps going at the same per-worker
+    pace instead of failing.
+    """
+
+    def __init__(self, redis_client=None, limits: Optional[Dict[str, Tuple[float, float]]] = None):
+        # Short socket timeouts: a stalled Redis must not hang every fetch
+        redis_timeout = float(os.getenv('SCRAPER_RATE_LIMIT_REDIS_TIMEOUT', '1'))
+        self.redis_client = redis_client or redis.Redis.from_url(
+            os.getenv('SCRAPER_RATE_LIMIT_REDIS_URL', 'redis://localhost:6379/2'),
+            socket_timeout=redis_timeout,
+            socket_connect_timeout=redis_timeout
+        )
+        self.limits = limits or parse_rate_limits(os.getenv('SCRAPER_RATE_LIMITS', DEFAULT_RATE_LIMITS))
+        validate_rate_limits(self.limits)
+        self.key_prefix = 'ratelimit:'
+        self._script = self.redis_client.register_script(TOKEN_BUCKET_SCRIPT)
+
+        self._lock = threading.Lock()
+        self._local_buckets = {}
+        self._redis_available = True
+        self._redis_retry_at = 0.0
+        self._counters = {
+            'acquired': 0,
+            'throttled': 0,
+            'wait_seconds': 0.0,
+            'local_fallbacks': 0,
+        }
+
+    def limit_for(self, host: str) -> Optional[Tuple[float, float]]:
+        host = (host or '').lower()
+        return self.limits.get(host) or self.limits.get('*')
+
+    def acquire(self, url: str, tokens: float = 1.0) -> float:
+        """Block until the URL's host has a free slot; returns the seconds waited"""
+        host = urlparse(url).hostname or ''
+        limit = self.limit_for(host)
+        if not limit:
+            return 0.0
+
+        rate, burst = limit
+        wait = None
+        if self._redis_available or time.monotonic() >= self._redis_retry_at:
+            try:
+                wait = float(self._script(keys=[f"{self.key_prefix}{host}"], args=[rate, burst, tokens]))
+                if not self._redis_available:
+                    logger.info("✅ Rate limiter reconnected to Redis")
+                    self._redis_available = True
+            except redis.RedisError as e:
+                if self._redis_available:
+                    logger.warning(f"⚠️ Rate limiter falling back to local bucket: {e}")
+                    self._redis_available = False
+                self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+
+        if wait is None:
+            wait = self._reserve_local(host, rate, burst, tokens)
+            with self._lock:
+                self._counters['local_fallbacks'] += 1
+
+        if wait > 0:
+            time.sleep(wait)
+
+        with self._lock:
+            self._counters['acquired'] += 1
+            if wait > 0:
+                self._counters['throttled'] += 1
+                self._counters['wait_seconds'] += wait
+        return wait
+
+    def _reserve_local(self, host: str, rate: float, burst: float, tokens: float) -> float:
+        """Same reservation logic as the Lua script, for this process only"""
+        with self._lock:
+            now = time.monotonic()
+            available, last = self._local_buckets.get(host, (burst, now))
+            available = min(burst, available + max(0.0, now - last) * rate) - tokens
+            self._local_buckets[host] = (available, now)
+        return -available / rate if available < 0 else 0.0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            counters = dict(self._counters)
+        counters['wait_seconds'] = round(counters['wait_seconds'], 3)
+        counters['limits'] = {host: {'rate': rate, 'burst': burst} for host, (rate, burst) in self.limits.items()}
+        return counters
+
+
+_limiter: Optional[DistributedRateLimiter] = None
+_limiter_pid: Optional[int] = None
+
+
+def get_rate_limiter() -> DistributedRateLimiter:
+    """Return the rate limiter for the current process"""
+    global _limiter, _limiter_pid
+    pid = os.getpid()
+    if _limiter is None or _limiter_pid != pid:
+        _limiter = DistributedRateLimiter()
+        _limiter_pid = pid
+    return _limiter
@@ -36,9 +36,14 @@ CREATE TABLE IF NOT EXISTS medical_codes (
     code_type TEXT,
     description TEXT,
     is_covered BOOLEAN,
+    -- Found in the local code sets (SCRAPER_CODE_VALIDATION=flag); NULL when not checked
+    validated BOOLEAN,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- Databases created before the validated column
+ALTER TABLE medical_codes ADD COLUMN IF NOT EXISTS validated BOOLEAN;
+
 -- Document changes table
 CREATE TABLE IF NOT EXISTS document_changes (
     id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
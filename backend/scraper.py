@@ -6,9 +6,11 @@ Scrapes policy updates from Cigna's provider news website using deterministic te
 
 import os
 import json
-import requests
 import time
 import re
+import hashlib
+import bisect
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from bs4 import BeautifulSoup
 from supabase import create_client
@@ -17,15 +19,62 @@ import spacy
 import pdfplumber
 import io
 from celery import Celery
+from http_client import get_http_client
+from pdf_cache import get_pdf_cache
+from async_downloader import AsyncPolicyDownloader
+from change_tracker import fingerprint_bytes, fingerprint_headers, get_scrape_state
+from url_validator import PolicyURLValidator
+from range_file import open_lazy_pdf
+from page_analysis import PageAnalysis, release_page
+from parallel_pdf import parse_monthly_pdf_pages
+from parsed_cache import content_sha256, get_parsed_cache
+from parser_pool import get_parser_pool
+from citation_parser import parse_citations
+from code_scanner import scan_medical_codes
+from code_sets import get_code_sets
+from extraction_rules import get_extraction_rules
+from keyword_automaton import (
+    CHANGE_TYPE_AUTOMATON, CHANGE_TYPE_KEYWORDS, GUIDELINE_AUTOMATON, GUIDELINE_ORGANIZATIONS,
+    SECTION_AUTOMATON, SECTION_KEYWORDS, first_category, fold_ignorecase, guideline_acronym_spans,
+    leftmost_non_overlapping
+)
+from policy_identity import dedupe_policy_links, get_policy_claims, policy_link_key, policy_title_slug
+from text_backends import get_text_backend
+from table_gate import get_table_gate
+from text_index import TextIndex
 
 # Load environment variables
 load_dotenv()
 
+# Bump whenever policy text extraction or analysis output changes, so parsed document caches are invalidated
+EXTRACTOR_VERSION = '2'
+
 class CignaPolicyScraper:
-    def __init__(self):
+    def __init__(self, parse_only=False):
         self.base_url = "https://static.cigna.com/assets/chcp/resourceLibrary/coveragePolicies/"
         self.main_url = "https://static.cigna.com/assets/chcp/resourceLibrary/coveragePolicies/latestUpdatesListing.html"
         
+        # Optionally read only the first pages of each policy PDF (0 = all pages)
+        self.policy_max_pages = int(os.getenv('SCRAPER_POLICY_MAX_PAGES', '0'))
+        
+        # Plain-text backend for policy PDFs (pdfplumber, pdfminer or pdfium; pdfplumber still does tables)
+        self.policy_text_backend = os.getenv('SCRAPER_POLICY_TEXT_BACKEND') or None
+        
+        # Fan pages of long monthly PDFs out to a process pool (0 = parse serially)
+        self.page_workers = int(os.getenv('SCRAPER_PAGE_WORKERS', '0'))
+        self.parallel_min_pages = int(os.getenv('SCRAPER_PARALLEL_MIN_PAGES', '8'))
+        
+        # Hyperlink discovery: 'fast' trusts URI annotations and only falls back to
+        # text/table patterns on pages without any, 'full' always runs every extractor
+        self.link_mode = os.getenv('SCRAPER_LINK_MODE', 'fast').lower()
+        self.link_path_stats = {'annotation_pages': 0, 'fallback_pages': 0, 'full_pages': 0}
+        self.dedupe_stats = {'duplicate_links': 0, 'already_saved': 0, 'claimed_by_other_month': 0, 'downloads_saved': 0}
+        
+        if parse_only:
+            # Page-level PDF parsing only (e.g. inside a parser process): no spaCy, database or network
+            self.nlp = None
+            return
+        
         # Setup spaCy
         try:
             self.nlp = spacy.load("en_core_web_sm")
@@ -43,14 +92,40 @@ class CignaPolicyScraper:
         
         self.supabase = create_client(url, key)
         
+        # Shared keep-alive HTTP client (one per worker process)
+        self.http = get_http_client()
+        
+        # Node-local PDF cache revalidated with conditional GETs
+        self.pdf_cache = get_pdf_cache()
+        
+        # Extracted text and analysis of policy PDFs, keyed by PDF content hash
+        self.parsed_cache = get_parsed_cache() if os.getenv('SCRAPER_PARSED_CACHE', 'true').lower() == 'true' else None
+        
+        # Policy PDFs are parsed in isolated, budgeted subprocesses when a pool size is set
+        self.parser_pool = get_parser_pool() if int(os.getenv('SCRAPER_PARSER_POOL_SIZE', '0')) > 0 else None
+        self.parse_failures = []
+        
+        # Concurrent download stage for the individual policies of a monthly PDF
+        self.policy_downloader = AsyncPolicyDownloader(self.download_policy_pdf)
+        
+        # Open uncached policy PDFs lazily with Range requests
+        self.lazy_policy_pdfs = os.getenv('SCRAPER_LAZY_POLICY_PDFS', 'false').lower() == 'true'
+        
+        # Concurrent, cached liveness checks for candidate policy URLs
+        self.url_validator = PolicyURLValidator(self.check_policy_url)
+        
+        # Fingerprint of the last listing page fetched (used by incremental runs)
+        self.listing_fingerprint = None
+        
         print("🤖 Cigna Policy Scraper initialized")
         print("=" * 60)
 
     def fetch_monthly_links(self):
         """Fetch all monthly policy update links from the main page"""
         try:
-            response = requests.get(self.main_url, timeout=30)
+            response = self.http.get(self.main_url, timeout=30)
             response.raise_for_status()
+            self.listing_fingerprint = fingerprint_bytes(response.content)
             
             soup = BeautifulSoup(response.content, 'html.parser')
             links = []
@@ -74,6 +149,52 @@ class CignaPolicyScraper:
             print(f"❌ Error fetching monthly links: {e}")
             return []
 
+    def fingerprint_monthly_pdf(self, url):
+        """Fingerprint a monthly PDF from its HTTP validators, hashing the body only if the server sends none"""
+        try:
+            response = self.http.head(url, timeout=10)
+            response.raise_for_status()
+            fingerprint = fingerprint_headers(response.headers)
+            if fingerprint:
+                return fingerprint
+            
+            digest = hashlib.sha256()
+            with self.pdf_cache.open(url, self.http, timeout=30) as pdf_file:
+                for chunk in iter(lambda: pdf_file.read(64 * 1024), b''):
+                    digest.update(chunk)
+            return f"sha256:{digest.hexdigest()}"
+        except Exception as e:
+            print(f"⚠️ Could not fingerprint {url}: {e}")
+            return None
+
+    def find_changed_monthly_links(self, monthly_links, state):
+        """Return only the monthly links that are new or changed since they were last processed"""
+        urls = [link['url'] for link in monthly_links]
+        known = state.get_month_fingerprints(urls)
+        listing_changed = self.listing_fingerprint != state.get_listing_fingerprint()
+        
+        # Fast path: same listing, every month already processed and re-checked recently
+        if not listing_changed and all(known.values()) and state.months_checked_recently():
+            print("✅ Listing unchanged since last run - nothing to dispatch")
+            return []
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            fingerprints = list(executor.map(self.fingerprint_monthly_pdf, urls))
+        
+        changed_links = []
+        for link, fingerprint in zip(monthly_links, fingerprints):
+            if fingerprint is None or known.get(link['url']) != fingerprint:
+                print(f"🆕 New or changed: {link['month_year']}")
+                changed_links.append(dict(link, fingerprint=fingerprint))
+        
+        # The listing counts as seen only once every changed month has been processed
+        if self.listing_fingerprint:
+            state.set_pending_listing(self.listing_fingerprint, [link['url'] for link in changed_links if link['fingerprint']])
+        state.mark_months_checked()
+        
+        print(f"📅 {len(changed_links)} of {len(monthly_links)} monthly PDFs are new or changed")
+        return changed_links
+
     def fetch_all_policy_options(self):
         """Fetch all policy options - both monthly PDFs and individual policies from recent PDFs"""
         try:
@@ -135,100 +256,227 @@ class CignaPolicyScraper:
     
     def test_url_accessibility(self, url):
         """Test if a URL is accessible (quick HEAD request)"""
+        return self.check_policy_url(url) is True
+    
+    def check_policy_url(self, url):
+        """HEAD a URL: True if live, False if definitely missing, None if the check was inconclusive"""
         try:
-            response = requests.head(url, timeout=5, allow_redirects=True)
-            return response.status_code == 200
+            response = self.http.head(url, timeout=5, allow_redirects=True)
+            if response.status_code == 200:
+                return True
+            if response.status_code in (403, 404, 410):
+                return False
+            return None
         except Exception:
-            return False
+            return None
     
-    def extract_policy_links_from_pdf(self, pdf_content, month_year):
-        """Extract policy links and comments from monthly PDF using pdfplumber"""
+    def filter_accessible_policy_links(self, policy_links):
+        """Drop policy links whose URL is malformed or known to be dead before anything is downloaded"""
+        candidates = [link for link in policy_links if self.is_valid_policy_url(link.get('url'))]
+        results = self.url_validator.validate(link['url'] for link in candidates)
+        
+        # Inconclusive checks (timeouts etc.) are let through so the download stage can retry them
+        accessible = [link for link in candidates if results.get(link['url']) is not False]
+        
+        dropped = len(policy_links) - len(accessible)
+        if dropped:
+            print(f"    🚫 Skipping {dropped} policy links with invalid or dead URLs")
+        return accessible
+    
+    def select_policy_links_to_fetch(self, policy_links, run_id=None):
+        """Reduce a month's policy links to the ones worth downloading
+        
+        Links for the same policy (annotation, text and table matches) are
+        collapsed first, then dead URLs, policies already in the database and
+        policies another month of this run has claimed are dropped.
+        """
+        policy_links, duplicates = dedupe_policy_links(policy_links)
+        
+        # Guessed URLs often 404 - check them all at once so dead ones are never downloaded
+        policy_links = self.filter_accessible_policy_links(policy_links)
+        
+        already_saved = 0
+        saved_urls = self.find_saved_policy_urls([link['url'] for link in policy_links])
+        if saved_urls:
+            already_saved = sum(1 for link in policy_links if link['url'] in saved_urls)
+            policy_links = [link for link in policy_links if link['url'] not in saved_urls]
+        
+        claimed = get_policy_claims().claim([policy_link_key(link) for link in policy_links], run_id)
+        claimed_elsewhere = sum(1 for link in policy_links if policy_link_key(link) not in claimed)
+        policy_links = [link for link in policy_links if policy_link_key(link) in claimed]
+        
+        self.dedupe_stats['duplicate_links'] += duplicates
+        self.dedupe_stats['already_saved'] += already_saved
+        self.dedupe_stats['claimed_by_other_month'] += claimed_elsewhere
+        skipped = duplicates + already_saved + claimed_elsewhere
+        self.dedupe_stats['downloads_saved'] += skipped
+        if skipped:
+            print(f"    ♻️ Skipping {skipped} downloads: {duplicates} duplicate links, "
+                  f"{already_saved} already saved, {claimed_elsewhere} handled by another month")
+        return policy_links
+    
+    def find_saved_policy_urls(self, urls):
+        """Policy URLs that are already in the database (save_policy would reject them)"""
+        saved = set()
         try:
-            policy_links = []
-            
-            # Open PDF from bytes
-            with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    print(f"    📖 Processing page {page_num + 1}")
-                    
-                    # Extract hyperlinks from the page
-                    hyperlinks = self.extract_hyperlinks_from_page(page)
-                    for link in hyperlinks:
-                        print(f"    🔗 Found hyperlink: {link.get('url', 'N/A')}")
-                        title = link.get('title') or 'Unknown Policy'
-                        
-                        # Extract comments from table data for this policy
-                        comments = self.extract_comments_from_tables_for_url(page, link.get('url', ''))
-                        
-                        policy_links.append({
-                            'title': title,
-                            'url': link.get('url') or 'N/A',
-                            'policy_number': self.extract_policy_number_from_url(link.get('url', '')) or 'N/A',
-                            'comments': comments
-                        })
-                    
-                    # Also extract text and tables as fallback
-                    text = page.extract_text()
-                    tables = page.extract_tables()
-                    
-                    if text:
-                        # Look for policy patterns in text
-                        policy_patterns = self.extract_policy_patterns_from_text(text, month_year)
-                        policy_links.extend(policy_patterns)
-                    
-                    if tables:
-                        # Look for policy patterns in tables
-                        for table in tables:
-                            table_policies = self.extract_policy_patterns_from_table(table, month_year)
-                            policy_links.extend(table_policies)
+            for start in range(0, len(urls), 100):
+                result = self.supabase.table('policy_updates').select('policy_url').in_('policy_url', urls[start:start + 100]).execute()
+                saved.update(row['policy_url'] for row in result.data or [])
+        except Exception as e:
+            print(f"    ⚠️ Could not check for saved policies: {e}")
+        return saved
+    
+    def open_pdf(self, pdf_source):
+        """Open a PDF with pdfplumber from bytes or from a binary file object"""
+        if isinstance(pdf_source, (bytes, bytearray)):
+            pdf_source = io.BytesIO(pdf_source)
+        return pdfplumber.open(pdf_source)
+
+    def extract_policy_links_from_pdf(self, pdf_source, month_year):
+        """Extract policy links and comments from monthly PDF, in the parser pool when one is configured
+        
+        Returns None if the parser process gave up on the PDF (CPU, memory or
+        wall-clock budget, crash), so the month is not treated as processed.
+        """
+        if self.parser_pool is None:
+            try:
+                return self.parse_monthly_pdf_links(pdf_source, month_year)
+            except Exception as e:
+                print(f"    ❌ Error parsing PDF: {e}")
+                return []
+        
+        result = self.parser_pool.extract_links(pdf_source, month_year)
+        if result['status'] == 'ok':
+            for key, value in result['link_path_stats'].items():
+                self.link_path_stats[key] += value
+            print(f"    📋 Extracted {len(result['links'])} policy links from PDF")
+            return result['links']
+        
+        print(f"    ⏱️ Parser gave up on monthly PDF for {month_year}: {result['status']}")
+        failure = {key: value for key, value in result.items() if key != 'id'}
+        failure['month_year'] = month_year
+        self.parse_failures.append(failure)
+        return None
+    
+    def parse_monthly_pdf_links(self, pdf_source, month_year):
+        """Extract policy links and comments from monthly PDF using pdfplumber"""
+        policy_links = []
+        
+        # Open PDF from bytes or a streamed file
+        with self.open_pdf(pdf_source) as pdf:
+            page_count = len(pdf.pages)
+            
+            if self.page_workers > 1 and page_count >= self.parallel_min_pages:
+                # Long month: parse page ranges in a process pool, merged back in page order
+                page_links = parse_monthly_pdf_pages(pdf_source, month_year, page_count, self.page_workers,
+                                                     self.link_path_stats)
+                if page_links is not None:
+                    for links in page_links:
+                        policy_links.extend(links)
+                    print(f"    📋 Extracted {len(policy_links)} policy links from PDF")
+                    return policy_links
+            
+            for page_num, page in enumerate(pdf.pages):
+                # Text, tables and words are computed once per page and shared by every extractor
+                analysis = PageAnalysis(page, page_num + 1)
+                policy_links.extend(self.extract_policy_links_from_page(analysis, month_year))
+                release_page(page)
+        
+        print(f"    📋 Extracted {len(policy_links)} policy links from PDF")
+        return policy_links
+    
+    def extract_policy_links_from_page(self, analysis, month_year):
+        """Extract policy links and comments from one page of a monthly PDF"""
+        policy_links = []
+        print(f"    📖 Processing page {analysis.page_number}")
+        
+        # Extract hyperlinks from the page
+        hyperlinks = self.extract_hyperlinks_from_page(analysis)
+        for link in hyperlinks:
+            print(f"    🔗 Found hyperlink: {link.get('url', 'N/A')}")
+            title = link.get('title') or 'Unknown Policy'
             
-            print(f"    📋 Extracted {len(policy_links)} policy links from PDF")
-            return policy_links
+            # Extract comments from table data for this policy
+            comments = self.extract_comments_from_tables_for_url(analysis, link.get('url', ''))
             
-        except Exception as e:
-            print(f"    ❌ Error parsing PDF: {e}")
-            return []
+            policy_links.append({
+                'title': title,
+                'url': link.get('url') or 'N/A',
+                'policy_number': self.extract_policy_number_from_url(link.get('url', '')) or 'N/A',
+                'comments': comments,
+                'source': link.get('source', 'annotation')
+            })
+        
+        if self.link_mode == 'fast':
+            if any(link.get('source') == 'annotation' for link in hyperlinks):
+                # The link annotations already gave us this page's policies
+                self.link_path_stats['annotation_pages'] += 1
+                return policy_links
+            self.link_path_stats['fallback_pages'] += 1
+        else:
+            self.link_path_stats['full_pages'] += 1
+        
+        # Also extract text and tables as fallback
+        text = analysis.text
+        tables = analysis.tables
+        
+        if text:
+            # Look for policy patterns in text
+            policy_patterns = self.extract_policy_patterns_from_text(text, month_year)
+            policy_links.extend(policy_patterns)
+        
+        if tables:
+            # Look for policy patterns in tables
+            for table in tables:
+                table_policies = self.extract_policy_patterns_from_table(table, month_year)
+                policy_links.extend(table_policies)
+        
+        return policy_links
     
     def extract_hyperlinks_from_page(self, page):
-        """Extract hyperlinks from a PDF page"""
+        """Extract hyperlinks from a PDF page (a pdfplumber page or its PageAnalysis)"""
         hyperlinks = []
+        analysis = PageAnalysis.of(page)
+        fast = self.link_mode == 'fast'
         
         try:
-            # Debug: Check what attributes are available
-            print(f"    🔍 Page attributes: {dir(page)}")
-            
-            # Get annotations (which include hyperlinks)
-            if hasattr(page, 'annots') and page.annots:
-                print(f"    📝 Found {len(page.annots)} annotations")
-                for i, annot in enumerate(page.annots):
-                    print(f"    📝 Annotation {i}: {annot}")
+            # Get annotations (which include hyperlinks); the fast mode reads only URI actions
+            annots = analysis.uri_annots if fast else analysis.annots
+            if annots:
+                print(f"    📝 Found {len(annots)} annotations")
+                for annot in annots:
                     if annot.get('uri'):
-                        print(f"    🔗 Found URI: {annot['uri']}")
                         # Extract title from text near the hyperlink coordinates
-                        title = self.extract_title_near_coordinates(page, annot)
+                        title = self.extract_title_near_coordinates(analysis, annot)
                         hyperlinks.append({
                             'url': annot['uri'],
                             'title': title,
-                            'comments': ''
+                            'comments': '',
+                            'source': 'annotation'
                         })
-                    else:
-                        print(f"    ⚠️ No URI in annotation: {annot}")
+            
+            if fast:
+                # Only links read from the annotations end the page here; without
+                # them the caller still needs the text URLs and pattern fallbacks
+                cigna_links = self.filter_cigna_policy_links(hyperlinks)
+                if cigna_links:
+                    return cigna_links
             
             # Also try to extract links from the page's link annotations
-            if hasattr(page, 'links') and page.links:
-                print(f"    🔗 Found {len(page.links)} links")
-                for link in page.links:
+            if not fast and analysis.links:
+                print(f"    🔗 Found {len(analysis.links)} links")
+                for link in analysis.links:
                     if link.get('uri'):
                         hyperlinks.append({
                             'url': link['uri'],
                             'title': link.get('title', ''),
-                            'comments': ''
+                            'comments': '',
+                            'source': 'annotation'
                         })
             
             # Try alternative method - look for URLs in text
-            text = page.extract_text()
+            text = analysis.text
             if text:
-                import re
                 # Look for URLs in the text
                 url_pattern = r'https://static\.cigna\.com/[^\s]+\.pdf'
                 urls = re.findall(url_pattern, text)
@@ -236,38 +484,31 @@ class CignaPolicyScraper:
                     hyperlinks.append({
                         'url': url,
                         'title': 'Extracted from text',
-                        'comments': ''
+                        'comments': '',
+                        'source': 'text'
                     })
                 print(f"    📄 Found {len(urls)} URLs in text")
             
-            # Filter for Cigna policy URLs
-            cigna_links = []
-            print(f"    🔍 Checking {len(hyperlinks)} hyperlinks for Cigna policy URLs:")
-            for i, link in enumerate(hyperlinks):
-                url = link['url']
-                print(f"    🔍 Link {i}: {url}")
-                print(f"    🔍 Contains 'static.cigna.com': {'static.cigna.com' in url}")
-                print(f"    🔍 Contains 'mm_': {'mm_' in url}")
-                print(f"    🔍 Ends with '.pdf': {url.endswith('.pdf')}")
-                
-                # Check for any Cigna policy pattern (mm_, ip_, ph_, etc.)
-                is_cigna_policy = ('static.cigna.com' in url and 
-                                 url.endswith('.pdf') and 
-                                 ('mm_' in url or 'ip_' in url or 'ph_' in url or 'coveragepositioncriteria' in url))
-                
-                if is_cigna_policy:
-                    print(f"    ✅ This is a Cigna policy link!")
-                    cigna_links.append(link)
-                else:
-                    print(f"    ❌ Not a Cigna policy link")
-            
-            print(f"    ✅ Found {len(cigna_links)} Cigna policy links")
-            return cigna_links
+            return self.filter_cigna_policy_links(hyperlinks)
             
         except Exception as e:
             print(f"    ⚠️ Error extracting hyperlinks: {e}")
             return []
 
+    def filter_cigna_policy_links(self, hyperlinks):
+        """Keep only links to Cigna policy PDFs (mm_, ip_, ph_, etc.)"""
+        cigna_links = []
+        for link in hyperlinks:
+            url = link['url']
+            is_cigna_policy = ('static.cigna.com' in url and 
+                             url.endswith('.pdf') and 
+                             ('mm_' in url or 'ip_' in url or 'ph_' in url or 'coveragepositioncriteria' in url))
+            if is_cigna_policy:
+                cigna_links.append(link)
+        
+        print(f"    ✅ Found {len(cigna_links)} Cigna policy links out of {len(hyperlinks)} hyperlinks")
+        return cigna_links
+
     def extract_title_from_url(self, url):
         """Extract policy title from URL"""
         try:
@@ -308,9 +549,10 @@ class CignaPolicyScraper:
 
     def extract_title_near_coordinates(self, page, annot):
         """Extract policy title from text near the hyperlink coordinates"""
+        analysis = PageAnalysis.of(page)
         try:
             # Get the coordinates of the hyperlink
-            x0, y0, x1, y1 = annot.get('x0', 0), annot.get('y0', 0), annot.get('x1', 0), annot.get('y1', 0)
+            x0, x1 = annot.get('x0', 0), annot.get('x1', 0)
             
             # Extract title from URL first (most reliable)
             url = annot.get('uri', '')
@@ -321,7 +563,7 @@ class CignaPolicyScraper:
                     return title_from_url
             
             # Fallback: try to extract from tables
-            tables = page.extract_tables()
+            tables = analysis.tables
             if tables:
                 for table in tables:
                     for row in table:
@@ -344,22 +586,9 @@ class CignaPolicyScraper:
                                     print(f"    📝 Extracted title from table: '{cell_text}'")
                                     return cell_text
             
-            # Fallback: Extract text from words near the hyperlink coordinates
-            words = page.extract_words()
-            
-            # Find words near the hyperlink coordinates
-            nearby_words = []
-            for word in words:
-                word_x0, word_y0, word_x1, word_y1 = word.get('x0', 0), word.get('y0', 0), word.get('x1', 0), word.get('y1', 0)
-                
-                # Check if word is in the same row (similar y-coordinates) and nearby horizontally
-                if (abs(word_y0 - y0) < 15 and  # Same row (within 15 pixels vertically)
-                    word_x0 < x1 + 100 and      # Not too far to the right
-                    word_x1 > x0 - 100):        # Not too far to the left
-                    nearby_words.append(word)
-            
-            # Sort words by x-coordinate to get them in reading order
-            nearby_words.sort(key=lambda w: w.get('x0', 0))
+            # Fallback: Extract text from words in the same row as the hyperlink and nearby horizontally
+            # (within 15 points vertically, 100 points either side)
+            nearby_words = analysis.word_grid.near(annot.get('top', 0), x0, x1, max_dy=15, max_dx=100)
             
             # Extract the text from nearby words
             title_text = ' '.join([word.get('text', '') for word in nearby_words])
@@ -412,23 +641,26 @@ class CignaPolicyScraper:
         # Pattern to match policy titles with numbers like "Alveoloplasty - (0586)"
         policy_pattern = r'([A-Za-z\s\-]+)\s*-\s*\((\d{4})\)'
         
+        # Comments are looked up in the whole page text, so they're the same for every policy on it
+        page_comments = None
         matches = re.finditer(policy_pattern, text)
         for match in matches:
-            title = match.group(1).strip().replace('\n', ' ').replace('\r', ' ')
-            # Clean up extra whitespace
-            title = ' '.join(title.split())
+            # Collapse line breaks and extra whitespace
+            title = ' '.join(match.group(1).split())
             policy_number = match.group(2)
             
             # Construct the policy URL based on the actual Cigna pattern
-            # Clean the title for URL construction - remove newlines and extra whitespace
-            clean_title = title.lower().replace('\n', ' ').replace('\r', ' ').replace(' ', '_').replace('-', '_').replace('(', '').replace(')', '').replace(',', '').replace('.', '').replace('&', 'and').replace('__', '_').strip('_')
+            clean_title = policy_title_slug(title)
             policy_url = f"https://static.cigna.com/assets/chcp/pdf/coveragePolicies/medical/mm_{policy_number}_coveragepositioncriteria_{clean_title}.pdf"
+            if page_comments is None:
+                page_comments = self.extract_comments_for_policy(text, title, policy_number)
             
             policies.append({
                 'title': f"{title} - ({policy_number})",
                 'url': policy_url,
                 'policy_number': policy_number,
-                'comments': self.extract_comments_for_policy(text, title, policy_number)
+                'comments': page_comments,
+                'source': 'text'
             })
         
         return policies
@@ -453,21 +685,20 @@ class CignaPolicyScraper:
             matches = re.finditer(policy_pattern, row_text)
             
             for match in matches:
-                title = match.group(1).strip().replace('\n', ' ').replace('\r', ' ')
-                # Clean up extra whitespace
-                title = ' '.join(title.split())
+                # Collapse line breaks and extra whitespace
+                title = ' '.join(match.group(1).split())
                 policy_number = match.group(2)
                 
                 # Construct the policy URL based on the actual Cigna pattern
-                # Clean the title for URL construction - remove newlines and extra whitespace
-                clean_title = title.lower().replace('\n', ' ').replace('\r', ' ').replace(' ', '_').replace('-', '_').replace('(', '').replace(')', '').replace(',', '').replace('.', '').replace('&', 'and').replace('__', '_').strip('_')
+                clean_title = policy_title_slug(title)
                 policy_url = f"https://static.cigna.com/assets/chcp/pdf/coveragePolicies/medical/mm_{policy_number}_coveragepositioncriteria_{clean_title}.pdf"
                 
                 policies.append({
                     'title': f"{title} - ({policy_number})",
                     'url': policy_url,
                     'policy_number': policy_number,
-                    'comments': self.extract_comments_for_policy(row_text, title, policy_number)
+                    'comments': self.extract_comments_for_policy(row_text, title, policy_number),
+                    'source': 'table'
                 })
         
         return policies
@@ -481,17 +712,18 @@ class CignaPolicyScraper:
             r'(Effective [Dd]ate|Last [Uu]pdated)'
         ]
         
+        # Only the first three are kept, so stop scanning once they're found
         comments = []
         for pattern in comment_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+            for match in re.finditer(pattern, text, re.IGNORECASE):
                 # Get some context around the match
                 start = max(0, match.start() - 50)
                 end = min(len(text), match.end() + 50)
-                context = text[start:end]
-                comments.append(context.strip())
+                comments.append(text[start:end].strip())
+                if len(comments) == 3:
+                    return '; '.join(comments)
         
-        return '; '.join(comments[:3]) if comments else ''
+        return '; '.join(comments) if comments else ''
 
     def extract_comments_from_tables_for_url(self, page, url):
         """Extract comments from table data for a specific policy URL"""
@@ -501,8 +733,8 @@ class CignaPolicyScraper:
             if not policy_number:
                 return ''
             
-            # Extract tables from the page
-            tables = page.extract_tables()
+            # Extract tables from the page (memoized per page)
+            tables = PageAnalysis.of(page).tables
             if not tables:
                 return ''
             
@@ -527,165 +759,118 @@ class CignaPolicyScraper:
             print(f"    ⚠️ Error extracting comments: {e}")
             return ''
 
-    def extract_text_from_policy_pdf(self, pdf_content):
-        """Extract text from individual policy PDF"""
-        try:
-            text_content = []
-            
-            # Open PDF from bytes
-            with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
-                for page_num, page in enumerate(pdf.pages):
+    def iter_policy_text(self, pdf_source, text_backend=None):
+        """Yield the text of a policy PDF page by page: page text, then its table rows
+        
+        Plain text comes from the selected text backend; pdfplumber is only used
+        for table geometry, on the pages the backend reports as possible tables.
+        Each page's layout cache is released as soon as it has been read, so
+        memory stays flat however long the document is.
+        """
+        backend = get_text_backend(text_backend or self.policy_text_backend)
+        
+        table_gate = get_table_gate()
+        page_texts, table_pages = None, None
+        if backend.name != 'pdfplumber':
+            page_texts, table_pages = backend.extract(pdf_source, self.policy_max_pages)
+        
+        # Open PDF from bytes or a streamed file
+        with self.open_pdf(pdf_source) as pdf:
+            pages = pdf.pages[:self.policy_max_pages] if self.policy_max_pages else pdf.pages
+            for page_num, page in enumerate(pages):
+                try:
                     # Extract text from each page
-                    page_text = page.extract_text()
+                    page_text = page_texts[page_num] if page_texts and page_num < len(page_texts) else page.extract_text()
                     if page_text:
-                        text_content.append(page_text)
+                        yield page_text
                     
-                    # Also extract tables if they exist
-                    tables = page.extract_tables()
+                    # Also extract tables if they exist (the backend's hint only applies when gating is on)
+                    if table_gate.mode == 'on' and table_pages is not None and page_num not in table_pages:
+                        continue
+                    tables = table_gate.extract_tables(page)
                     if tables:
                         for table in tables:
                             # Convert table to text representation
                             for row in table:
                                 if row:
-                                    row_text = ' | '.join([str(cell) for cell in row if cell])
-                                    text_content.append(row_text)
-            
-            return '\n'.join(text_content)
+                                    yield ' | '.join([str(cell) for cell in row if cell])
+                finally:
+                    release_page(page)
+                    if page_texts and page_num < len(page_texts):
+                        page_texts[page_num] = None
+
+    def extract_text_from_policy_pdf(self, pdf_source, text_backend=None):
+        """Extract text from individual policy PDF"""
+        try:
+            return '\n'.join(self.iter_policy_text(pdf_source, text_backend))
             
         except Exception as e:
             print(f"    ❌ Error extracting text from PDF: {e}")
             return None
 
-    def extract_medical_codes(self, text):
-        """Extract medical codes using regex patterns"""
-        codes = []
-        
-        # CPT codes (5 digits) - more flexible pattern
-        cpt_patterns = [
-            r'\b(\d{5})\b',  # Standard 5-digit codes
-            r'CPT[:\s]*(\d{5})',  # CPT: 12345 format
-            r'Code[:\s]*(\d{5})',  # Code: 12345 format
-        ]
-        
-        for pattern in cpt_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                code = match.group(1)
-                # Get context around the code
-                start = max(0, match.start() - 100)
-                end = min(len(text), match.end() + 100)
-                context = text[start:end]
-                codes.append({
-                    'code': code,
-                    'code_type': 'CPT',
-                    'description': self.extract_code_description(context, code)
-                })
+    def extract_medical_codes(self, text, text_index=None):
+        """Extract medical codes using regex patterns
         
-        # HCPCS codes (1 letter + 4 digits) - more flexible pattern
-        hcpcs_patterns = [
-            r'\b([A-Z]\d{4})\b',  # Standard HCPCS format
-            r'HCPCS[:\s]*([A-Z]\d{4})',  # HCPCS: A1234 format
-            r'Code[:\s]*([A-Z]\d{4})',  # Code: A1234 format
-        ]
-        
-        for pattern in hcpcs_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                code = match.group(1)
-                start = max(0, match.start() - 100)
-                end = min(len(text), match.end() + 100)
-                context = text[start:end]
-                codes.append({
-                    'code': code,
-                    'code_type': 'HCPCS',
-                    'description': self.extract_code_description(context, code)
-                })
-        
-        # ICD-10 codes (letter + digits + optional decimal) - more flexible pattern
-        icd10_patterns = [
-            r'\b([A-TV-Z]\d{2}(?:\.\d{1,4})?)\b',  # Standard ICD-10 format
-            r'ICD-10[:\s]*([A-TV-Z]\d{2}(?:\.\d{1,4})?)',  # ICD-10: A12.34 format
-            r'Diagnosis[:\s]*([A-TV-Z]\d{2}(?:\.\d{1,4})?)',  # Diagnosis: A12.34 format
-        ]
-        
-        for pattern in icd10_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                code = match.group(1)
-                start = max(0, match.start() - 100)
-                end = min(len(text), match.end() + 100)
-                context = text[start:end]
-                codes.append({
-                    'code': code,
-                    'code_type': 'ICD-10',
-                    'description': self.extract_code_description(context, code)
-                })
+        One precompiled scan finds every CPT, HCPCS and ICD-10 candidate, already
+        de-duplicated, so descriptions are only computed once per unique code.
+        Candidates missing from the local code sets (zip codes, years, page
+        numbers) are dropped or flagged before their description is looked up.
+        """
+        code_sets = get_code_sets()
+        text_index = text_index or TextIndex(text)
+        codes = []
+        rejected = 0
+        for found in scan_medical_codes(text):
+            valid = code_sets.validate(found.code, found.code_type)
+            if valid is False and code_sets.mode == 'drop':
+                rejected += 1
+                continue
+            
+            # Get context around the code
+            start = max(0, found.start - 100)
+            end = min(len(text), found.end + 100)
+            code_data = {
+                'code': found.code,
+                'code_type': found.code_type,
+                'description': self.extract_code_description(text_index, found.code, start, end)
+            }
+            if code_sets.mode == 'flag':
+                code_data['validated'] = valid
+            codes.append(code_data)
         
-        # Remove duplicates based on code
-        seen_codes = set()
-        unique_codes = []
-        for code_data in codes:
-            code_key = f"{code_data['code_type']}_{code_data['code']}"
-            if code_key not in seen_codes:
-                seen_codes.add(code_key)
-                unique_codes.append(code_data)
-        
-        print(f"    🔍 Found {len(unique_codes)} unique medical codes")
-        return unique_codes
+        if rejected:
+            print(f"    🔍 Found {len(codes)} unique medical codes ({rejected} candidates not in code sets dropped)")
+        else:
+            print(f"    🔍 Found {len(codes)} unique medical codes")
+        return codes
 
-    def extract_code_description(self, context, code):
-        """Extract description for a medical code from context"""
-        # Look for description patterns around the code
-        lines = context.split('\n')
-        for i, line in enumerate(lines):
-            if code in line:
-                # Look at the same line and next few lines for description
-                description_parts = []
-                for j in range(i, min(i + 3, len(lines))):
-                    description_parts.append(lines[j].strip())
-                description = ' '.join(description_parts)
-                # Clean up the description
-                description = re.sub(r'\s+', ' ', description)
-                return description[:200]  # Limit length
-        return ""
+    def extract_code_description(self, text_index, code, start, end):
+        """Extract description for a medical code from the context window text[start:end]"""
+        # The first line of the window that mentions the code
+        position = text_index.text.find(code, start, end)
+        if position == -1:
+            return ""
+        
+        # Look at the same line and next few lines for description
+        description_parts = [line.strip() for line in text_index.next_lines(position, 3, start, end)]
+        description = ' '.join(description_parts)
+        # Clean up the description
+        description = re.sub(r'\s+', ' ', description)
+        return description[:200]  # Limit length
 
-    def extract_referenced_documents(self, text):
+    def extract_referenced_documents(self, text, text_index=None):
         """Extract referenced documents from policy text - focusing on medical policies, clinical guidelines, and reimbursement policies"""
+        text_index = text_index or TextIndex(text)
         documents = []
         seen_documents = set()  # Prevent duplicates
         
         print(f"    📋 Extracting referenced documents from {len(text)} characters of text...")
         
         # 1. Extract Cigna Policy References (CRITICAL - Medical Policies, Clinical Guidelines, Reimbursement Policies)
-        policy_patterns = [
-            # Medical Management policies
-            (r'mm_(\d{4})', 'Medical Management Policy'),
-            (r'MM_(\d{4})', 'Medical Management Policy'),
-            (r'Medical\s+Management\s+Policy\s+(\d{4})', 'Medical Management Policy'),
-            
-            # Pharmacy policies  
-            (r'ip_(\d{4})', 'Pharmacy Policy'),
-            (r'IP_(\d{4})', 'Pharmacy Policy'),
-            (r'ph_(\d{4})', 'Pharmacy Policy'),
-            (r'PH_(\d{4})', 'Pharmacy Policy'),
-            (r'Pharmacy\s+Policy\s+(\d{4})', 'Pharmacy Policy'),
-            
-            # Clinical guidelines
-            (r'Clinical\s+Guideline\s+(\d{4})', 'Clinical Guideline'),
-            (r'CG_(\d{4})', 'Clinical Guideline'),
-            
-            # Reimbursement policies
-            (r'Reimbursement\s+Policy\s+(\d{4})', 'Reimbursement Policy'),
-            (r'RP_(\d{4})', 'Reimbursement Policy'),
-            
-            # Coverage policies
-            (r'Coverage\s+Policy\s+(\d{4})', 'Coverage Policy'),
-            (r'CP_(\d{4})', 'Coverage Policy'),
-        ]
-        
-        for pattern, doc_type in policy_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        # Patterns are the 'referenced_policies' rule set in extraction_rules.json
+        for rule in get_extraction_rules().rule_set('referenced_policies'):
+            doc_type = rule['document_type']
+            for match in rule.finditer(text):
                 policy_number = match.group(1)
                 
                 # Create unique identifier
@@ -705,42 +890,33 @@ class CignaPolicyScraper:
                 print(f"    ✅ Found {doc_type}: {title or f'{doc_type} {policy_number}'}")
         
         # 2. Extract Clinical Guidelines and Standards (CRITICAL)
-        guideline_patterns = [
-            # NCCN Guidelines
-            (r'(NCCN|National Comprehensive Cancer Network)', 'NCCN Clinical Guideline'),
-            (r'NCCN\s+Guidelines?\s*[:\-]?\s*([^.\n]+)', 'NCCN Clinical Guideline'),
-            
-            # ASCO Guidelines
-            (r'(ASCO|American Society of Clinical Oncology)', 'ASCO Clinical Guideline'),
-            (r'ASCO\s+Guidelines?\s*[:\-]?\s*([^.\n]+)', 'ASCO Clinical Guideline'),
-            
-            # CMS Guidelines
-            (r'(CMS|Centers for Medicare and Medicaid Services)', 'CMS Reimbursement Policy'),
-            (r'CMS\s+Guidelines?\s*[:\-]?\s*([^.\n]+)', 'CMS Reimbursement Policy'),
-            
-            # FDA Guidelines
-            (r'(FDA|Food and Drug Administration)', 'FDA Regulatory Policy'),
-            (r'FDA\s+Guidelines?\s*[:\-]?\s*([^.\n]+)', 'FDA Regulatory Policy'),
-            
-            # Medical Society Guidelines
-            (r'(AHA|American Heart Association)', 'AHA Clinical Guideline'),
-            (r'(ADA|American Diabetes Association)', 'ADA Clinical Guideline'),
-            (r'(ACOG|American College of Obstetricians and Gynecologists)', 'ACOG Clinical Guideline'),
-            (r'(AAP|American Academy of Pediatrics)', 'AAP Clinical Guideline'),
-            (r'(ACP|American College of Physicians)', 'ACP Clinical Guideline'),
-            (r'(ASPS|American Society of Plastic Surgeons)', 'ASPS Clinical Guideline'),
-        ]
+        # One automaton pass finds every organization name; "<ORG> Guidelines: ..."
+        # statements are only tried where their acronym occurs
+        organization_hits = GUIDELINE_AUTOMATON.find_all(fold_ignorecase(text))
+        acronym_spans = guideline_acronym_spans(text, organization_hits)
+        acronym_starts = [span_start for span_start, _ in acronym_spans]
         
-        for pattern, doc_type in guideline_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for acronym, full_name, doc_type, statement_pattern in GUIDELINE_ORGANIZATIONS:
+            spans = [(hit.start, hit.end) for hit in leftmost_non_overlapping(organization_hits, (acronym.lower(), full_name.lower()))]
+            if statement_pattern:
+                position = 0
+                for hit in sorted(hit for hit in organization_hits if hit.keyword == acronym.lower()):
+                    if hit.start < position:
+                        continue
+                    match = statement_pattern.match(text, hit.start)
+                    if match:
+                        spans.append((match.start(), match.end()))
+                        position = match.end()
+            
+            for match_start, match_end in spans:
                 # Extract context around the match
-                start = max(0, match.start() - 150)
-                end = min(len(text), match.end() + 150)
-                context = text[start:end]
+                start = max(0, match_start - 150)
+                end = min(len(text), match_end + 150)
                 
                 # Extract title from context
-                title = self.extract_guideline_title_from_context(context, match.start() - start, match.end() - start)
+                first = bisect.bisect_left(acronym_starts, start)
+                last = bisect.bisect_left(acronym_starts, end)
+                title = self.extract_guideline_title_from_context(text_index, start, end, acronym_spans[first:last])
                 
                 if title and len(title) > 15:
                     doc_id = f"{doc_type}_{title[:50]}"
@@ -754,48 +930,27 @@ class CignaPolicyScraper:
                         print(f"    ✅ Found {doc_type}: {title}")
         
         # 3. Extract Medical Journal References (for evidence-based policies)
-        journal_patterns = [
-            # Author et al. (Year) format
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+et\s+al\.?\s*\((\d{4})\)\s*[:\-]?\s*([^.\n]+)',
-            # Author (Year) format  
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+\((\d{4})\)\s*[:\-]?\s*([^.\n]+)',
-            # Multiple authors
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+and\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+\((\d{4})\)\s*[:\-]?\s*([^.\n]+)',
-        ]
-        
-        for pattern in journal_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                groups = match.groups()
-                if len(groups) >= 3:
-                    author = groups[0]
-                    year = groups[1] if len(groups) > 1 else ''
-                    title = groups[2] if len(groups) > 2 else ''
-                    
-                    if len(author) > 5 and len(author) < 100 and len(title) > 10:
-                        doc_id = f"Journal_{author}_{year}_{title[:30]}"
-                        if doc_id not in seen_documents:
-                            seen_documents.add(doc_id)
-                            documents.append({
-                                'document_title': f"{author} et al. ({year}): {title}",
-                                'document_url': '',
-                                'document_type': 'Medical Journal Reference'
-                            })
-                            print(f"    ✅ Found Medical Journal: {author} et al. ({year}): {title[:50]}...")
+        # Parsed around "(Year)" in linear time; the backtracking journal regexes could take seconds
+        for citation in parse_citations(text):
+            author, year, title = citation.author, citation.year, citation.title
+            
+            if len(author) > 5 and len(author) < 100 and len(title) > 10:
+                doc_id = f"Journal_{author}_{year}_{title[:30]}"
+                if doc_id not in seen_documents:
+                    seen_documents.add(doc_id)
+                    documents.append({
+                        'document_title': f"{author} et al. ({year}): {title}",
+                        'document_url': '',
+                        'document_type': 'Medical Journal Reference'
+                    })
+                    print(f"    ✅ Found Medical Journal: {author} et al. ({year}): {title[:50]}...")
         
         # 4. Extract URL references (for policy documents)
-        url_patterns = [
-            r'https?://[^\s]+cigna[^\s]*policy[^\s]*',
-            r'https?://[^\s]+cigna[^\s]*coverage[^\s]*',
-            r'https?://[^\s]+cigna[^\s]*guideline[^\s]*',
-        ]
-        
-        for pattern in url_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for rule in get_extraction_rules().rule_set('policy_urls'):
+            for match in rule.finditer(text):
                 url = match.group(0)
                 # Extract title from context around URL
-                title = self.extract_url_title_from_context(text, match.start(), match.end())
+                title = self.extract_url_title_from_context(text_index, match.start(), match.end())
                 
                 if title and len(title) > 10:
                     doc_id = f"URL_{url}"
@@ -846,41 +1001,48 @@ class CignaPolicyScraper:
         except:
             return ""
 
-    def extract_guideline_title_from_context(self, context, start_pos, end_pos):
-        """Extract guideline title from context around a guideline reference"""
+    def extract_guideline_title_from_context(self, text_index, start, end, acronym_spans=None):
+        """Extract guideline title from the context window text[start:end] around a guideline reference
+        
+        acronym_spans are the guideline acronyms found in the text, if the caller already scanned for them.
+        """
         try:
+            if acronym_spans is None:
+                acronym_spans = [(span_start + start, span_end + start)
+                                 for span_start, span_end in guideline_acronym_spans(text_index.text[start:end])]
+            window = text_index.window_lines(start, end)
+            # Only lines that mention an organization can hold the title
+            org_lines = sorted({text_index.line_number(span_start) - window.start
+                                for span_start, span_end in acronym_spans if span_start >= start and span_end <= end})
+            
             # Look for title patterns around the guideline reference
-            lines = context.split('\n')
-            for i, line in enumerate(lines):
-                if any(org in line for org in ['NCCN', 'ASCO', 'CMS', 'FDA', 'AHA', 'ADA', 'ACOG', 'AAP', 'ACP', 'ASPS']):
-                    # Look at surrounding lines for title
-                    title_parts = []
-                    for j in range(max(0, i-2), min(len(lines), i+3)):
-                        if lines[j].strip():
-                            title_parts.append(lines[j].strip())
-                    
-                    title = ' '.join(title_parts)
-                    # Clean up the title
-                    title = re.sub(r'\s+', ' ', title)
-                    title = re.sub(r'^\W+|\W+$', '', title)
-                    
-                    if len(title) > 15 and len(title) < 300:
-                        return title
+            for i in org_lines:
+                # Look at surrounding lines for title
+                surrounding = text_index.lines(window[max(0, i-2)], window.start + min(len(window), i+3), start, end)
+                title_parts = [line.strip() for line in surrounding if line.strip()]
+                
+                title = ' '.join(title_parts)
+                # Clean up the title
+                title = re.sub(r'\s+', ' ', title)
+                title = re.sub(r'^\W+|\W+$', '', title)
+                
+                if len(title) > 15 and len(title) < 300:
+                    return title
             
             return ""
         except:
             return ""
 
-    def extract_url_title_from_context(self, text, start_pos, end_pos):
+    def extract_url_title_from_context(self, text_index, start_pos, end_pos):
         """Extract title from context around a URL reference"""
         try:
             # Get context around the URL
             context_start = max(0, start_pos - 100)
-            context_end = min(len(text), end_pos + 100)
-            context = text[context_start:context_end]
+            context_end = min(len(text_index), end_pos + 100)
             
             # Look for title patterns around the URL
-            lines = context.split('\n')
+            window = text_index.window_lines(context_start, context_end)
+            lines = text_index.lines(window.start, window.stop, context_start, context_end)
             for i, line in enumerate(lines):
                 if 'http' in line.lower():
                     # Look at surrounding lines for title
@@ -955,21 +1117,10 @@ class CignaPolicyScraper:
         """Extract specific policy references from a comment"""
         policy_refs = []
         
-        # Look for policy number patterns
-        policy_patterns = [
-            (r'mm_(\d{4})', 'Medical Management Policy'),
-            (r'MM_(\d{4})', 'Medical Management Policy'),
-            (r'ip_(\d{4})', 'Pharmacy Policy'),
-            (r'IP_(\d{4})', 'Pharmacy Policy'),
-            (r'ph_(\d{4})', 'Pharmacy Policy'),
-            (r'PH_(\d{4})', 'Pharmacy Policy'),
-            (r'Clinical\s+Guideline\s+(\d{4})', 'Clinical Guideline'),
-            (r'CG_(\d{4})', 'Clinical Guideline'),
-        ]
-        
-        for pattern, doc_type in policy_patterns:
-            matches = re.finditer(pattern, comment, re.IGNORECASE)
-            for match in matches:
+        # Look for policy number patterns ('comment_policy_references' in extraction_rules.json)
+        for rule in get_extraction_rules().rule_set('comment_policy_references'):
+            doc_type = rule['document_type']
+            for match in rule.finditer(comment):
                 policy_number = match.group(1)
                 policy_refs.append({
                     'title': f"{doc_type} {policy_number}",
@@ -981,47 +1132,39 @@ class CignaPolicyScraper:
 
     def determine_change_type(self, comment):
         """Determine the type of change from comment text"""
-        comment_lower = comment.lower()
-        
-        if any(word in comment_lower for word in ['new', 'added', 'addition', 'introduced', 'created']):
-            return "Addition"
-        elif any(word in comment_lower for word in ['removed', 'deleted', 'retired', 'discontinued', 'eliminated']):
-            return "Removal"
-        elif any(word in comment_lower for word in ['updated', 'modified', 'changed', 'revised', 'amended']):
-            return "Modification"
-        elif any(word in comment_lower for word in ['clarified', 'clarification', 'explained']):
-            return "Clarification"
-        else:
-            return "Modification"
+        found = CHANGE_TYPE_AUTOMATON.found(comment.lower())
+        return first_category(found, CHANGE_TYPE_KEYWORDS) or "Modification"
 
     def extract_section_affected(self, comment):
         """Extract which section of the policy is affected"""
-        comment_lower = comment.lower()
-        
-        # Common policy sections
-        sections = {
-            'coverage criteria': ['coverage', 'criteria', 'eligibility'],
-            'exclusions': ['exclusion', 'excluded', 'not covered'],
-            'limitations': ['limitation', 'limit', 'restricted'],
-            'prior authorization': ['prior auth', 'pre-authorization', 'pa required'],
-            'medical necessity': ['medical necessity', 'medically necessary'],
-            'coding': ['code', 'coding', 'cpt', 'icd', 'hcpcs'],
-            'reimbursement': ['reimbursement', 'payment', 'billing'],
-            'clinical guidelines': ['guideline', 'protocol', 'standard'],
-        }
-        
-        for section, keywords in sections.items():
-            if any(keyword in comment_lower for keyword in keywords):
-                return section.title()
+        # Common policy sections are listed in keyword_automaton.SECTION_KEYWORDS
+        section = first_category(SECTION_AUTOMATON.found(comment.lower()), SECTION_KEYWORDS)
+        if section:
+            return section.title()
         
         return "General"
 
-    def analyze_policy_with_spacy(self, policy_text, policy_url, month_year, comments=''):
-        """Analyze policy using spaCy instead of OpenAI"""
+    def analyze_policy_content(self, policy_text):
+        """Run the extractors that depend only on the policy text (the cacheable part of the analysis)"""
+        text_index = TextIndex(policy_text)
+        return {
+            'title': self.extract_policy_title(policy_text),
+            'category': self.extract_category(policy_text),
+            'medical_codes': self.extract_medical_codes(policy_text, text_index),
+            'referenced_documents': self.extract_referenced_documents(policy_text, text_index)
+        }
+    
+    def analyze_policy_with_spacy(self, policy_text, policy_url, month_year, comments='', content=None):
+        """Analyze policy using spaCy instead of OpenAI
+        
+        content is a previous analyze_policy_content() result for the same text, if cached.
+        """
         try:
             # Extract data using deterministic methods
-            medical_codes = self.extract_medical_codes(policy_text)
-            referenced_documents = self.extract_referenced_documents(policy_text)
+            if content is None:
+                content = self.analyze_policy_content(policy_text)
+            medical_codes = content['medical_codes']
+            referenced_documents = content['referenced_documents']
             document_changes = self.extract_document_changes(comments)
             
             # Debug output
@@ -1031,10 +1174,10 @@ class CignaPolicyScraper:
             
             # Extract basic policy information
             policy_data = {
-                'title': self.extract_policy_title(policy_text),
+                'title': content['title'],
                 'policy_url': policy_url,
                 'published_date': self.extract_published_date(policy_text, month_year),
-                'category': self.extract_category(policy_text),
+                'category': content['category'],
                 'body_content': policy_text,  # Full policy text content
                 'referenced_documents': referenced_documents,
                 'medical_codes': medical_codes,
@@ -1049,21 +1192,14 @@ class CignaPolicyScraper:
     
     def extract_policy_title(self, text):
         """Extract policy title from text"""
-        # Look for title patterns
-        title_patterns = [
-            r'Policy Title:\s*(.+)',
-            r'Coverage Policy:\s*(.+)',
-            r'Medical Coverage Policy:\s*(.+)',
-            r'^(.+?)\s*Coverage Criteria'
-        ]
-        
-        for pattern in title_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        # Look for title patterns ('policy_title' in extraction_rules.json)
+        for rule in get_extraction_rules().rule_set('policy_title'):
+            match = rule.search(text)
             if match:
                 return match.group(1).strip()
         
         # Fallback: use first line if it looks like a title
-        first_line = text.split('\n')[0].strip()
+        first_line = text.partition('\n')[0].strip()
         if len(first_line) < 100 and not first_line.isdigit():
             return first_line
         
@@ -1071,16 +1207,9 @@ class CignaPolicyScraper:
 
     def extract_published_date(self, text, month_year):
         """Extract published date from text"""
-        # Look for date patterns
-        date_patterns = [
-            r'Effective Date:\s*(\d{1,2}/\d{1,2}/\d{4})',
-            r'Published Date:\s*(\d{1,2}/\d{1,2}/\d{4})',
-            r'Date:\s*(\d{1,2}/\d{1,2}/\d{4})',
-            r'(\d{1,2}/\d{1,2}/\d{4})'
-            ]
-            
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
+        # Look for date patterns ('published_date' in extraction_rules.json)
+        for rule in get_extraction_rules().rule_set('published_date'):
+            match = rule.search(text)
             if match:
                 try:
                     date_str = match.group(1)
@@ -1109,64 +1238,72 @@ class CignaPolicyScraper:
         else:
             return 'Medical Policy'
 
-    def scrape_policy_url(self, url, month_year):
-        """Scrape individual policy URL and extract policy links from monthly PDF"""
+    def scrape_policy_url(self, url, month_year, run_id=None):
+        """Scrape individual policy URL and extract policy links from monthly PDF
+        
+        Returns (policies saved, policies failed), or None if the month could not be processed at all.
+        """
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            
             # For PDF URLs, we need to extract policy links from the monthly update PDF
             if url.endswith('.pdf'):
                 print(f"  📄 Processing PDF: {url}")
                 
-                # Download and parse the PDF to extract policy links
-                policy_links = self.extract_policy_links_from_pdf(response.content, month_year)
+                # Download (or revalidate the cached copy of) the PDF and parse it to extract policy links
+                with self.pdf_cache.open(url, self.http, timeout=30) as pdf_file:
+                    policy_links = self.extract_policy_links_from_pdf(pdf_file, month_year)
+                if policy_links is None:
+                    raise RuntimeError(f"parser gave up on the monthly PDF for {month_year}")
+                
+                # One link per policy, minus dead URLs and policies saved or claimed elsewhere
+                policy_links = self.select_policy_links_to_fetch(policy_links, run_id)
                 
                 if not policy_links:
                     print(f"    ⚠️ No policy links found in {month_year}")
-                    return False
+                    return 0, 0
                 
-                # Process each policy link found in the monthly PDF
-                policies_saved = 0
-                for policy_link in policy_links:
-                    print(f"    🔗 Found policy: {policy_link['title']}")
-                    
-                    # Fetch the individual policy document
-                    policy_data = self.fetch_individual_policy(policy_link['url'], policy_link['title'], month_year, policy_link.get('comments', ''))
-                    
-                    if policy_data and isinstance(policy_data, dict):
-                        if self.save_policy(policy_data):
-                            policies_saved += 1
-                    else:
-                        print(f"    ⚠️ Failed to get valid policy data for {policy_link['title']}")
+                # Download every policy found in the monthly PDF concurrently and
+                # analyze each one as soon as its download finishes
+                results = self.policy_downloader.download_and_process(
+                    policy_links,
+                    lambda policy_link, pdf_file, error: self.process_downloaded_policy(policy_link, pdf_file, error, month_year, run_id)
+                )
+                policies_saved = sum(1 for saved in results if saved)
                 
-                return policies_saved > 0
+                return policies_saved, len(results) - policies_saved
             else:
+                response = self.http.get(url, timeout=30)
+                response.raise_for_status()
+                
                 soup = BeautifulSoup(response.content, 'html.parser')
                 policy_text = soup.get_text()
                 
                 # Analyze with spaCy
                 policy_data = self.analyze_policy_with_spacy(policy_text, url, month_year)
                 
-                if policy_data:
-                    return self.save_policy(policy_data)
+                if policy_data and self.save_policy(policy_data):
+                    return 1, 0
+                return 0, 1
             
         except Exception as e:
             print(f"  ❌ Error scraping {url}: {e}")
-            return False
+            # None (rather than False) tells callers the month was not processed at all
+            return None
 
-    def scrape_policy_url_parallel(self, url, month_year):
+    def scrape_policy_url_parallel(self, url, month_year, run_id=None):
         """Scrape individual policy URL with parallel processing of individual policies"""
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            
             # For PDF URLs, we need to extract policy links from the monthly update PDF
             if url.endswith('.pdf'):
                 print(f"  📄 Processing PDF: {url}")
                 
-                # Download and parse the PDF to extract policy links
-                policy_links = self.extract_policy_links_from_pdf(response.content, month_year)
+                # Download (or revalidate the cached copy of) the PDF and parse it to extract policy links
+                with self.pdf_cache.open(url, self.http, timeout=30) as pdf_file:
+                    policy_links = self.extract_policy_links_from_pdf(pdf_file, month_year)
+                if policy_links is None:
+                    raise RuntimeError(f"parser gave up on the monthly PDF for {month_year}")
+                
+                # One link per policy, minus dead URLs and policies saved or claimed elsewhere
+                policy_links = self.select_policy_links_to_fetch(policy_links, run_id)
                 
                 if not policy_links:
                     print(f"    ⚠️ No policy links found in {month_year}")
@@ -1178,7 +1315,9 @@ class CignaPolicyScraper:
                     policy_link['url'], 
                     policy_link['title'], 
                     month_year, 
-                    policy_link.get('comments', '')
+                    policy_link.get('comments', ''),
+                    run_id,
+                    policy_link_key(policy_link)
                 ) for policy_link in policy_links)
                 
                 # Execute all policy processing tasks in parallel (don't wait for results)
@@ -1187,6 +1326,9 @@ class CignaPolicyScraper:
                 
                 return True
             else:
+                response = self.http.get(url, timeout=30)
+                response.raise_for_status()
+                
                 soup = BeautifulSoup(response.content, 'html.parser')
                 policy_text = soup.get_text()
                 
@@ -1200,39 +1342,127 @@ class CignaPolicyScraper:
             print(f"  ❌ Error scraping {url}: {e}")
             return False
 
+    def download_policy_pdf(self, policy_url):
+        """Download an individual policy PDF to an open file (cached copies are revalidated instead of re-downloaded)"""
+        print(f"    📄 Fetching individual policy: {policy_url}")
+        
+        # Range requests bypass the cache and the fixture archive, so only use them live on a cache miss
+        if self.lazy_policy_pdfs and self.http.fixtures.mode == 'live' and not self.pdf_cache.lookup(policy_url):
+            return open_lazy_pdf(policy_url, self.http, timeout=30)
+        
+        return self.pdf_cache.open(policy_url, self.http, timeout=30)
+
     def fetch_individual_policy(self, policy_url, title, month_year, comments=''):
         """Fetch individual policy document and analyze with spaCy"""
         try:
-            print(f"    📄 Fetching individual policy: {policy_url}")
-            
-            # Fetch the actual policy PDF
-            response = requests.get(policy_url, timeout=30)
-            response.raise_for_status()
-            
-            # Extract text from the policy PDF
-            policy_text = self.extract_text_from_policy_pdf(response.content)
-            
-            if not policy_text:
-                print(f"    ⚠️ Could not extract text from {policy_url}")
-                return None
-            
-            print(f"    📝 Extracted {len(policy_text)} characters from policy PDF")
-            
-            # Use spaCy to analyze the policy content
-            policy_data = self.analyze_policy_with_spacy(policy_text, policy_url, month_year, comments)
-            
-            if policy_data and isinstance(policy_data, dict):
-                # Override the generated URL with the actual scraped URL
-                policy_data['policy_url'] = policy_url
-                policy_data['title'] = title
-                return policy_data
-            else:
-                print(f"    ⚠️ spaCy analysis failed or returned invalid data for {policy_url}")
-                return None
+            with self.download_policy_pdf(policy_url) as pdf_file:
+                return self.analyze_policy_pdf(pdf_file, policy_url, title, month_year, comments)
                 
         except Exception as e:
             print(f"    ❌ Error fetching policy {policy_url}: {e}")
         return None
+
+    def extract_policy_text(self, pdf_file, policy_url):
+        """Extract a policy PDF's text, in the parser pool when one is configured
+        
+        Documents the parser gives up on (CPU, memory or wall-clock budget, crash)
+        are recorded in parse_failures and yield None instead of stalling the task.
+        """
+        if self.parser_pool is None:
+            return self.extract_text_from_policy_pdf(pdf_file)
+        
+        result = self.parser_pool.extract_text(pdf_file, self.policy_text_backend, self.policy_max_pages)
+        if result['status'] == 'ok':
+            return result['text']
+        
+        print(f"    ⏱️ Parser gave up on {policy_url}: {result['status']}")
+        failure = {key: value for key, value in result.items() if key != 'id'}
+        failure['url'] = policy_url
+        self.parse_failures.append(failure)
+        return None
+    
+    def analyze_policy_pdf(self, pdf_file, policy_url, title, month_year, comments=''):
+        """Extract text from a downloaded policy PDF and analyze it with spaCy
+        
+        PDFs whose bytes were parsed before (by any worker on this node) are
+        served from the parsed document cache without opening them.
+        """
+        sha256, cached = None, None
+        # Anything that changes the extracted text or its analysis ('on' table gating can skip table rows)
+        cache_version = (f"{EXTRACTOR_VERSION}:{get_text_backend(self.policy_text_backend).name}:{self.policy_max_pages}:"
+                         f"{get_table_gate().mode}:{get_code_sets().version}:{get_extraction_rules().version}")
+        if self.parsed_cache:
+            try:
+                sha256 = content_sha256(pdf_file)
+                cached = self.parsed_cache.get(sha256, cache_version) if sha256 else None
+            except Exception as e:
+                print(f"    ⚠️ Parsed document cache unavailable: {e}")
+        
+        if cached:
+            policy_text, content = cached['text'], cached['content']
+        else:
+            # Extract text from the policy PDF
+            policy_text = self.extract_policy_text(pdf_file, policy_url)
+            content = None
+        
+        if not policy_text:
+            print(f"    ⚠️ Could not extract text from {policy_url}")
+            return None
+        
+        if sha256 and not cached:
+            try:
+                content = self.analyze_policy_content(policy_text)
+                self.parsed_cache.put(sha256, cache_version, {'text': policy_text, 'content': content})
+            except Exception as e:
+                print(f"    ⚠️ Could not cache parsed policy: {e}")
+        
+        print(f"    📝 Extracted {len(policy_text)} characters from policy PDF")
+        
+        # Use spaCy to analyze the policy content
+        policy_data = self.analyze_policy_with_spacy(policy_text, policy_url, month_year, comments, content)
+        
+        if policy_data and isinstance(policy_data, dict):
+            # Override the generated URL with the actual scraped URL
+            policy_data['policy_url'] = policy_url
+            policy_data['title'] = title
+            return policy_data
+        else:
+            print(f"    ⚠️ spaCy analysis failed or returned invalid data for {policy_url}")
+            return None
+
+    def process_downloaded_policy(self, policy_link, pdf_file, error, month_year, run_id=None):
+        """Analyze and save one policy handed over by the download stage
+        
+        A policy that isn't saved gives up its claim, so another month of the run can still fetch it.
+        """
+        saved = self._process_downloaded_policy(policy_link, pdf_file, error, month_year)
+        if not saved:
+            get_policy_claims().release([policy_link_key(policy_link)], run_id)
+        return saved
+    
+    def _process_downloaded_policy(self, policy_link, pdf_file, error, month_year):
+        print(f"    🔗 Found policy: {policy_link['title']}")
+        
+        if error is not None:
+            print(f"    ❌ Error fetching policy {policy_link['url']}: {error}")
+            response = getattr(error, 'response', None)
+            if response is not None and response.status_code in (403, 404, 410):
+                self.url_validator.record(policy_link['url'], False)
+            return False
+        
+        try:
+            policy_data = self.analyze_policy_pdf(pdf_file, policy_link['url'], policy_link['title'], month_year, policy_link.get('comments', ''))
+        except Exception as e:
+            print(f"    ❌ Error analyzing policy {policy_link['url']}: {e}")
+            return False
+        finally:
+            pdf_file.close()
+        
+        if policy_data and isinstance(policy_data, dict):
+            return self.save_policy(policy_data)
+        
+        print(f"    ⚠️ Failed to get valid policy data for {policy_link['title']}")
+        return False
     
     def save_policy(self, policy_data):
         """Save policy data to Supabase"""
@@ -1289,13 +1519,17 @@ class CignaPolicyScraper:
             print(f"  💾 Saving {len(medical_codes)} medical codes...")
             for code_data in medical_codes:
                 if code_data.get('code'):  # Only save if code exists
-                    self.supabase.table('medical_codes').insert({
+                    row = {
                         'policy_update_id': policy_id,
                         'code': code_data.get('code') or '',
                         'code_type': code_data.get('code_type') or '',
                         'description': code_data.get('description') or '',
                         'is_covered': None
-                    }).execute()
+                    }
+                    # Only set in 'flag' code validation mode
+                    if 'validated' in code_data:
+                        row['validated'] = code_data['validated']
+                    self.supabase.table('medical_codes').insert(row).execute()
                     print(f"    ✅ Saved medical code: {code_data.get('code')}")
             
             # Save referenced documents
@@ -1354,7 +1588,8 @@ class CignaPolicyScraper:
         for i, link in enumerate(monthly_links[:5]):
             print(f"\n📄 Processing {i+1}/5: {link['month_year']}")
             
-            if self.scrape_policy_url(link['url'], link['month_year']):
+            result = self.scrape_policy_url(link['url'], link['month_year'])
+            if result and result[0]:
                 policies_scraped += 1
             
             execution_time = time.time() - start_time
@@ -1362,6 +1597,43 @@ class CignaPolicyScraper:
         print(f"\n🎉 spaCy scraping completed!")
         print(f"📊 Total policies scraped: {policies_scraped}")
         print(f"⏱️  Execution time: {execution_time:.2f} seconds")
+        
+        http_stats = self.http.stats()
+        print(f"🌐 HTTP requests: {http_stats['requests']}, connections opened: {http_stats['connections_opened']}, reused: {http_stats['connections_reused']}")
+        
+        cache_stats = self.pdf_cache.stats()
+        print(f"📦 PDF cache hits: {cache_stats['hits']}, misses: {cache_stats['misses']}, bytes saved: {cache_stats['bytes_saved']}")
+        
+        if self.parsed_cache:
+            parsed_stats = self.parsed_cache.stats()
+            print(f"🧠 Parsed document cache hits: {parsed_stats['hits']}, misses: {parsed_stats['misses']}, entries: {parsed_stats['entries']}")
+        
+        link_stats = self.link_path_stats
+        print(f"🔗 Link discovery ({self.link_mode}): annotation-only pages: {link_stats['annotation_pages']}, "
+              f"fallback pages: {link_stats['fallback_pages']}, full pages: {link_stats['full_pages']}")
+        
+        if self.parser_pool:
+            pool_stats = self.parser_pool.stats()
+            print(f"⏱️ Parser pool: {pool_stats['ok']} of {pool_stats['documents']} documents parsed, "
+                  f"timeouts: {pool_stats['parse_timeout']}, memory: {pool_stats['parse_memory']}, crashes: {pool_stats['parse_crashed']}")
+        
+        dedupe_stats = self.dedupe_stats
+        print(f"♻️ Downloads saved by dedupe: {dedupe_stats['downloads_saved']} "
+              f"(duplicates: {dedupe_stats['duplicate_links']}, already saved: {dedupe_stats['already_saved']}, "
+              f"other months: {dedupe_stats['claimed_by_other_month']})")
+        
+        code_stats = get_code_sets().stats()
+        print(f"🩺 Code validation ({code_stats['mode']}): rejected {code_stats['rejected']} of {code_stats['checked']} candidates, "
+              f"unchecked: {code_stats['unchecked']}")
+        
+        rule_stats = [rule for rule in get_extraction_rules().stats() if rule['calls']]
+        if rule_stats:
+            print("📐 Most expensive extraction rules:")
+            for rule in rule_stats[:5]:
+                print(f"   {rule['rule']}: {rule['ms']:.1f} ms over {rule['calls']} calls, {rule['hits']} hits")
+        
+        gate_stats = get_table_gate().stats()
+        print(f"📊 Table gate ({gate_stats['mode']}): skipped {gate_stats['pages_skipped']} of {gate_stats['pages_checked']} pages, misses: {gate_stats['gate_misses']}")
 
 # Celery configuration
 celery_app = Celery(
@@ -1385,14 +1657,34 @@ celery_app.conf.task_time_limit = 1800  # 30 minute timeout per task
 celery_app.conf.worker_concurrency = 4  # Allow 4 concurrent workers
 
 @celery_app.task(bind=True)
-def scrape_all_policies_task(self):
-    """Celery task to scrape all policies with lag prevention"""
+def scrape_all_policies_task(self, incremental=False):
+    """Celery task to scrape all policies with lag prevention
+    
+    With incremental=True only months whose listing entry or PDF changed since
+    they were last processed are dispatched.
+    """
     scraper = CignaPolicyScraper()
     monthly_links = scraper.fetch_monthly_links()
     
     if not monthly_links:
         return {'status': 'completed', 'total_pdfs': 0, 'results': []}
     
+    skipped_months = 0
+    if incremental:
+        changed_links = scraper.find_changed_monthly_links(monthly_links, get_scrape_state())
+        skipped_months = len(monthly_links) - len(changed_links)
+        monthly_links = changed_links
+        
+        if not monthly_links:
+            return {
+                'status': 'completed',
+                'total_pdfs': 0,
+                'results': [],
+                'incremental': True,
+                'skipped_months': skipped_months,
+                'message': 'No new or changed monthly PDFs since the last run'
+            }
+    
     total_links = len(monthly_links)
     
     # Update initial progress
@@ -1409,7 +1701,8 @@ def scrape_all_policies_task(self):
     # Process PDFs in parallel for faster real-time updates
     # Create individual tasks for each PDF and dispatch them in parallel
     from celery import group
-    job = group(process_single_pdf.s(link['url'], link['month_year']) for link in monthly_links)
+    # The task id doubles as the run id that lets months share policy claims
+    job = group(process_single_pdf.s(link['url'], link['month_year'], link.get('fingerprint'), self.request.id) for link in monthly_links)
     
     # Execute all tasks in parallel (don't wait for results)
     result = job.apply_async()
@@ -1420,7 +1713,9 @@ def scrape_all_policies_task(self):
         'total_pdfs': total_links,
         'group_id': result.id,
         'message': f'Dispatched {total_links} PDF processing tasks in parallel',
-        'monthly_links': [link['month_year'] for link in monthly_links]
+        'monthly_links': [link['month_year'] for link in monthly_links],
+        'incremental': incremental,
+        'skipped_months': skipped_months
     }
 
 @celery_app.task(bind=True)
@@ -1461,7 +1756,7 @@ def scrape_selected_policies_task(self, selected_urls):
     
     # Create individual tasks for each selected PDF and dispatch them
     from celery import group
-    job = group(process_single_pdf.s(link['url'], link['month_year']) for link in selected_links)
+    job = group(process_single_pdf.s(link['url'], link['month_year'], None, self.request.id) for link in selected_links)
     
     # Execute all tasks in parallel (don't wait for results)
     result = job.apply_async()
@@ -1476,8 +1771,13 @@ def scrape_selected_policies_task(self, selected_urls):
     }
 
 @celery_app.task(bind=True)
-def process_single_pdf(self, pdf_url, month_year):
-    """Process a single PDF with lag prevention"""
+def process_single_pdf(self, pdf_url, month_year, fingerprint=None, run_id=None):
+    """Process a single PDF with lag prevention
+    
+    When dispatched by an incremental run, the month's fingerprint is recorded
+    once it has been processed so the next run can skip it. Months dispatched
+    with the same run_id download each policy only once between them.
+    """
     try:
         scraper = CignaPolicyScraper()
         
@@ -1491,19 +1791,52 @@ def process_single_pdf(self, pdf_url, month_year):
         )
         
         # Use regular processing (not parallel) to prevent resource overload
-        if scraper.scrape_policy_url(pdf_url, month_year):
+        result = scraper.scrape_policy_url(pdf_url, month_year, run_id)
+        policies_saved, policies_failed = result if result is not None else (0, None)
+        
+        # A month with failed policies stays unrecorded so the next run retries it
+        if policies_failed:
+            print(f"⚠️ {policies_failed} policies failed in {month_year}; not recording it as processed")
+        elif fingerprint and result is not None:
+            try:
+                get_scrape_state().mark_month_processed(pdf_url, fingerprint)
+            except Exception as e:
+                print(f"⚠️ Could not record fingerprint for {month_year}: {e}")
+        
+        if policies_saved:
             return {
                 'status': 'success',
                 'pdf_url': pdf_url,
                 'month_year': month_year,
-                'policies_found': 'processed'
+                'policies_found': 'processed',
+                'policies_saved': policies_saved,
+                'policies_failed': policies_failed,
+                'http_stats': scraper.http.stats(),
+                'pdf_cache_stats': scraper.pdf_cache.stats(),
+                'table_gate_stats': get_table_gate().stats(),
+                'code_validation_stats': get_code_sets().stats(),
+                'extraction_rule_stats': get_extraction_rules().stats(),
+                'link_path_stats': scraper.link_path_stats,
+                'dedupe_stats': scraper.dedupe_stats,
+                'parsed_cache_stats': scraper.parsed_cache.stats() if scraper.parsed_cache else None,
+                'parse_failures': scraper.parse_failures
             }
         else:
             return {
                 'status': 'no_policies',
                 'pdf_url': pdf_url,
                 'month_year': month_year,
-                'policies_found': 0
+                'policies_found': 0,
+                'policies_failed': policies_failed,
+                'http_stats': scraper.http.stats(),
+                'pdf_cache_stats': scraper.pdf_cache.stats(),
+                'table_gate_stats': get_table_gate().stats(),
+                'code_validation_stats': get_code_sets().stats(),
+                'extraction_rule_stats': get_extraction_rules().stats(),
+                'link_path_stats': scraper.link_path_stats,
+                'dedupe_stats': scraper.dedupe_stats,
+                'parsed_cache_stats': scraper.parsed_cache.stats() if scraper.parsed_cache else None,
+                'parse_failures': scraper.parse_failures
             }
             
     except Exception as e:
@@ -1515,8 +1848,17 @@ def process_single_pdf(self, pdf_url, month_year):
         }
 
 @celery_app.task(bind=True)
-def process_individual_policy(self, policy_url, title, month_year, comments=''):
-    """Process a single individual policy in parallel"""
+def process_individual_policy(self, policy_url, title, month_year, comments='', run_id=None, claim_key=None):
+    """Process a single individual policy in parallel
+    
+    If the policy isn't saved, its claim (claim_key in run run_id) is released.
+    """
+    result = _process_individual_policy(self, policy_url, title, month_year, comments)
+    if claim_key and result['status'] != 'success':
+        get_policy_claims().release([claim_key], run_id)
+    return result
+
+def _process_individual_policy(self, policy_url, title, month_year, comments):
     try:
         scraper = CignaPolicyScraper()
         
@@ -3,6 +3,7 @@
 Script to start the Celery scrape task
 """
 import os
+import sys
 from dotenv import load_dotenv
 from scraper import scrape_all_policies_task
 
@@ -10,8 +11,9 @@ from scraper import scrape_all_policies_task
 load_dotenv()
 
 if __name__ == '__main__':
-    print("🚀 Starting PDF scraping task...")
-    task = scrape_all_policies_task.delay()
+    incremental = '--incremental' in sys.argv
+    print(f"🚀 Starting {'incremental ' if incremental else ''}PDF scraping task...")
+    task = scrape_all_policies_task.delay(incremental=incremental)
     print(f"✅ Task started with ID: {task.id}")
     print("📊 Check progress at: http://localhost:5555")
     print(f"🔍 Or check status with: python check_task_status.py {task.id}")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Table Detection Gating for pdfplumber Pages
+Skips extract_tables() on pages whose vector graphics can't form a table
+"""
+
+import os
+import threading
+from typing import Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+GATE_MODES = ('off', 'on', 'strict')
+
+def ruling_counts(page) -> Dict[str, int]:
+    """Count the horizontal and vertical edges of the page's lines, rects and curves
+
+    Edges are counted before pdfplumber merges them, so short pieces of a
+    dashed ruling all count. Diagonal curve segments (orientation None) are
+    never used by the table finder and are skipped.
+    """
+    counts = {'h': 0, 'v': 0}
+    for edge in page.edges:
+        orientation = edge.get('orientation')
+        if orientation in counts:
+            counts[orientation] += 1
+    return counts
+
+
+def might_contain_tables(page) -> bool:
+    """Cheap necessary condition for pdfplumber's default table finder
+
+    With the default "lines" strategy every cell is bounded by two horizontal
+    and two vertical ruling edges. Those come from merging the page's raw h/v
+    edges, and merging, snapping and the minimum length filter (applied after
+    merging) only ever reduce their number, so a page with fewer raw edges
+    than that can't yield a table.
+    """
+    if not (page.objects.get('line') or page.objects.get('rect') or page.objects.get('curve')):
+        return False
+    return has_table_rulings(ruling_counts(page))
+
+
+def has_table_rulings(counts: Dict[str, int]) -> bool:
+    """Whether h/v edge counts are enough for at least one table cell"""
+    return counts['h'] >= 2 and counts['v'] >= 2
+
+
+class TableGate:
+    """Decides per page whether extract_tables() is worth running
+
+    Modes (SCRAPER_TABLE_GATING):
+        on      skip table extraction on pages without enough ruling edges
+        strict  always extract, and log pages where the gate would have lost tables
+        off     always extract, no checks
+    """
+
+    def __init__(self, mode: Optional[str] = None):
+        self.mode = (mode or os.getenv('SCRAPER_TABLE_GATING', 'on')).lower()
+        if self.mode not in GATE_MODES:
+            raise ValueError(f"Unknown SCRAPER_TABLE_GATING: {self.mode}")
+
+        self._lock = threading.Lock()
+        self.pages_checked = 0
+        self.pages_skipped = 0
+        self.gate_misses = 0
+
+    def extract_tables(self, page) -> List[List[List[Optional[str]]]]:
+        if self.mode == 'off':
+            return page.extract_tables() or []
+
+        candidate = might_contain_tables(page)
+        with self._lock:
+            self.pages_checked += 1
+            if not candidate:
+                self.pages_skipped += 1
+
+        if self.mode == 'strict':
+            tables = page.extract_tables() or []
+            if tables and not candidate:
+                with self._lock:
+                    self.gate_misses += 1
+                logger.warning(f"⚠️ Table gate would have skipped {len(tables)} table(s) "
+                               f"on page {getattr(page, 'page_number', '?')}")
+            return tables
+
+        if not candidate:
+            return []
+        return page.extract_tables() or []
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'mode': self.mode,
+                'pages_checked': self.pages_checked,
+                'pages_skipped': self.pages_skipped,
+                'gate_misses': self.gate_misses,
+            }
+
+
+_gate: Optional[TableGate] = None
+_gate_pid: Optional[int] = None
+
+
+def get_table_gate() -> TableGate:
+    """Return the table gate for the current process"""
+    global _gate, _gate_pid
+    pid = os.getpid()
+    if _gate is None or _gate_pid != pid:
+        _gate = TableGate()
+        _gate_pid = pid
+    return _gate
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Pluggable Text Extraction Backends for Policy PDFs
+Fast plain-text extractors, with pdfplumber kept for the pages where table geometry is needed
+"""
+
+import io
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Set, Tuple
+import logging
+
+from table_gate import has_table_rulings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
+except ImportError:  # optional dependency
+    pdfium = None
+    pdfium_c = None
+
+
+def _as_input(pdf_source):
+    """Rewind file objects and wrap bytes so every backend can read the same source"""
+    if isinstance(pdf_source, (bytes, bytearray)):
+        return io.BytesIO(pdf_source)
+    if hasattr(pdf_source, 'seek'):
+        pdf_source.seek(0)
+    return pdf_source
+
+
+class TextBackend(ABC):
+    """Plain-text extractor interface
+
+    extract() returns one text string per page plus the set of page indexes
+    that may contain tables, or None when the backend can't tell (in which
+    case every page is handed to pdfplumber for table extraction).
+    """
+
+    name = 'base'
+
+    def is_available(self) -> bool:
+        return True
+
+    @abstractmethod
+    def extract(self, pdf_source, max_pages: int = 0) -> Tuple[List[str], Optional[Set[int]]]:
+        """Per-page text and the pages that may contain tables"""
+
+
+class PdfplumberBackend(TextBackend):
+    """pdfplumber's own layout-aware extract_text (the reference output)"""
+
+    name = 'pdfplumber'
+
+    def extract(self, pdf_source, max_pages: int = 0) -> Tuple[List[str], Optional[Set[int]]]:
+        import pdfplumber
+
+        texts = []
+        with pdfplumber.open(_as_input(pdf_source)) as pdf:
+            pages = pdf.pages[:max_pages] if max_pages else pdf.pages
+            for page in pages:
+                texts.append(page.extract_text() or '')
+        return texts, None
+
+
+class PdfminerBackend(TextBackend):
+    """Raw pdfminer text conversion, skipping pdfplumber's character clustering
+
+    The same layout pass yields the page's lines, rects and curves, counted
+    into h/v edges the way pdfplumber derives them, so only pages that pass
+    the table gate are interpreted again by pdfplumber.
+    """
+
+    name = 'pdfminer'
+
+    def extract(self, pdf_source, max_pages: int = 0) -> Tuple[List[str], Optional[Set[int]]]:
+        from pdfminer.converter import PDFPageAggregator
+        from pdfminer.layout import LAParams, LTContainer, LTCurve, LTLine, LTRect, LTText, LTTextBox
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+
+        def render(item, chunks: List[str], counts: Dict[str, int]):
+            # Text as pdfminer's TextConverter writes it, plus the edges of the graphics
+            if isinstance(item, LTContainer):
+                for child in item:
+                    render(child, chunks, counts)
+            elif isinstance(item, LTText):
+                chunks.append(item.get_text())
+            elif isinstance(item, LTRect):
+                counts['h'] += 2
+                counts['v'] += 2
+            elif isinstance(item, LTLine):
+                counts['h' if item.y0 == item.y1 else 'v'] += 1
+            elif isinstance(item, LTCurve):
+                for (x0, y0), (x1, y1) in zip(item.pts, item.pts[1:]):
+                    if x0 == x1:
+                        counts['v'] += 1
+                    elif y0 == y1:
+                        counts['h'] += 1
+            if isinstance(item, LTTextBox):
+                chunks.append('\n')
+
+        texts = []
+        table_pages = set()
+        resource_manager = PDFResourceManager(caching=True)
+        device = PDFPageAggregator(resource_manager, laparams=LAParams())
+        interpreter = PDFPageInterpreter(resource_manager, device)
+        for index, page in enumerate(PDFPage.get_pages(_as_input(pdf_source), maxpages=max_pages)):
+            interpreter.process_page(page)
+            chunks, counts = [], {'h': 0, 'v': 0}
+            render(device.get_result(), chunks, counts)
+            texts.append(''.join(chunks).strip())
+            if has_table_rulings(counts):
+                table_pages.add(index)
+        return texts, table_pages
+
+
+class PdfiumBackend(TextBackend):
+    """PDFium (pypdfium2) text extraction; also flags pages that draw vector paths
+
+    Tables in our PDFs are drawn with ruling lines and rectangles, so a page
+    without any path objects can't hold a table pdfplumber would detect.
+    """
+
+    name = 'pdfium'
+
+    def is_available(self) -> bool:
+        return pdfium is not None
+
+    def extract(self, pdf_source, max_pages: int = 0) -> Tuple[List[str], Optional[Set[int]]]:
+        if pdfium is None:
+            raise RuntimeError("pypdfium2 is not installed")
+
+        texts = []
+        table_pages = set()
+        document = pdfium.PdfDocument(_as_input(pdf_source))
+        try:
+            page_count = min(len(document), max_pages) if max_pages else len(document)
+            for index in range(page_count):
+                page = document[index]
+                text_page = page.get_textpage()
+                texts.append(text_page.get_text_range().replace('\r\n', '\n').replace('\r', '\n').strip())
+                text_page.close()
+
+                if next(iter(page.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_PATH])), None) is not None:
+                    table_pages.add(index)
+                page.close()
+        finally:
+            document.close()
+        return texts, table_pages
+
+
+BACKENDS: Dict[str, TextBackend] = {
+    backend.name: backend for backend in (PdfplumberBackend(), PdfminerBackend(), PdfiumBackend())
+}
+
+
+def available_backends() -> List[str]:
+    return [name for name, backend in BACKENDS.items() if backend.is_available()]
+
+
+def get_text_backend(name: Optional[str] = None) -> TextBackend:
+    """Look up a backend by name, falling back to pdfplumber if it isn't installed"""
+    name = (name or os.getenv('SCRAPER_TEXT_BACKEND', 'pdfplumber')).lower()
+    backend = BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"Unknown text backend: {name} (choose from {', '.join(BACKENDS)})")
+    if not backend.is_available():
+        logger.warning(f"⚠️ Text backend '{name}' is not installed, using pdfplumber")
+        return BACKENDS['pdfplumber']
+    return backend
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Policy Text Line Index
+Line start offsets for one document, so context extractors find lines around a match by bisect instead of re-splitting a window per match
+"""
+
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Optional
+
+
+class TextIndex:
+    """Line offsets of a document's text, computed once and shared by every extractor
+
+    Windows are half-open character ranges [start, end). Lines returned for a
+    window are clipped to it, exactly like the lines of text[start:end].split('\\n').
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.line_starts = [0]
+        self.line_starts.extend(accumulate(len(line) + 1 for line in text.split('\n')[:-1]))
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def line_number(self, offset: int) -> int:
+        """Number of the line containing offset (a newline belongs to the line it ends)"""
+        return bisect_right(self.line_starts, offset) - 1
+
+    def lines(self, first: int, stop: int, start: int = 0, end: Optional[int] = None) -> List[str]:
+        """Lines first..stop-1 without their newlines, clipped to the window [start, end)
+
+        One slice and one split, however many lines are asked for.
+        """
+        if end is None:
+            end = len(self.text)
+        stop_offset = self.line_starts[stop] - 1 if stop < len(self.line_starts) else len(self.text)
+        return self.text[max(start, self.line_starts[first]):min(end, stop_offset)].split('\n')
+
+    def window_lines(self, start: int, end: int) -> range:
+        """Numbers of the lines text[start:end].split('\\n') would return"""
+        return range(self.line_number(start), self.line_number(end) + 1)
+
+    def next_lines(self, offset: int, count: int, start: int = 0, end: Optional[int] = None) -> List[str]:
+        """The line containing offset and the ones after it, up to count lines, clipped to the window"""
+        first = self.line_number(offset)
+        return self.lines(first, first + count, start, end)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Batch Policy URL Validator
+Checks candidate policy URLs concurrently and caches live/dead results with TTLs
+"""
+
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional
+import logging
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+
+class PolicyURLValidator:
+    """Concurrent URL checks backed by a shared Redis cache
+
+    check_fn returns True (live), False (dead) or None (inconclusive, e.g. a
+    timeout). Only conclusive results are cached: live URLs for
+    SCRAPER_URL_VALID_TTL_HOURS, dead ones for SCRAPER_URL_INVALID_TTL_HOURS.
+    """
+
+    def __init__(self, check_fn: Callable[[str], Optional[bool]], redis_client=None,
+                 positive_ttl: Optional[int] = None, negative_ttl: Optional[int] = None,
+                 concurrency: Optional[int] = None):
+        self.check_fn = check_fn
+        self.redis_client = redis_client or redis.Redis.from_url(
+            os.getenv('SCRAPER_URL_CACHE_REDIS_URL', 'redis://localhost:6379/1'),
+            decode_responses=True
+        )
+        self.positive_ttl = positive_ttl or int(float(os.getenv('SCRAPER_URL_VALID_TTL_HOURS', '168')) * 3600)
+        self.negative_ttl = negative_ttl or int(float(os.getenv('SCRAPER_URL_INVALID_TTL_HOURS', '24')) * 3600)
+        self.concurrency = concurrency or int(os.getenv('SCRAPER_VALIDATION_CONCURRENCY', '16'))
+        self.key_prefix = 'urlcheck:'
+
+        self._lock = threading.Lock()
+        self._local_cache = {}
+        self._counters = {
+            'cache_hits': 0,
+            'checked': 0,
+            'valid': 0,
+            'invalid': 0,
+            'inconclusive': 0,
+        }
+
+    def _key(self, url: str) -> str:
+        return f"{self.key_prefix}{hashlib.sha1(url.encode('utf-8')).hexdigest()}"
+
+    def _get_cached(self, urls) -> Dict[str, Optional[bool]]:
+        try:
+            values = self.redis_client.mget([self._key(url) for url in urls])
+        except redis.RedisError as e:
+            logger.warning(f"URL cache unavailable, using local cache: {e}")
+            now = time.time()
+            with self._lock:
+                values = [
+                    self._local_cache[url][0] if url in self._local_cache and self._local_cache[url][1] > now else None
+                    for url in urls
+                ]
+        return {url: None if value is None else value == '1' for url, value in zip(urls, values)}
+
+    def _set_cached(self, results: Dict[str, bool]):
+        if not results:
+            return
+        try:
+            pipe = self.redis_client.pipeline()
+            for url, is_valid in results.items():
+                pipe.setex(self._key(url), self.positive_ttl if is_valid else self.negative_ttl, '1' if is_valid else '0')
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Could not store URL checks in Redis: {e}")
+            now = time.time()
+            with self._lock:
+                for url, is_valid in results.items():
+                    ttl = self.positive_ttl if is_valid else self.negative_ttl
+                    self._local_cache[url] = ('1' if is_valid else '0', now + ttl)
+
+    def record(self, url: str, is_valid: bool):
+        """Cache a result learned elsewhere, e.g. a 404 from the download stage"""
+        self._set_cached({url: is_valid})
+
+    def validate(self, urls: Iterable[str]) -> Dict[str, Optional[bool]]:
+        """Return {url: True/False/None} for every URL, checking uncached ones concurrently"""
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return {}
+
+        results = self._get_cached(unique_urls)
+        to_check = [url for url, value in results.items() if value is None]
+
+        with self._lock:
+            self._counters['cache_hits'] += len(unique_urls) - len(to_check)
+
+        if to_check:
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(to_check))) as executor:
+                checked = dict(zip(to_check, executor.map(self.check_fn, to_check)))
+
+            results.update(checked)
+            self._set_cached({url: value for url, value in checked.items() if value is not None})
+
+            with self._lock:
+                self._counters['checked'] += len(checked)
+                self._counters['valid'] += sum(1 for value in checked.values() if value is True)
+                self._counters['invalid'] += sum(1 for value in checked.values() if value is False)
+                self._counters['inconclusive'] += sum(1 for value in checked.values() if value is None)
+
+        return results
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return dict(self._counters)